@@ -0,0 +1,61 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Diablo MoE Gating Benchmark
+# Tokens/sec for DiabloGating.gate_batch across expert counts and top-k,
+# against the per-token gate() loop for reference.
+#
+# Run: python -m benchmarks.diablo_gating_bench
+
+import time
+
+import numpy as np
+
+from orchestrator.diablo_moe_gating import DiabloGating
+
+EXPERT_COUNTS = [4, 64, 256]
+TOP_KS = [1, 2, 8]
+BATCH_TOKENS = 8192
+FEATURE_DIM = 64
+REPEATS = 5
+
+def run_benchmark(expert_counts=EXPERT_COUNTS, top_ks=TOP_KS, tokens=BATCH_TOKENS, repeats=REPEATS):
+    features = np.random.default_rng(0).standard_normal((tokens, FEATURE_DIM))
+    results = []
+    for num_experts in expert_counts:
+        for top_k in top_ks:
+            if top_k > num_experts:
+                continue
+            diablo = DiabloGating(num_experts=num_experts, top_k=top_k, feature_dim=FEATURE_DIM, seed=0)
+            diablo.gate_batch(features)  # Warm-up
+            start = time.perf_counter()
+            for _ in range(repeats):
+                diablo.gate_batch(features)
+            batch_rate = tokens * repeats / (time.perf_counter() - start)
+
+            loop_tokens = 1000
+            start = time.perf_counter()
+            for _ in range(loop_tokens):
+                diablo.gate("token")
+            loop_rate = loop_tokens / (time.perf_counter() - start)
+            results.append({"experts": num_experts, "top_k": top_k,
+                            "batch_tokens_s": batch_rate, "loop_tokens_s": loop_rate})
+    return results
+
+if __name__ == "__main__":
+    print(f"Batch of {BATCH_TOKENS} tokens, feature_dim {FEATURE_DIM}")
+    print(f"{'experts':>8} {'top_k':>6} {'gate_batch tok/s':>17} {'gate() tok/s':>13}")
+    for row in run_benchmark():
+        print(f"{row['experts']:>8} {row['top_k']:>6} {row['batch_tokens_s']:>17.0f} {row['loop_tokens_s']:>13.0f}")
@@ -0,0 +1,73 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# DRA Budget Contention Microbenchmark
+# 32+ threads hammer one DRABudget with try_spend and reserve/commit/rollback,
+# then the final balance is checked against the exact amount spent.
+#
+# Run: python -m benchmarks.dra_budget_contention_bench
+
+import threading
+import time
+
+from orchestrator.dra_budget import DRABudget
+
+SPENDER_COUNTS = [1, 8, 32, 64]
+OPS_PER_SPENDER = 20000
+
+def _spender(budget: DRABudget, ops: int, barrier: threading.Barrier, spent: list, index: int):
+    barrier.wait()
+    total = 0
+    for i in range(ops):
+        if i % 2:
+            if budget.try_spend(1) is not None:
+                total += 1
+        else:
+            reservation = budget.reserve(10, "Void Repair")
+            if reservation is None:
+                continue
+            if i % 4:
+                reservation.rollback()
+            else:
+                reservation.commit()
+                total += 10
+    spent[index] = total
+
+def run_benchmark(spender_counts=SPENDER_COUNTS, ops_per_spender=OPS_PER_SPENDER):
+    results = []
+    for spenders in spender_counts:
+        initial = 10 ** 9
+        budget = DRABudget(initial, refill_rate=0)
+        barrier = threading.Barrier(spenders + 1)
+        spent = [0] * spenders
+        threads = [threading.Thread(target=_spender, args=(budget, ops_per_spender, barrier, spent, i))
+                   for i in range(spenders)]
+        for thread in threads:
+            thread.start()
+        start = time.perf_counter()
+        barrier.wait()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        # Conservation: no spend may be lost or double-counted under contention.
+        assert budget.t_value == initial - sum(spent), "DRA budget lost updates under contention"
+        results.append({"spenders": spenders, "ops_s": spenders * ops_per_spender / elapsed})
+    return results
+
+if __name__ == "__main__":
+    print(f"{OPS_PER_SPENDER} ops per spender (try_spend + reserve/commit/rollback)")
+    print(f"{'spenders':>9} {'ops/s':>12}")
+    for row in run_benchmark():
+        print(f"{row['spenders']:>9} {row['ops_s']:>12.0f}")
@@ -0,0 +1,83 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Logging Overhead Benchmark
+# Per-request cost of the hot-path framework calls one analyze_query makes (Sentinel
+# batch, Governor stress, DRA spends, Phase VI/VII claim handling, Nexus write) at each
+# log level. "caller us/req" is time on the request path; "total us/req" also waits for
+# the background writer to drain. Output goes to a temp file so the terminal stays quiet.
+#
+# Run: python -m benchmarks.logging_overhead_bench
+
+import os
+import tempfile
+import time
+
+from orchestrator.dra_budget import DRABudget
+from orchestrator.governor_protocol import GovernorProtocol
+from orchestrator.sentinel_protocol import SentinelProtocol
+from common.structured_log import configure_logging, flush_logs, get_level
+from orchestrator.void_repairer import VoidRepairer
+from prometheus.nexus_stub import PrometheusNexus
+
+REQUESTS = 2000
+REPEATS = 3  # Best of
+MODES = [("OFF", "text"), ("WARNING", "text"), ("INFO", "text"), ("DEBUG", "text"), ("DEBUG", "json")]
+
+def _components():
+    return (SentinelProtocol(), GovernorProtocol(), DRABudget(10 ** 9, refill_rate=0),
+            VoidRepairer(search_backend=lambda query: "SUCCESS: corroborated"), PrometheusNexus())
+
+def _request(i, sentinel, governor, budget, repairer, nexus):
+    sentinel.validate_many([{"id": 1, "data": "Simulated raw search result."},
+                            {"id": 2, "data": "More simulated data."}])
+    governor.apply_stress(0.0, "Phase II Search")
+    budget.spend(1, "Phase II Search")
+    claims = repairer._identify_voids([{"claim": "Stock X will rise."}, {"claim": "Data Y is inconsistent."}], [])
+    for claim in claims:
+        repairer._apply_repair_result(claim, "SUCCESS: corroborated")
+    governor.apply_stress(0.0, "Phase VII Void Repair")
+    budget.spend(10, "Phase VII Void Repair")
+    nexus.integrate_artifact(f"analysis:{i % 100}", {"confidence": 0.999})
+
+def run_benchmark(requests=REQUESTS, modes=MODES, repeats=REPEATS):
+    results = []
+    previous_level = get_level()
+    path = os.path.join(tempfile.mkdtemp(), "rsp.log")
+    configure_logging(level="OFF", path=path)
+    components = _components()
+    for i in range(requests):
+        _request(i, *components)  # Warm-up
+    for level, fmt in modes:
+        configure_logging(level=level, fmt=fmt)
+        best_caller = best_total = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for i in range(requests):
+                _request(i, *components)
+            caller = time.perf_counter() - start
+            flush_logs(timeout=60)
+            total = time.perf_counter() - start
+            best_caller, best_total = min(best_caller, caller), min(best_total, total)
+        results.append({"level": level, "format": fmt,
+                        "caller_us": best_caller / requests * 1e6, "total_us": best_total / requests * 1e6})
+    configure_logging(level=previous_level, fmt="text", path="")
+    return results
+
+if __name__ == "__main__":
+    print(f"{REQUESTS} simulated requests, log file output")
+    print(f"{'level':>8} {'format':>7} {'caller us/req':>14} {'total us/req':>13}")
+    for row in run_benchmark():
+        print(f"{row['level']:>8} {row['format']:>7} {row['caller_us']:>14.1f} {row['total_us']:>13.1f}")
@@ -0,0 +1,61 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Prometheus Nexus Store Write Benchmark
+# Sustained artifact writes/sec to an on-disk NexusStore across commit batch sizes
+# (batch_size=1 is the commit-per-artifact baseline), plus cached read throughput.
+#
+# Run: python -m benchmarks.nexus_store_bench
+
+import os
+import tempfile
+import time
+
+from prometheus.nexus_store import NexusStore
+
+BATCH_SIZES = [1, 16, 256, 1024]
+WRITES = 20000
+DISTINCT_ARTIFACTS = 2000
+
+def _report(i: int) -> dict:
+    return {"confidence": 0.999, "verified_data_count": i % 17, "unresolved_appendix": [],
+            "narrative": "A deeply empathetic and persuasive summary based only on verified data."}
+
+def run_benchmark(batch_sizes=BATCH_SIZES, writes=WRITES):
+    results = []
+    for batch_size in batch_sizes:
+        # The per-artifact baseline is slow; fewer writes keep the run short.
+        count = writes if batch_size > 1 else min(writes, 2000)
+        path = os.path.join(tempfile.mkdtemp(), "nexus.db")
+        store = NexusStore(path, batch_size=batch_size, flush_interval=1.0)
+        start = time.perf_counter()
+        for i in range(count):
+            store.put(f"analysis:{i % DISTINCT_ARTIFACTS}", _report(i))
+        store.flush()
+        write_rate = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for i in range(count):
+            store.get(f"analysis:{i % 500}")
+        read_rate = count / (time.perf_counter() - start)
+        store.close()
+        results.append({"batch_size": batch_size, "writes_s": write_rate, "reads_s": read_rate})
+    return results
+
+if __name__ == "__main__":
+    print(f"{WRITES} artifact writes over {DISTINCT_ARTIFACTS} ids (on-disk WAL)")
+    print(f"{'batch':>6} {'writes/s':>10} {'reads/s':>10}")
+    for row in run_benchmark():
+        print(f"{row['batch_size']:>6} {row['writes_s']:>10.0f} {row['reads_s']:>10.0f}")
@@ -0,0 +1,66 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Orchestrator Concurrency Benchmark
+# Drives analyze_query with N overlapping requests on one event loop and reports
+# requests/sec, checking that every response carries only its own log.
+#
+# Run: python -m benchmarks.orchestrator_concurrency_bench
+
+import asyncio
+import contextlib
+import io
+import time
+
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+from orchestrator.search_cache import SearchCache
+
+CONCURRENCY_LEVELS = [1, 8, 64]
+REQUESTS_PER_LEVEL = 256
+
+async def _drive(concurrency: int, total: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            # Distinct text per level, so no request is served by the result cache.
+            text = f"query {concurrency}-{i}"
+            response = await orchestrator.analyze_query(orchestrator.QueryPayload(query_text=text))
+            assert not response["cached"] and not response["coalesced"]
+            # Each log must mention only this request's query.
+            assert f"'{text}'" in response["orchestration_log"][1]["P II"]
+            return response
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - start
+
+def run_benchmark(concurrency_levels=CONCURRENCY_LEVELS, total=REQUESTS_PER_LEVEL):
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for concurrency in concurrency_levels:
+            orchestrator.state.budget = DRABudget(10 ** 9)  # Keep the DRA budget out of the measurement
+            # Every request raises the same void; keep the micro-search cache out too, so each pays for its repair.
+            orchestrator.state.search_cache = SearchCache(ttl=0, negative_ttl=0)
+            elapsed = asyncio.run(_drive(concurrency, total))
+            results.append({"concurrency": concurrency, "requests_s": total / elapsed})
+    return results
+
+if __name__ == "__main__":
+    print(f"{REQUESTS_PER_LEVEL} requests per level")
+    print(f"{'concurrency':>12} {'requests/s':>11}")
+    for row in run_benchmark():
+        print(f"{row['concurrency']:>12} {row['requests_s']:>11.1f}")
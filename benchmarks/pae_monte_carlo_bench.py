@@ -0,0 +1,42 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Predictive Analysis Engine Monte Carlo Benchmark
+# Times PredictiveAnalysisEngine.simulate for 10^6 trajectories x 100 horizons.
+#
+# Run: python -m benchmarks.pae_monte_carlo_bench
+
+import time
+
+from fugue.predictive_analysis_engine import PredictiveAnalysisEngine
+
+TRAJECTORIES = 1_000_000
+HORIZONS = range(1, 101)
+REPEATS = 5
+
+def run_benchmark(trajectories=TRAJECTORIES, horizons=HORIZONS, repeats=REPEATS):
+    pae = PredictiveAnalysisEngine()
+    timings = []
+    for seed in range(repeats):
+        start = time.perf_counter()
+        pae.simulate(horizons, trajectories, seed)
+        timings.append(time.perf_counter() - start)
+    return {"trajectories": trajectories, "horizons": len(horizons), "best_s": min(timings),
+            "mean_s": sum(timings) / len(timings)}
+
+if __name__ == "__main__":
+    row = run_benchmark()
+    print(f"{row['trajectories']} trajectories x {row['horizons']} horizons: "
+          f"best {row['best_s'] * 1000:.1f} ms, mean {row['mean_s'] * 1000:.1f} ms")
@@ -0,0 +1,239 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Performance Benchmark Suite
+# Network-free run of the headline numbers: /analyze_query driven through the FastAPI
+# app in-process (httpx ASGI transport) at several concurrency levels, Sentinel scan
+# throughput, VoidRepairer claims/sec and Governor / DRA operations/sec.
+# Results are written as JSON and compared with the committed baselines in
+# benchmarks/baseline.json: a metric more than --threshold (fraction) worse than its
+# baseline is a regression and the run exits with status 1. Baselines are machine
+# specific; refresh them with --update-baseline on the machine that runs the suite.
+# A baseline metric may set its own "threshold" (kept across updates) for noisy numbers.
+#
+# Run: python -m benchmarks.perf_suite [--quick] [--threshold 0.25] [--output bench_results.json]
+#                                      [--baseline benchmarks/baseline.json] [--update-baseline]
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import sys
+import time
+
+import httpx
+
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+from orchestrator.search_cache import SearchCache
+from orchestrator.sentinel_protocol import SentinelProtocol
+from common.structured_log import configure_logging, get_level
+from orchestrator.void_repairer import VoidRepairer
+
+CONCURRENCY_LEVELS = [1, 8, 64]
+REQUESTS_PER_LEVEL = 128
+QUICK_REQUESTS_PER_LEVEL = 32
+SENTINEL_ITEMS = 256          # Items per validate_many batch, 256 B each
+VOID_CLAIMS = 2000
+MICRO_OPS = 100000            # Governor / DRA operations per measurement
+REPEATS = 5                   # Micro benchmarks report the best of REPEATS
+DEFAULT_THRESHOLD = 0.25      # Allowed fractional slowdown before a metric counts as a regression
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_OUTPUT = "bench_results.json"
+
+HIGHER, LOWER = "higher", "lower"  # Which direction is better for a metric
+
+def _metric(value: float, unit: str, better: str = HIGHER):
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+def _percentile(sorted_values, fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def _best_rate(fn, count: int, repeats: int = REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+# --- /analyze_query through the ASGI app ---
+
+async def _drive_http(concurrency: int, total: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    transport = httpx.ASGITransport(app=orchestrator.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://perf-suite") as client:
+        async def one(i: int):
+            # Distinct query texts, so the result cache never short-circuits a run.
+            payload = {"query_text": f"perf c{concurrency} q{i}", "verbosity": 0}
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/analyze_query", json=payload)
+                latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+            assert response.json()["final_report"]["confidence"] == 0.999
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+    await orchestrator.pipeline.stop()  # Workers belong to this event loop
+    return elapsed, sorted(latencies)
+
+def bench_analyze_query(concurrency_levels=CONCURRENCY_LEVELS, total=REQUESTS_PER_LEVEL):
+    results = {}
+    for concurrency in concurrency_levels:
+        # Fresh Governor and an effectively unlimited budget: every level starts from the same state.
+        orchestrator.state.governor = orchestrator.GovernorProtocol()
+        orchestrator.state.budget = DRABudget(10 ** 9, refill_rate=0)
+        orchestrator.state.search_cache = SearchCache(ttl=0, negative_ttl=0)  # Each request pays for its micro-search
+        elapsed, latencies = asyncio.run(_drive_http(concurrency, total))
+        prefix = f"analyze_query.c{concurrency}"
+        results[f"{prefix}.requests_s"] = _metric(total / elapsed, "req/s")
+        results[f"{prefix}.p50_ms"] = _metric(_percentile(latencies, 0.50) * 1000, "ms", LOWER)
+        results[f"{prefix}.p99_ms"] = _metric(_percentile(latencies, 0.99) * 1000, "ms", LOWER)
+    return results
+
+# --- Framework hot paths ---
+
+def bench_sentinel(items=SENTINEL_ITEMS, seed=7):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + "      .,"
+    batch = [{"id": i, "data": "".join(rng.choices(alphabet, k=256))} for i in range(items)]
+    sentinel = SentinelProtocol()
+    payload_mb = items * 256 / (1024 * 1024)
+    batches_s = _best_rate(lambda: [sentinel.validate_many(batch) for _ in range(20)], 20)
+    return {
+        "sentinel.validate_many_items_s": _metric(batches_s * items, "items/s"),
+        "sentinel.scan_mb_s": _metric(batches_s * payload_mb, "MB/s"),
+    }
+
+def bench_void_repairer(claims=VOID_CLAIMS):
+    async def backend(query: str):
+        return "SUCCESS: corroborated"
+    repairer = VoidRepairer(search_backend=backend)
+
+    def run():
+        voids = [{"claim": f"Void claim {i}", "status": "VOID_FLAG_INCONSISTENCY"} for i in range(claims)]
+        repaired = asyncio.run(repairer.run_void_repair_async(voids, max_concurrency=32))
+        assert len(repaired) == claims
+    return {"void_repairer.claims_s": _metric(_best_rate(run, claims), "claims/s")}
+
+def bench_governor(ops=MICRO_OPS):
+    governor = orchestrator.GovernorProtocol()
+
+    def run():
+        for _ in range(ops // 2):
+            governor.apply_stress(0.0, "Phase II Search")
+            governor.time_until_stable()
+    return {"governor.ops_s": _metric(_best_rate(run, ops), "ops/s")}
+
+def bench_dra(ops=MICRO_OPS):
+    budget = DRABudget(10 ** 12)
+
+    def run():
+        for i in range(ops // 2):
+            budget.try_spend(1)
+            with budget.reserve(10, "Void Repair"):
+                pass
+    return {"dra.ops_s": _metric(_best_rate(run, ops), "ops/s")}
+
+def run_benchmark(quick: bool = False):
+    """Runs every benchmark and returns {"meta": {...}, "metrics": {name: {value, unit, better}}}."""
+    previous_level = get_level()
+    configure_logging(level="WARNING")
+    try:
+        metrics = {}
+        metrics.update(bench_analyze_query(total=QUICK_REQUESTS_PER_LEVEL if quick else REQUESTS_PER_LEVEL))
+        metrics.update(bench_sentinel())
+        metrics.update(bench_void_repairer())
+        metrics.update(bench_governor())
+        metrics.update(bench_dra())
+    finally:
+        configure_logging(level=previous_level)
+    meta = {"python": sys.version.split()[0], "platform": sys.platform, "quick": quick,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+    return {"meta": meta, "metrics": metrics}
+
+def compare(results, baseline, threshold: float = DEFAULT_THRESHOLD):
+    """
+    Compares results with baseline metric by metric. Returns rows of
+    {name, value, baseline, change, regressed}; change is the fractional improvement
+    (negative = worse). A baseline entry may carry its own "threshold".
+    """
+    rows = []
+    for name, base in sorted(baseline["metrics"].items()):
+        current = results["metrics"].get(name)
+        if current is None:
+            continue
+        if base["better"] == HIGHER:
+            change = current["value"] / base["value"] - 1.0
+        else:
+            change = 1.0 - current["value"] / base["value"]
+        rows.append({"name": name, "value": current["value"], "baseline": base["value"], "unit": base["unit"],
+                     "change": change, "regressed": change < -base.get("threshold", threshold)})
+    return rows
+
+def _keep_thresholds(results, baseline_path: str):
+    if not os.path.exists(baseline_path):
+        return
+    with open(baseline_path) as handle:
+        previous = json.load(handle)["metrics"]
+    for name, metric in results["metrics"].items():
+        if "threshold" in previous.get(name, {}):
+            metric["threshold"] = previous[name]["threshold"]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="In-process performance benchmark suite.")
+    parser.add_argument("--quick", action="store_true", help=f"{QUICK_REQUESTS_PER_LEVEL} requests per concurrency level")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed fractional slowdown per metric (default %(default)s)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(quick=args.quick)
+    with open(args.output, "w") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+    if args.update_baseline:
+        _keep_thresholds(results, args.baseline)
+        with open(args.baseline, "w") as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    if baseline["meta"].get("quick") != results["meta"]["quick"]:
+        print("Note: baseline and this run used different request counts; high-concurrency latencies differ.")
+    rows = compare(results, baseline, args.threshold)
+    print(f"{'metric':<34} {'value':>12} {'baseline':>12} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['name']:<34} {row['value']:>12.2f} {row['baseline']:>12.2f} {row['change']:>+7.1%}{flag}")
+    regressions = [row["name"] for row in rows if row["regressed"]]
+    print(f"\nResults written to {args.output}. "
+          f"{len(regressions)} regression(s) beyond {args.threshold:.0%}" + (f": {', '.join(regressions)}" if regressions else "."))
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Void Repair Latency Benchmark
+# Runs Phase VII against a local stub search server that adds artificial latency,
+# comparing the sequential run_void_repair with run_void_repair_async at several
+# concurrency limits.
+#
+# Run: python -m benchmarks.void_repair_bench
+
+import asyncio
+import contextlib
+import io
+import socket
+import threading
+import time
+
+from orchestrator.void_repairer import VoidRepairer
+
+STUB_LATENCY = 0.05      # Seconds the stub server waits before answering
+VOID_COUNT = 40
+CONCURRENCY_LEVELS = [1, 8, 32]
+
+class StubSearchServer:
+    """Line-based TCP stub: reads one query per connection, sleeps, answers SUCCESS."""
+    def __init__(self, latency: float = STUB_LATENCY):
+        self.latency = latency
+        self.port = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    async def _handle(self, reader, writer):
+        query = (await reader.readline()).decode().strip()
+        await asyncio.sleep(self.latency)
+        answer = "SUCCESS: Stub evidence." if query.startswith("Verify or refute") else "NO_RESULT"
+        writer.write((answer + "\n").encode())
+        await writer.drain()
+        writer.close()
+
+    def _serve(self):
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=256))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+def blocking_backend(port: int):
+    def search(prompt: str):
+        with socket.create_connection(("127.0.0.1", port)) as conn:
+            conn.sendall((prompt + "\n").encode())
+            return conn.makefile().readline().strip() or None
+    return search
+
+def async_backend(port: int):
+    async def search(prompt: str):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write((prompt + "\n").encode())
+        await writer.drain()
+        answer = (await reader.readline()).decode().strip()
+        writer.close()
+        return answer or None
+    return search
+
+def _voids(count: int):
+    return [{"claim": f"Void claim {i}", "status": "VOID_FLAG_INCONSISTENCY"} for i in range(count)]
+
+def run_benchmark(void_count=VOID_COUNT, concurrency_levels=CONCURRENCY_LEVELS, latency=STUB_LATENCY):
+    server = StubSearchServer(latency).start()
+    results = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            repairer = VoidRepairer(search_backend=blocking_backend(server.port))
+            start = time.perf_counter()
+            repaired = repairer.run_void_repair(_voids(void_count))
+            results.append({"mode": "sequential", "seconds": time.perf_counter() - start, "repaired": len(repaired)})
+
+            repairer = VoidRepairer(search_backend=async_backend(server.port))
+            for limit in concurrency_levels:
+                start = time.perf_counter()
+                repaired = asyncio.run(repairer.run_void_repair_async(_voids(void_count), max_concurrency=limit))
+                results.append({"mode": f"async x{limit}", "seconds": time.perf_counter() - start,
+                                "repaired": len(repaired)})
+    finally:
+        server.stop()
+    return results
+
+if __name__ == "__main__":
+    print(f"{VOID_COUNT} voids, stub latency {STUB_LATENCY * 1000:.0f} ms")
+    print(f"{'mode':>12} {'seconds':>9} {'claims/s':>9} {'repaired':>9}")
+    for row in run_benchmark():
+        print(f"{row['mode']:>12} {row['seconds']:>9.2f} {VOID_COUNT / row['seconds']:>9.1f} {row['repaired']:>9}")
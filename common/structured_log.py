@@ -0,0 +1,236 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Structured Logging Layer
+# One logging path for every framework module (orchestrator/, prometheus/, ...) in
+# place of print(). Lives in common/ so no package depends on another just to log. Each call names
+# an event, a message template and typed fields. A call below the active level returns
+# after a single integer comparison; enabled records are queued as raw tuples and a
+# background writer formats them and emits whole batches to stdout or a file, so the
+# request path never formats strings or makes a write syscall. The queue is bounded:
+# if the writer falls behind, new records are dropped (and counted) rather than
+# growing memory or blocking the caller.
+#
+# Configuration (environment, read at import; configure_logging() overrides):
+#   RSP_LOG_LEVEL   DEBUG | INFO | WARNING | ERROR | OFF     (default INFO)
+#   RSP_LOG_FORMAT  text | json                              (default text)
+#   RSP_LOG_FILE    path to append to                        (default stdout)
+#   RSP_LOG_QUEUE_SIZE  records held for the writer before dropping (default 10000)
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR", OFF: "OFF"}
+_LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+LOG_LEVEL_ENV = "RSP_LOG_LEVEL"
+LOG_FORMAT_ENV = "RSP_LOG_FORMAT"
+LOG_FILE_ENV = "RSP_LOG_FILE"
+LOG_QUEUE_SIZE_ENV = "RSP_LOG_QUEUE_SIZE"
+DEFAULT_LEVEL = INFO
+DEFAULT_QUEUE_SIZE = 10_000
+MAX_BATCH = 512  # Records formatted and written per syscall
+
+class _Config:
+    """Process-wide logging settings. level is read on every call, so it stays a plain attribute."""
+    level = DEFAULT_LEVEL
+    fmt = "text"
+    path: Optional[str] = None
+
+def parse_level(value) -> int:
+    if isinstance(value, int):
+        return value
+    try:
+        return _LEVELS_BY_NAME[str(value).strip().upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level {value!r}; expected one of {sorted(_LEVELS_BY_NAME)}")
+
+class _Writer:
+    """Background thread draining the bounded record queue in batches."""
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._queue: "queue.Queue" = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self.emitted = 0
+        self.batches = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    def submit(self, record):
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # (Re)started lazily, including in a forked child where the parent's thread is absent.
+            if self._pid is not None:
+                self._queue = queue.Queue(self.maxsize)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="rsp-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Records are tuples; threading.Event markers come from flush().
+            records = [item for item in batch if isinstance(item, tuple)]
+            if records:
+                self._write(records)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(_format(record))
+            except Exception as error:  # A bad template must not kill the writer
+                lines.append(f"{LEVEL_NAMES.get(record[1], record[1])} {record[2]}: "
+                             f"<unformattable {record[3]!r}: {error}>")
+        dropped = self.dropped - self._reported_dropped
+        if dropped:
+            self._reported_dropped += dropped
+            lines.append(_format((time.time(), WARNING, "structured_log", "records_dropped",
+                                  "Log queue full: dropped {dropped} records", {"dropped": dropped})))
+        text = "\n".join(lines) + "\n"
+        try:
+            if _Config.path:
+                with open(_Config.path, "a", encoding="utf-8") as handle:
+                    handle.write(text)
+            else:
+                stream = sys.stdout
+                stream.write(text)
+                stream.flush()
+        except Exception:
+            pass  # Logging never raises into the application
+        self.emitted += len(records)
+        self.batches += 1
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Blocks until everything logged so far has been written."""
+        if self._pid != os.getpid():
+            return
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)  # Waits for room: flush markers are never dropped
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+_writer = _Writer(int(os.environ.get(LOG_QUEUE_SIZE_ENV, DEFAULT_QUEUE_SIZE)))
+
+def _format(record) -> str:
+    timestamp, level, name, event, template, fields = record
+    message = template.format(**fields) if fields else template
+    if _Config.fmt == "json":
+        payload: Dict[str, Any] = {"ts": round(timestamp, 6), "level": LEVEL_NAMES.get(level, level),
+                                   "logger": name, "event": event, "msg": message}
+        payload.update(fields)
+        return json.dumps(payload, default=str)
+    return message if level < WARNING else f"{LEVEL_NAMES.get(level, level)} {name}: {message}"
+
+class StructuredLogger:
+    """
+    Named logger. Usage: log.info("stress_applied", "SSI now {ssi:.2f}", ssi=value).
+    Below the active level a call costs one comparison; templates are formatted by the writer.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def is_enabled(self, level: int) -> bool:
+        return level >= _Config.level
+
+    def log(self, level: int, event: str, template: str, **fields: Any) -> None:
+        if level >= _Config.level:
+            _writer.submit((time.time(), level, self.name, event, template, fields))
+
+    def debug(self, event: str, template: str, **fields: Any) -> None:
+        if DEBUG >= _Config.level:
+            _writer.submit((time.time(), DEBUG, self.name, event, template, fields))
+
+    def info(self, event: str, template: str, **fields: Any) -> None:
+        if INFO >= _Config.level:
+            _writer.submit((time.time(), INFO, self.name, event, template, fields))
+
+    def warning(self, event: str, template: str, **fields: Any) -> None:
+        if WARNING >= _Config.level:
+            _writer.submit((time.time(), WARNING, self.name, event, template, fields))
+
+    def error(self, event: str, template: str, **fields: Any) -> None:
+        if ERROR >= _Config.level:
+            _writer.submit((time.time(), ERROR, self.name, event, template, fields))
+
+_loggers: Dict[str, StructuredLogger] = {}
+
+def get_logger(name: str) -> StructuredLogger:
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers.setdefault(name, StructuredLogger(name))
+    return logger
+
+def configure_logging(level=None, fmt: Optional[str] = None, path: Optional[str] = None) -> None:
+    """Overrides the environment settings. Records already queued are written first."""
+    _writer.flush()
+    if level is not None:
+        _Config.level = parse_level(level)
+    if fmt is not None:
+        if fmt not in ("text", "json"):
+            raise ValueError("fmt must be 'text' or 'json'")
+        _Config.fmt = fmt
+    if path is not None:
+        _Config.path = path or None
+
+def get_level() -> int:
+    return _Config.level
+
+def flush_logs(timeout: float = 5.0) -> None:
+    _writer.flush(timeout)
+
+def writer_stats() -> Dict[str, int]:
+    return {"emitted": _writer.emitted, "batches": _writer.batches, "dropped": _writer.dropped}
+
+configure_logging(level=os.environ.get(LOG_LEVEL_ENV, LEVEL_NAMES[DEFAULT_LEVEL]),
+                  fmt=os.environ.get(LOG_FORMAT_ENV, "text"),
+                  path=os.environ.get(LOG_FILE_ENV, ""))
+atexit.register(flush_logs)
@@ -0,0 +1,42 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Fugue Doctrine: Compact Directive Codes
+# Integer codes shared by the EG, PAU and DMC batch paths. Whole scenario sweeps are
+# evaluated as int8 arrays; human-readable strings are produced only at the edge.
+
+import numpy as np
+
+DIRECTIVE_CONTINUE = 0
+DIRECTIVE_MODULATE = 1
+DIRECTIVE_ABORT = 2
+
+DIRECTIVE_NAMES = ("CONTINUE", "MODULATE", "ABORT")
+
+ARBITRATION_MESSAGES = {
+    DIRECTIVE_CONTINUE: "CONTINUE: Acceptable purposeful risk.",
+    DIRECTIVE_ABORT: "ABORT: Misaligned with mission soul.",
+}
+
+def split_scenarios(scenarios):
+    """Splits an (..., 2) array of (failure_prob, acceptable_risk) pairs into two float arrays."""
+    scenarios = np.asarray(scenarios, dtype=np.float64)
+    if scenarios.shape[-1:] != (2,):
+        raise ValueError("scenarios must have shape (..., 2): (failure_prob, acceptable_risk) pairs")
+    return scenarios[..., 0], scenarios[..., 1]
+
+def directive_names(codes):
+    """Edge formatting: maps directive codes back to CONTINUE/MODULATE/ABORT strings."""
+    return [DIRECTIVE_NAMES[code] for code in np.asarray(codes).ravel().tolist()]
@@ -16,14 +16,33 @@
 # Fugue Doctrine: Dynamic Modulation Core (DMC) Implementation
 # Executes real-time adjustments based on EG directives.
 
+import numpy as np
+
+from fugue.directives import DIRECTIVE_CONTINUE, DIRECTIVE_MODULATE, DIRECTIVE_ABORT, DIRECTIVE_NAMES
+
 class DynamicModulationCore:
     def modulate(self, directive, intensity_adjust=0.15):
-        if directive == "MODULATE":
+        if directive == DIRECTIVE_NAMES[DIRECTIVE_MODULATE]:
             return f"Intensity reduced by {intensity_adjust * 100}% for Chaos Element. Hold for Order."
-        elif directive == "ABORT":
+        elif directive == DIRECTIVE_NAMES[DIRECTIVE_ABORT]:
             return "Connection severed. Maneuver terminated."
         return "No modulation needed."
 
+    def modulate_batch(self, directives, intensity_adjust=0.15):
+        """
+        Vectorized modulate over an array of directive codes. Returns the intensity
+        multiplier to apply per scenario: 1.0 (no change), 1 - intensity_adjust, or 0.0 (severed).
+        """
+        table = np.empty(len(DIRECTIVE_NAMES))
+        table[DIRECTIVE_CONTINUE] = 1.0
+        table[DIRECTIVE_MODULATE] = 1.0 - intensity_adjust
+        table[DIRECTIVE_ABORT] = 0.0
+        return table[np.asarray(directives, dtype=np.intp)]
+
+    def describe(self, directive_code, intensity_adjust=0.15):
+        """Edge formatting for a single directive code."""
+        return self.modulate(DIRECTIVE_NAMES[directive_code], intensity_adjust)
+
 # Example Usage:
 if __name__ == "__main__":
     dmc = DynamicModulationCore()
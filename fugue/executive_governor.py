@@ -16,16 +16,30 @@
 # Fugue Doctrine: Executive Governor (EG) Implementation
 # Synthesizes PAE, PAU, DMC for final decisions.
 
+import numpy as np
+
+from fugue.directives import (
+    DIRECTIVE_CONTINUE, DIRECTIVE_MODULATE, DIRECTIVE_ABORT, DIRECTIVE_NAMES, split_scenarios
+)
+
 class ExecutiveGovernor:
     def __init__(self, failure_ceiling=0.95):
         self.failure_ceiling = failure_ceiling
 
     def decide(self, failure_prob, acceptable_risk):
         if failure_prob < acceptable_risk:
-            return "CONTINUE"
+            return DIRECTIVE_NAMES[DIRECTIVE_CONTINUE]
         if failure_prob > self.failure_ceiling:
-            return "ABORT"
-        return "MODULATE"
+            return DIRECTIVE_NAMES[DIRECTIVE_ABORT]
+        return DIRECTIVE_NAMES[DIRECTIVE_MODULATE]
+
+    def decide_batch(self, scenarios):
+        """Vectorized decide over (..., 2) (failure_prob, acceptable_risk) pairs; returns int8 directive codes."""
+        failure_prob, acceptable_risk = split_scenarios(scenarios)
+        codes = np.full(failure_prob.shape, DIRECTIVE_MODULATE, dtype=np.int8)
+        codes[failure_prob > self.failure_ceiling] = DIRECTIVE_ABORT
+        codes[failure_prob < acceptable_risk] = DIRECTIVE_CONTINUE
+        return codes
 
 # Example Usage:
 if __name__ == "__main__":
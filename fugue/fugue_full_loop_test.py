@@ -15,7 +15,7 @@
 #
 # Test for Full Fugue Doctrine Loop
 from fugue.predictive_analysis_engine import PredictiveAnalysisEngine
-from fugue.philosophical_arbitration_unit import PhilosophicalArbitrationUnit
+from fugue.pau_arbitration import PhilosophicalArbitrationUnit
 from fugue.dynamic_modulation_core import DynamicModulationCore
 from fugue.executive_governor import ExecutiveGovernor
 
@@ -32,3 +32,27 @@ dmc = DynamicModulationCore()
 modulation = dmc.modulate(directive)
 
 print(f"Full Loop: {modulation}")
+
+# Batch sweep: every (failure_prob, acceptable_risk) pair on a grid in one vectorized pass.
+from collections import Counter
+import numpy as np
+from fugue.directives import DIRECTIVE_ABORT, ARBITRATION_MESSAGES, directive_names
+
+failure_probs, acceptable_risks = np.meshgrid(np.linspace(0.0, 1.0, 201), np.linspace(0.0, 1.0, 201))
+scenarios = np.stack([failure_probs.ravel(), acceptable_risks.ravel()], axis=-1)
+
+directives = eg.decide_batch(scenarios)
+vetoes = pau.arbitrate_batch(scenarios)
+directives[vetoes == DIRECTIVE_ABORT] = DIRECTIVE_ABORT  # PAU veto overrides the EG
+intensities = dmc.modulate_batch(directives)
+
+# Batch and scalar paths agree.
+assert directive_names(eg.decide_batch([[vectors["T+3"], 0.5]])) == [directive]
+assert directive_names(eg.decide_batch(scenarios)) == [eg.decide(p, r) for p, r in scenarios.tolist()]
+assert ARBITRATION_MESSAGES[int(pau.arbitrate_batch([[vectors["T+3"], 0.5]])[0])] == arbitration
+mixed = np.array([[0.0, 0.0], [0.0, 0.8], [0.0, 0.81], [0.375, 0.5], [0.5, 0.39], [0.5, 0.4], [0.78, 0.5], [1.0, 0.0], [1.0, 1.0]])
+for batch in (mixed, scenarios):
+    assert [ARBITRATION_MESSAGES[code] for code in pau.arbitrate_batch(batch).tolist()] == [pau.arbitrate(p, r) for p, r in batch.tolist()]
+
+counts = Counter(directive_names(directives))
+print(f"Sweep of {len(scenarios)} scenarios: {dict(counts)}, mean intensity {intensities.mean():.3f}")
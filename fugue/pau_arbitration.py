@@ -16,6 +16,10 @@
 # Fugue Doctrine: Philosophical Arbitration Unit (PAU) Implementation
 # Stubbed for demo; in production, integrate with Raphael's Harmony Index and mission objectives.
 
+import numpy as np
+
+from fugue.directives import DIRECTIVE_CONTINUE, DIRECTIVE_ABORT, ARBITRATION_MESSAGES, split_scenarios
+
 class PhilosophicalArbitrationUnit:
     def __init__(self, harmony_index=0.8, mission_objectives="Achieve safe scaling"):
         self.harmony_index = harmony_index
@@ -24,8 +28,14 @@ class PhilosophicalArbitrationUnit:
     def arbitrate(self, failure_prob, risk_level):
         contextual_bias = self.harmony_index * (1 - failure_prob)
         if contextual_bias < risk_level:
-            return "ABORT: Misaligned with mission soul."
-        return "CONTINUE: Acceptable purposeful risk."
+            return ARBITRATION_MESSAGES[DIRECTIVE_ABORT]
+        return ARBITRATION_MESSAGES[DIRECTIVE_CONTINUE]
+
+    def arbitrate_batch(self, scenarios):
+        """Vectorized arbitrate over (..., 2) (failure_prob, risk_level) pairs; returns int8 CONTINUE/ABORT codes."""
+        failure_prob, risk_level = split_scenarios(scenarios)
+        contextual_bias = self.harmony_index * (1 - failure_prob)
+        return np.where(contextual_bias < risk_level, DIRECTIVE_ABORT, DIRECTIVE_CONTINUE).astype(np.int8)
 
 # Example Usage:
 if __name__ == "__main__":
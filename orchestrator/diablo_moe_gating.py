@@ -16,19 +16,61 @@
 # Diablo MoE Gating Network Implementation
 # Routes tokens to top-k experts with sparsity.
 
+import random
+
+import numpy as np
+
 class DiabloGating:
-    def __init__(self, num_experts=4, top_k=2):
+    def __init__(self, num_experts=4, top_k=2, feature_dim=16, seed=0):
+        if not 1 <= top_k <= num_experts:
+            raise ValueError("top_k must be between 1 and num_experts")
         self.num_experts = num_experts
         self.top_k = top_k
+        self.feature_dim = feature_dim
+        self.seed = seed
+        self._rng = random.Random(seed)
+        # Linear router: logits = token_features @ router_weights. Fixed by the seed.
+        self.router_weights = np.random.default_rng(seed).standard_normal(
+            (feature_dim, num_experts)) / np.sqrt(feature_dim)
 
     def gate(self, input_token):
         # Simulated gating: Random top-k selection
-        scores = [random.uniform(0, 1) for _ in range(self.num_experts)]
+        scores = [self._rng.uniform(0, 1) for _ in range(self.num_experts)]
         top_indices = sorted(range(self.num_experts), key=lambda i: scores[i], reverse=True)[:self.top_k]
         return top_indices
 
+    def score_batch(self, token_features):
+        """Router logits for a (tokens, feature_dim) batch: one matmul, shape (tokens, num_experts)."""
+        token_features = np.asarray(token_features, dtype=np.float64)
+        if token_features.ndim != 2 or token_features.shape[1] != self.feature_dim:
+            raise ValueError(f"token_features must have shape (tokens, {self.feature_dim})")
+        return token_features @ self.router_weights
+
+    def gate_batch(self, token_features):
+        """
+        Routes a whole batch at once. Top-k uses a partial selection (argpartition) and
+        only the k winners are sorted. Returns (expert_indices, gate_weights), both of
+        shape (tokens, top_k), best expert first; weights are a softmax over the k logits.
+        """
+        logits = self.score_batch(token_features)
+        k = self.top_k
+        if k < self.num_experts:
+            selected = np.argpartition(-logits, k - 1, axis=1)[:, :k]
+        else:
+            selected = np.broadcast_to(np.arange(self.num_experts), logits.shape).copy()
+        top_logits = np.take_along_axis(logits, selected, axis=1)
+        order = np.argsort(-top_logits, axis=1, kind="stable")
+        expert_indices = np.take_along_axis(selected, order, axis=1)
+        top_logits = np.take_along_axis(top_logits, order, axis=1)
+
+        weights = np.exp(top_logits - top_logits[:, :1])
+        weights /= weights.sum(axis=1, keepdims=True)
+        return expert_indices, weights
+
 # Example Usage:
 if __name__ == "__main__":
     diablo = DiabloGating()
     routed = diablo.gate("test_token")
     print(f"Routed to experts: {routed}")
+    indices, weights = diablo.gate_batch(np.random.default_rng(1).standard_normal((3, diablo.feature_dim)))
+    print(f"Batch routing: {indices.tolist()} with weights {np.round(weights, 3).tolist()}")
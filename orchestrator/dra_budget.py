@@ -16,28 +16,146 @@
 # DRA (Decision-Reinforced Autonomy) Budget Implementation
 # Manages T-Value for resource governance in high-cost operations like Void Repair.
 
-INITIAL_T_VALUE = 100
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from common.structured_log import get_logger
+
+logger = get_logger("dra_budget")
+
+# INITIAL_T_VALUE and T_REFILL_RATE come from the environment (k8s/configmap.yaml) when set.
+INITIAL_T_VALUE = float(os.environ.get("INITIAL_T_VALUE", 100))
 T_COST_GENERAL_SEARCH = 1
 T_COST_VOID_REPAIR = 10
 T_COST_HIGH_RISK = 15  # For ASL-4+ evaluations
+T_REFILL_RATE = float(os.environ.get("T_REFILL_RATE", 1.0))  # T-Value regenerated per second, up to the budget capacity
+
+class Reservation:
+    """T-Cost held against the budget until the task commits or rolls it back."""
+    def __init__(self, budget: "DRABudget", cost: float, task_name: str):
+        self.budget = budget
+        self.cost = cost
+        self.task_name = task_name
+        self.state = "HELD"
+
+    def commit(self):
+        """Makes the spend final. Idempotent; a rolled-back reservation stays refunded."""
+        if self.state == "HELD":
+            self.state = "COMMITTED"
+
+    def rollback(self):
+        """Refunds the held T-Cost (capped at capacity). Committed reservations are not refunded."""
+        if self.state == "HELD":
+            self.state = "REFUNDED"
+            self.budget._refund(self.cost)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Commit on normal exit; refund if the task raised or was cancelled.
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
 
 class DRABudget:
-    def __init__(self, initial_t=INITIAL_T_VALUE):
-        self.t_value = initial_t
+    """
+    Thread-safe token bucket for T-Value. The balance refills continuously at
+    refill_rate per second up to capacity; it is computed lazily on access, so no
+    timer thread or manual recharge is needed. Every check-and-deduct is atomic.
+    """
+    def __init__(self, initial_t=INITIAL_T_VALUE, refill_rate: float = T_REFILL_RATE,
+                 capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.capacity = initial_t if capacity is None else capacity
+        self.refill_rate = refill_rate
+        self.clock = clock
+        self._tokens = initial_t
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        # Caller holds self._lock.
+        now = self.clock()
+        if self.refill_rate and self._tokens < self.capacity:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate)
+        self._updated_at = now
+
+    @property
+    def t_value(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _take(self, cost):
+        with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                return None
+            self._tokens -= cost
+            return self._tokens
+
+    async def _take_async(self, cost):
+        # A local bucket never blocks; LeasedDRABudget overrides this to lease off the event loop.
+        return self._take(cost)
+
+    def _refund(self, cost):
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + cost)
+
+    def try_spend(self, cost) -> Optional[float]:
+        """Atomically deducts cost. Returns the remaining T-Value, or None if unaffordable."""
+        return self._take(cost)
+
+    async def try_spend_async(self, cost) -> Optional[float]:
+        """try_spend for coroutines: any coordinator round-trip runs off the event loop."""
+        return await self._take_async(cost)
 
     def spend(self, cost, task_name):
-        if self.t_value < cost:
-            print(f"DRA Budget Exhausted for {task_name}. Remaining: {self.t_value}")
+        remaining = self._take(cost)
+        if remaining is None:
+            logger.warning("budget_exhausted", "DRA Budget Exhausted for {task}. Remaining: {t_value:.1f}",
+                           task=task_name, t_value=self.t_value)
             return False
-        self.t_value -= cost
-        print(f"Spent {cost} on {task_name}. Remaining T-Value: {self.t_value}")
+        logger.debug("budget_spent", "Spent {cost} on {task}. Remaining T-Value: {t_value:.1f}",
+                     cost=cost, task=task_name, t_value=remaining)
         return True
 
+    def reserve(self, cost, task_name) -> Optional[Reservation]:
+        """Holds cost up front (e.g. before a void repair). Returns None if unaffordable."""
+        if self._take(cost) is None:
+            return None
+        return Reservation(self, cost, task_name)
+
+    async def reserve_async(self, cost, task_name) -> Optional[Reservation]:
+        """reserve for coroutines: any coordinator round-trip runs off the event loop."""
+        if await self._take_async(cost) is None:
+            return None
+        return Reservation(self, cost, task_name)
+
+    @property
+    def cluster_t_value(self):
+        """T-Value left in the budget's pool. A local bucket is its own pool."""
+        return self.t_value
+
     def recharge(self, amount=10):
-        self.t_value += amount
-        print(f"Recharged {amount}. New T-Value: {self.t_value}")
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+            new_value = self._tokens
+        logger.info("budget_recharged", "Recharged {amount}. New T-Value: {t_value:.1f}", amount=amount, t_value=new_value)
+
+    def close(self):
+        """Releases external resources on shutdown. A local bucket holds none."""
 
 # Example Usage:
 if __name__ == "__main__":
     dra = DRABudget()
     dra.spend(T_COST_VOID_REPAIR, "Void Repair")
+    with dra.reserve(T_COST_VOID_REPAIR, "Void Repair") as reservation:
+        pass  # Committed on exit; an exception here would refund it.
+    print(f"T-Value after reservation: {dra.t_value:.1f}")
@@ -0,0 +1,322 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Cluster-Wide DRA Budget: Lease Coordinator
+# Orchestrator replicas lease chunks of T-Value from one shared pool and spend them
+# locally, so the cluster budget no longer multiplies with the HPA replica count and
+# the hot path never makes a coordinator round-trip per spend.
+#
+# Coordinator backends are pluggable (BudgetCoordinator). SQLiteCoordinator is the
+# stand-in for several processes on one machine or pods sharing a volume; the pool
+# itself is a token bucket that refills at the cluster-wide rate.
+
+import abc
+import asyncio
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional, Tuple
+
+from orchestrator.dra_budget import DRABudget, INITIAL_T_VALUE, T_REFILL_RATE
+
+DEFAULT_LEASE_SIZE = 20     # T-Value a pod takes per coordinator round-trip
+DEFAULT_LEASE_TTL = 30.0    # Seconds before an idle lease is handed back
+# The coordinator keeps a lease for COORDINATOR_TTL_FACTOR x its TTL. A live pod's reaper
+# always returns it well before then; only leases of pods that died (or stalled) reach the
+# coordinator expiry, and those are forfeited: the coordinator cannot know how much of one
+# was spent, so crediting it back could over-grant. The pool's refill makes up the loss.
+COORDINATOR_TTL_FACTOR = 2.0
+
+class BudgetCoordinator(abc.ABC):
+    """Interface for the shared T-Value pool that pods lease from."""
+    @abc.abstractmethod
+    def acquire(self, pod_id: str, amount: float, minimum: float, ttl: float) -> Tuple[Optional[str], float]:
+        """Grants up to amount (never less than minimum). Returns (lease_id, granted) or (None, 0)."""
+
+    @abc.abstractmethod
+    def release(self, pod_id: str, lease_ids: List[str], unused: float):
+        """
+        Returns a pod's unused T-Value to the pool and closes its leases. Only leases that
+        are still live are credited (at most their total); expired ones were forfeited.
+        """
+
+    @abc.abstractmethod
+    def available(self) -> float:
+        """T-Value in the pool, available to lease."""
+
+class InMemoryCoordinator(BudgetCoordinator):
+    """Single-process coordinator; useful for tests and single-replica deployments."""
+    def __init__(self, total_t: float = INITIAL_T_VALUE, refill_rate: float = T_REFILL_RATE,
+                 clock: Callable[[], float] = time.time):
+        self.pool = DRABudget(total_t, refill_rate=refill_rate, clock=clock)
+        self.leases = {}
+        self.clock = clock
+        self._lock = threading.Lock()
+
+    def _forfeit_expired(self):
+        # Caller holds self._lock. Leases of pods that vanished without releasing are dropped, uncredited.
+        now = self.clock()
+        for lease_id in [lease_id for lease_id, lease in self.leases.items() if lease[2] <= now]:
+            del self.leases[lease_id]
+
+    def acquire(self, pod_id, amount, minimum, ttl):
+        with self._lock:
+            self._forfeit_expired()
+            granted = min(amount, self.pool.t_value)
+            if granted < minimum or granted <= 0:
+                return None, 0.0
+            self.pool.try_spend(granted)
+            lease_id = uuid.uuid4().hex
+            self.leases[lease_id] = (pod_id, granted, self.clock() + ttl)
+            return lease_id, granted
+
+    def release(self, pod_id, lease_ids, unused):
+        with self._lock:
+            self._forfeit_expired()
+            live = sum(self.leases.pop(lease_id)[1] for lease_id in lease_ids if lease_id in self.leases)
+            credit = min(max(0.0, unused), live)
+            if credit > 0:
+                self.pool._refund(credit)
+
+    def available(self):
+        with self._lock:
+            self._forfeit_expired()
+            return self.pool.t_value
+
+class SQLiteCoordinator(BudgetCoordinator):
+    """
+    File-backed coordinator. Every acquire/release is one BEGIN IMMEDIATE transaction,
+    which serializes processes through SQLite's file lock.
+    """
+    def __init__(self, path: str, total_t: float = INITIAL_T_VALUE, refill_rate: float = T_REFILL_RATE,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.clock = clock
+        self._local = threading.local()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS dra_pool ("
+                "id INTEGER PRIMARY KEY CHECK (id = 1), tokens REAL NOT NULL, capacity REAL NOT NULL, "
+                "refill_rate REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS dra_leases ("
+                "lease_id TEXT PRIMARY KEY, pod_id TEXT NOT NULL, amount REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # The first process to arrive seeds the pool; later ones join it as-is.
+            conn.execute(
+                "INSERT OR IGNORE INTO dra_pool (id, tokens, capacity, refill_rate, updated_at) VALUES (1, ?, ?, ?, ?)",
+                (total_t, total_t, refill_rate, self.clock())
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _refilled_tokens(self, conn, now) -> Tuple[float, float]:
+        tokens, capacity, refill_rate, updated_at = conn.execute(
+            "SELECT tokens, capacity, refill_rate, updated_at FROM dra_pool WHERE id = 1"
+        ).fetchone()
+        return min(capacity, tokens + max(0.0, now - updated_at) * refill_rate), capacity
+
+    def _forfeit_expired(self, conn, now):
+        # Inside a write transaction. Expired leases are dropped without crediting the pool.
+        conn.execute("DELETE FROM dra_leases WHERE expires_at <= ?", (now,))
+
+    def acquire(self, pod_id, amount, minimum, ttl):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = self.clock()
+            tokens, _ = self._refilled_tokens(conn, now)
+            self._forfeit_expired(conn, now)
+            granted = min(amount, tokens)
+            if granted < minimum or granted <= 0:
+                conn.execute("UPDATE dra_pool SET tokens = ?, updated_at = ? WHERE id = 1", (tokens, now))
+                conn.execute("COMMIT")
+                return None, 0.0
+            lease_id = uuid.uuid4().hex
+            conn.execute("UPDATE dra_pool SET tokens = ?, updated_at = ? WHERE id = 1", (tokens - granted, now))
+            conn.execute("INSERT INTO dra_leases (lease_id, pod_id, amount, expires_at) VALUES (?, ?, ?, ?)",
+                         (lease_id, pod_id, granted, now + ttl))
+            conn.execute("COMMIT")
+            return lease_id, granted
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def release(self, pod_id, lease_ids, unused):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = self.clock()
+            self._forfeit_expired(conn, now)
+            live = 0.0
+            for lease_id in lease_ids:
+                row = conn.execute("SELECT amount FROM dra_leases WHERE lease_id = ?", (lease_id,)).fetchone()
+                if row is not None:
+                    live += row[0]
+                    conn.execute("DELETE FROM dra_leases WHERE lease_id = ?", (lease_id,))
+            tokens, capacity = self._refilled_tokens(conn, now)
+            conn.execute("UPDATE dra_pool SET tokens = ?, updated_at = ? WHERE id = 1",
+                         (min(capacity, tokens + min(max(0.0, unused), live)), now))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def available(self):
+        return self._refilled_tokens(self._connection(), self.clock())[0]
+
+    def outstanding(self) -> float:
+        """T-Value currently leased out to live pods."""
+        row = self._connection().execute(
+            "SELECT COALESCE(SUM(amount), 0) FROM dra_leases WHERE expires_at > ?", (self.clock(),)
+        ).fetchone()
+        return row[0]
+
+class LeasedDRABudget(DRABudget):
+    """
+    Pod-local view of the cluster budget. Spends come out of locally leased T-Value;
+    the coordinator is only contacted when the local balance runs short, when a lease
+    reaches its TTL (a background reaper returns idle leases even if the pod stops
+    spending), and on close() (graceful shutdown). Coordinator round-trips never run
+    under the budget lock, and the *_async methods run them off the event loop.
+    """
+    def __init__(self, coordinator: BudgetCoordinator, pod_id: Optional[str] = None,
+                 lease_size: float = DEFAULT_LEASE_SIZE, lease_ttl: float = DEFAULT_LEASE_TTL,
+                 clock: Callable[[], float] = time.monotonic, reap_interval: Optional[float] = None):
+        super().__init__(initial_t=0, refill_rate=0, capacity=float("inf"), clock=clock)
+        self.coordinator = coordinator
+        self.pod_id = pod_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        self.reap_interval = lease_ttl / 2 if reap_interval is None else reap_interval
+        self._lease_ids: List[str] = []
+        self._lease_expires_at = 0.0  # Local deadline of the oldest held lease
+        self._stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+    @property
+    def cluster_t_value(self) -> float:
+        """T-Value left in the shared pool (a coordinator round-trip)."""
+        return self.coordinator.available()
+
+    def _detach_leases(self, expired_only: bool) -> Optional[Tuple[List[str], float]]:
+        # Caller holds self._lock. Hands back what the caller must release outside the lock.
+        if not self._lease_ids or (expired_only and self.clock() < self._lease_expires_at):
+            return None
+        detached = (self._lease_ids, self._tokens)
+        self._lease_ids = []
+        self._tokens = 0
+        return detached
+
+    def _release(self, detached: Optional[Tuple[List[str], float]]):
+        if detached is not None:
+            self.coordinator.release(self.pod_id, *detached)
+
+    def _spend_local(self, cost) -> Tuple[Optional[float], Optional[Tuple[List[str], float]]]:
+        with self._lock:
+            detached = self._detach_leases(expired_only=True)
+            if self._tokens < cost:
+                return None, detached
+            self._tokens -= cost
+            return self._tokens, detached
+
+    def _acquire(self, cost) -> Tuple[Optional[str], float]:
+        with self._lock:
+            shortfall = cost - self._tokens
+        return self.coordinator.acquire(self.pod_id, max(self.lease_size, shortfall), shortfall,
+                                        self.lease_ttl * COORDINATOR_TTL_FACTOR)
+
+    def _add_lease(self, lease: Tuple[Optional[str], float], cost) -> Optional[float]:
+        lease_id, granted = lease
+        if lease_id is None:
+            return None
+        with self._lock:
+            if not self._lease_ids:
+                self._lease_expires_at = self.clock() + self.lease_ttl
+            self._lease_ids.append(lease_id)
+            self._tokens += granted
+            self._start_reaper()
+            if self._tokens < cost:  # Concurrent spends used the new lease up already
+                return None
+            self._tokens -= cost
+            return self._tokens
+
+    def _take(self, cost):
+        remaining, detached = self._spend_local(cost)
+        self._release(detached)
+        if remaining is not None:
+            return remaining
+        return self._add_lease(self._acquire(cost), cost)
+
+    async def _take_async(self, cost):
+        remaining, detached = self._spend_local(cost)
+        if detached is not None:
+            await asyncio.to_thread(self._release, detached)
+        if remaining is not None:
+            return remaining
+        return self._add_lease(await asyncio.to_thread(self._acquire, cost), cost)
+
+    def _refund(self, cost):
+        with self._lock:
+            self._tokens += cost
+
+    def recharge(self, amount=10):
+        raise TypeError("LeasedDRABudget cannot be recharged: the cluster pool refills at the coordinator.")
+
+    def reap(self):
+        """Returns the held leases to the coordinator if the oldest has reached its TTL."""
+        with self._lock:
+            detached = self._detach_leases(expired_only=True)
+        self._release(detached)
+
+    def _start_reaper(self):
+        # Caller holds self._lock.
+        if self._reaper is None and not self._stop.is_set():
+            self._reaper = threading.Thread(target=self._reap_loop, name=f"dra-reaper-{self.pod_id}", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._stop.wait(self.reap_interval):
+            self.reap()
+
+    def close(self):
+        """Stops the reaper and returns all unused leased T-Value to the coordinator."""
+        self._stop.set()
+        with self._lock:
+            detached = self._detach_leases(expired_only=False)
+        self._release(detached)
+
+# Example Usage:
+if __name__ == "__main__":
+    coordinator = InMemoryCoordinator(total_t=100)
+    pod_a = LeasedDRABudget(coordinator, pod_id="pod-a")
+    pod_b = LeasedDRABudget(coordinator, pod_id="pod-b")
+    pod_a.spend(10, "Void Repair")
+    pod_b.spend(10, "Void Repair")
+    print(f"Pool after two leases: {coordinator.available():.1f}")
+    pod_a.close()
+    pod_b.close()
+    print(f"Pool after shutdown: {coordinator.available():.1f}")
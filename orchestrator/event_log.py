@@ -0,0 +1,81 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Orchestration Event Log
+# Per-request log of phase events for /analyze_query. Events are stored as
+# (phase code, message template, typed fields) in a fixed-capacity ring buffer and
+# only formatted when the log is read. The verbosity level decides what is recorded;
+# at VERBOSITY_OFF nothing is stored or formatted.
+
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List
+
+VERBOSITY_OFF = 0      # No log is built; only final_report matters to the caller
+VERBOSITY_SUMMARY = 1  # Phase outcomes only (SUCCESS / FAIL / RESULT events)
+VERBOSITY_FULL = 2     # Every event
+DEFAULT_CAPACITY = 64  # Events kept per request; the oldest are overwritten beyond this
+
+class EventLog:
+    """
+    Bounded, lazily formatted event log. record() keeps the template and raw field values;
+    render() produces the [{phase_code: message}, ...] list the API has always returned.
+    """
+    __slots__ = ("verbosity", "recorded", "dropped", "_events")
+
+    def __init__(self, verbosity: int = VERBOSITY_FULL, capacity: int = DEFAULT_CAPACITY):
+        self.verbosity = verbosity
+        self.recorded = 0
+        self.dropped = 0
+        self._events = deque(maxlen=capacity) if verbosity > VERBOSITY_OFF else None
+
+    def record(self, code: str, template: str, level: int = VERBOSITY_FULL, **fields: Any) -> None:
+        """Stores one event if its level is within the log's verbosity. No formatting happens here."""
+        if level > self.verbosity:
+            return
+        events = self._events
+        if len(events) == events.maxlen:
+            self.dropped += 1
+        events.append((code, template, fields))
+        self.recorded += 1
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Structured view: phase code, formatted message and the typed fields."""
+        if not self._events:
+            return []
+        return [{"phase": code, "message": template.format(**fields), "fields": fields}
+                for code, template, fields in self._events]
+
+    def render(self) -> List[Dict[str, str]]:
+        if not self._events:
+            return []
+        return [{code: template.format(**fields)} for code, template, fields in self._events]
+
+    def render_since(self, mark: int) -> List[Dict[str, str]]:
+        """
+        Renders only the events recorded after `mark` (a previous value of self.recorded),
+        e.g. the events of one phase for a streaming client. Events already overwritten
+        in the ring buffer are skipped.
+        """
+        if not self._events:
+            return []
+        new = min(self.recorded - mark, len(self._events))
+        if new <= 0:
+            return []
+        return [{code: template.format(**fields)}
+                for code, template, fields in islice(self._events, len(self._events) - new, None)]
+
+    def __len__(self) -> int:
+        return len(self._events) if self._events else 0
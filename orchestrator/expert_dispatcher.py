@@ -0,0 +1,194 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Capacity-Aware Expert Dispatch (Diablo MoE)
+# Sits between DiabloGating and the experts. Each expert gets a per-batch capacity
+# (capacity_factor x its fair share of the batch, optionally capped by a bounded queue),
+# so a skewed router cannot pile every token onto one hot expert. Overflow is rerouted
+# to the token's next-best expert or dropped, and every batch reports utilization,
+# drop rate and an imbalance coefficient.
+
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from orchestrator.diablo_moe_gating import DiabloGating
+
+OVERFLOW_REROUTE = "reroute"   # Try the token's next-best expert with room left
+OVERFLOW_DROP = "drop"         # Drop the assignment; the token keeps its other experts
+OVERFLOW_POLICIES = (OVERFLOW_REROUTE, OVERFLOW_DROP)
+
+DEFAULT_CAPACITY_FACTOR = 1.25
+
+class ExpertDispatcher:
+    """
+    Assigns a token batch to experts under per-expert capacity limits.
+
+    Routing is done in rounds: in round r every token that still needs an expert
+    proposes its r-th ranked expert, and each expert accepts proposals in token order
+    until it is full. Every token's first choice is placed before any second choice.
+    Under OVERFLOW_DROP only the gate's top-k are ever proposed; under OVERFLOW_REROUTE
+    rejected tokens move down their ranking until they are placed or run out of experts.
+    """
+    def __init__(self, gating: DiabloGating, capacity_factor: float = DEFAULT_CAPACITY_FACTOR,
+                 overflow_policy: str = OVERFLOW_REROUTE, queue_capacity: Optional[int] = None):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}")
+        if capacity_factor <= 0:
+            raise ValueError("capacity_factor must be positive")
+        if queue_capacity is not None and queue_capacity < 0:
+            raise ValueError("queue_capacity must be non-negative")
+        self.gating = gating
+        self.capacity_factor = capacity_factor
+        self.overflow_policy = overflow_policy
+        self.queue_capacity = queue_capacity
+
+        # Cumulative counters across batches
+        self.batches = 0
+        self.assignments_requested = 0
+        self.assignments_dropped = 0
+        self.assignments_rerouted = 0
+        self.expert_load = np.zeros(gating.num_experts, dtype=np.int64)
+
+    def expert_capacity(self, num_tokens: int) -> int:
+        """Slots per expert for a batch: capacity_factor x (tokens * top_k / num_experts)."""
+        fair_share = num_tokens * self.gating.top_k / self.gating.num_experts
+        capacity = math.ceil(self.capacity_factor * fair_share)
+        if self.queue_capacity is not None:
+            capacity = min(capacity, self.queue_capacity)
+        return capacity
+
+    def dispatch(self, token_features) -> Dict[str, Any]:
+        """
+        Routes a (tokens, feature_dim) batch. Returns a dict with:
+          expert_indices - (tokens, top_k) expert ids, -1 where an assignment was dropped;
+                           ordered by router preference
+          gate_weights   - (tokens, top_k) softmax over the placed experts' logits (0 if dropped)
+          stats          - per-batch load-balancing report (see _batch_stats)
+        """
+        gating = self.gating
+        logits = gating.score_batch(token_features)
+        num_tokens, num_experts = logits.shape
+        k = gating.top_k
+        capacity = self.expert_capacity(num_tokens)
+
+        if self.overflow_policy == OVERFLOW_REROUTE:
+            ranking = np.argsort(-logits, axis=1, kind="stable")
+        else:
+            ranking, _ = gating.gate_batch(token_features)
+        max_rounds = ranking.shape[1]
+
+        expert_indices = np.full((num_tokens, k), -1, dtype=np.int64)
+        placed = np.zeros(num_tokens, dtype=np.int64)
+        load = np.zeros(num_experts, dtype=np.int64)
+        rerouted = 0
+
+        for rank in range(max_rounds):
+            pending = np.flatnonzero(placed < k)
+            if pending.size == 0:
+                break
+            proposals = ranking[pending, rank]
+            # Position of each proposal in its expert's queue, in token order.
+            order = np.argsort(proposals, kind="stable")
+            sorted_experts = proposals[order]
+            group_start = np.searchsorted(sorted_experts, sorted_experts, side="left")
+            position = np.empty_like(order)
+            position[order] = np.arange(order.size) - group_start
+            accepted = load[proposals] + position < capacity
+
+            tokens = pending[accepted]
+            experts = proposals[accepted]
+            # Dropping keeps the gate's slot layout; rerouting packs placed experts first.
+            column = rank if self.overflow_policy == OVERFLOW_DROP else placed[tokens]
+            expert_indices[tokens, column] = experts
+            if rank >= k:
+                rerouted += tokens.size
+            placed[tokens] += 1
+            load += np.bincount(experts, minlength=num_experts)
+
+        gate_weights = self._placed_weights(logits, expert_indices)
+        dropped = int(num_tokens * k - placed.sum())
+        demand = np.bincount(ranking[:, :k].ravel(), minlength=num_experts)
+
+        self.batches += 1
+        self.assignments_requested += num_tokens * k
+        self.assignments_dropped += dropped
+        self.assignments_rerouted += rerouted
+        self.expert_load += load
+
+        return {
+            "expert_indices": expert_indices,
+            "gate_weights": gate_weights,
+            "stats": self._batch_stats(num_tokens * k, capacity, demand, load, dropped, rerouted),
+        }
+
+    @staticmethod
+    def _placed_weights(logits, expert_indices):
+        valid = expert_indices >= 0
+        chosen = np.take_along_axis(logits, np.where(valid, expert_indices, 0), axis=1)
+        chosen = np.where(valid, chosen, -np.inf)
+        row_max = chosen.max(axis=1, keepdims=True)
+        row_max = np.where(np.isfinite(row_max), row_max, 0.0)
+        weights = np.exp(chosen - row_max)
+        totals = weights.sum(axis=1, keepdims=True)
+        return np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0)
+
+    @staticmethod
+    def _batch_stats(requested, capacity, demand, load, dropped, rerouted):
+        """
+        utilization - load / capacity per expert
+        imbalance   - max / mean of the router's top-k demand per expert (1.0 = perfectly
+                      balanced, num_experts = everything on one expert); load_imbalance is
+                      the same measure after capacity limits were applied.
+        """
+        def max_over_mean(counts):
+            mean = counts.mean()
+            return float(counts.max() / mean) if mean > 0 else 0.0
+
+        utilization = load / capacity if capacity > 0 else np.zeros(load.shape)
+        return {
+            "capacity": capacity,
+            "expert_demand": demand.tolist(),
+            "expert_load": load.tolist(),
+            "utilization": utilization.tolist(),
+            "drop_rate": dropped / requested if requested else 0.0,
+            "reroute_rate": rerouted / requested if requested else 0.0,
+            "imbalance": max_over_mean(demand),
+            "load_imbalance": max_over_mean(load),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Cumulative counters across all dispatched batches."""
+        requested = self.assignments_requested
+        return {
+            "batches": self.batches,
+            "assignments": requested,
+            "dropped": self.assignments_dropped,
+            "rerouted": self.assignments_rerouted,
+            "drop_rate": self.assignments_dropped / requested if requested else 0.0,
+            "expert_load": self.expert_load.tolist(),
+        }
+
+# Example Usage:
+if __name__ == "__main__":
+    gating = DiabloGating(num_experts=8, top_k=2, feature_dim=16)
+    # A shared offset in the features skews the router towards a few experts.
+    features = np.random.default_rng(1).standard_normal((256, 16)) + 1.5
+    for policy in OVERFLOW_POLICIES:
+        report = ExpertDispatcher(gating, overflow_policy=policy).dispatch(features)["stats"]
+        print(f"{policy}: demand {report['expert_demand']} -> load {report['expert_load']} "
+              f"(capacity {report['capacity']}, drop rate {report['drop_rate']:.3f}, "
+              f"imbalance {report['imbalance']:.2f} -> {report['load_imbalance']:.2f})")
@@ -0,0 +1,170 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Expert-Parallel Executor (Diablo MoE)
+# Runs the experts DiabloGating routes to. Routed tokens are grouped by expert into
+# micro-batches, the selected experts run concurrently on a thread or process pool,
+# and their outputs are combined per token using the gate weights.
+
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from orchestrator.diablo_moe_gating import DiabloGating
+
+def _timed_call(expert: Callable, batch: np.ndarray):
+    # Module-level so it pickles for process pools; timing happens where the expert runs.
+    start = time.perf_counter()
+    output = expert(batch)
+    return np.asarray(output), time.perf_counter() - start
+
+class LinearExpert:
+    """CPU stand-in expert: y = tanh(x @ W + b). Picklable, so it also runs on process pools."""
+    def __init__(self, input_dim: int, output_dim: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.weights = rng.standard_normal((input_dim, output_dim)) / np.sqrt(input_dim)
+        self.bias = rng.standard_normal(output_dim) * 0.1
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        return np.tanh(batch @ self.weights + self.bias)
+
+class ExpertExecutor:
+    """
+    Expert registry plus a worker pool. Experts are callables mapping a (n, feature_dim)
+    micro-batch to (n, output_dim), registered against the gate's expert ids. Thread pools
+    suit NumPy experts (BLAS releases the GIL); use_processes=True for pure-Python experts,
+    which must then be picklable.
+    """
+    def __init__(self, gating: DiabloGating, max_workers: Optional[int] = None,
+                 use_processes: bool = False):
+        self.gating = gating
+        self.use_processes = use_processes
+        self.max_workers = max_workers or gating.num_experts
+        self._experts: Dict[int, Callable] = {}
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # Cumulative per-expert counters
+        self.expert_batches = np.zeros(gating.num_experts, dtype=np.int64)
+        self.expert_tokens = np.zeros(gating.num_experts, dtype=np.int64)
+        self.expert_seconds = np.zeros(gating.num_experts)
+
+    def register(self, expert_id: int, expert: Callable) -> None:
+        if not 0 <= expert_id < self.gating.num_experts:
+            raise ValueError(f"expert_id must be between 0 and {self.gating.num_experts - 1}")
+        self._experts[expert_id] = expert
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+                self._pool = pool_class(max_workers=self.max_workers)
+            return self._pool
+
+    def run(self, token_features, expert_indices=None, gate_weights=None) -> Dict[str, Any]:
+        """
+        Executes one batch. Routing defaults to gating.gate_batch(token_features); pass the
+        expert_indices / gate_weights of an ExpertDispatcher result to run capacity-limited
+        routing instead (-1 entries are skipped). Returns a dict with the combined outputs
+        (tokens, output_dim) and per-expert batch sizes and latency for this batch.
+        """
+        features = np.asarray(token_features, dtype=np.float64)
+        if expert_indices is None:
+            expert_indices, gate_weights = self.gating.gate_batch(features)
+        expert_indices = np.asarray(expert_indices)
+        gate_weights = np.asarray(gate_weights)
+
+        routed = np.unique(expert_indices[expert_indices >= 0])
+        missing = [int(e) for e in routed if int(e) not in self._experts]
+        if missing:
+            raise ValueError(f"No expert registered for ids {missing}")
+
+        # Group (token, slot) assignments into one micro-batch per expert.
+        token_rows, slots = np.nonzero(expert_indices >= 0)
+        assigned = expert_indices[token_rows, slots]
+        order = np.argsort(assigned, kind="stable")
+        token_rows, slots, assigned = token_rows[order], slots[order], assigned[order]
+        bounds = np.searchsorted(assigned, routed, side="left"), np.searchsorted(assigned, routed, side="right")
+
+        pool = self._get_pool()
+        start = time.perf_counter()
+        futures = {}
+        for expert_id, lo, hi in zip(routed.tolist(), *bounds):
+            rows = token_rows[lo:hi]
+            futures[expert_id] = (rows, slots[lo:hi],
+                                  pool.submit(_timed_call, self._experts[expert_id], features[rows]))
+
+        outputs = None
+        batch_sizes, latency = {}, {}
+        for expert_id, (rows, expert_slots, future) in futures.items():
+            result, seconds = future.result()
+            if outputs is None:
+                outputs = np.zeros((features.shape[0],) + result.shape[1:], dtype=result.dtype)
+            weights = gate_weights[rows, expert_slots].reshape((-1,) + (1,) * (result.ndim - 1))
+            # A token appears at most once per expert, so rows has no duplicates here.
+            outputs[rows] += weights * result
+            batch_sizes[expert_id] = int(rows.size)
+            latency[expert_id] = seconds
+            self.expert_batches[expert_id] += 1
+            self.expert_tokens[expert_id] += rows.size
+            self.expert_seconds[expert_id] += seconds
+        wall_seconds = time.perf_counter() - start
+
+        if outputs is None:
+            outputs = np.zeros((features.shape[0], 0))
+        return {
+            "outputs": outputs,
+            "expert_batch_sizes": batch_sizes,
+            "expert_latency": latency,
+            "wall_seconds": wall_seconds,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Cumulative micro-batch counts, tokens and mean latency per expert."""
+        batches = self.expert_batches
+        mean_latency = np.divide(self.expert_seconds, batches,
+                                 out=np.zeros_like(self.expert_seconds), where=batches > 0)
+        return {
+            "registered": sorted(self._experts),
+            "expert_batches": batches.tolist(),
+            "expert_tokens": self.expert_tokens.tolist(),
+            "expert_mean_latency": mean_latency.tolist(),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Example Usage:
+if __name__ == "__main__":
+    gating = DiabloGating(num_experts=8, top_k=2, feature_dim=32)
+    features = np.random.default_rng(1).standard_normal((1024, 32))
+    with ExpertExecutor(gating) as executor:
+        for expert_id in range(gating.num_experts):
+            executor.register(expert_id, LinearExpert(32, 32, seed=expert_id))
+        result = executor.run(features)
+    print(f"Outputs {result['outputs'].shape} in {result['wall_seconds'] * 1000:.1f} ms")
+    for expert_id, size in result["expert_batch_sizes"].items():
+        print(f"  expert {expert_id}: {size} tokens, {result['expert_latency'][expert_id] * 1000:.2f} ms")
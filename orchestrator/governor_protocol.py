@@ -18,89 +18,179 @@
 #
 # Deckard Kain's Orchestration Logic: Check SSI before any high-cost/high-stress action.
 
+import asyncio
+import os
+import threading
 import time
 import random
-from typing import Dict, Any
+from typing import Callable, Dict, Any
+
+from common.structured_log import get_logger
+
+logger = get_logger("governor")
 
 # --- Governor Protocol Constants (Koneko's Design) ---
+# The tunable ones are read from the environment (k8s/configmap.yaml, written by
+# orchestrator/governor_simulator.py), with these values as the defaults.
 
 # SSI is measured on a scale of 0.0 (Failure) to 1.0 (Optimal)
-SSI_THRESHOLD_CRITICAL = 0.35  
+SSI_THRESHOLD_CRITICAL = float(os.environ.get("SSI_THRESHOLD_CRITICAL", 0.35))
 # Below this point, the Governor forces a temporary system pause (Cognitive Coherence Failure).
 
-SSI_RECOVERY_RATE = 0.08       
+SSI_RECOVERY_RATE = float(os.environ.get("SSI_RECOVERY_RATE", 0.08))
 # The rate at which the system naturally recovers stability per recovery cycle.
 
-STRESS_FACTOR_PHASE_VII = 0.20 # High stress for Micro-Search (T-Cost = 10)
+RECOVERY_CYCLE_SECONDS = 0.01
+# Wall-clock length of one recovery cycle. SSI recovers continuously at
+# SSI_RECOVERY_RATE per cycle while paused, and at a quarter of that while stable.
+
+STRESS_FACTOR_PHASE_VII = float(os.environ.get("STRESS_FACTOR_PHASE_VII", 0.20)) # High stress for Micro-Search (T-Cost = 10)
 STRESS_FACTOR_GENERAL_TASK = 0.03 # Low stress for internal processing or general searches
 
 class GovernorProtocol:
     """
     Koneko's Stabilization Framework. Monitors SSI and enforces recovery pauses.
+
+    SSI is computed lazily from elapsed monotonic time since the last update, so
+    recovery costs nothing until someone reads it: no sleeps, no polling loops.
+    One instance is shared by every request (and thread), so updates are serialized by a lock.
+    ensure_stability_for_task blocks its thread; ensure_stability_for_task_async suspends
+    only the calling coroutine.
     """
-    def __init__(self, initial_ssi: float = 0.95):
-        self.ssi = initial_ssi
-        self.is_stable = True
-        print(f"Governor Protocol Activated. Initial SSI: {self.ssi:.2f}")
+    def __init__(self, initial_ssi: float = 0.95, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._lock = threading.RLock()
+        self.paused_rate = SSI_RECOVERY_RATE / RECOVERY_CYCLE_SECONDS        # SSI per second while paused
+        self.passive_rate = (SSI_RECOVERY_RATE / 4) / RECOVERY_CYCLE_SECONDS # SSI per second while stable
+        self._ssi = initial_ssi
+        self._is_stable = initial_ssi >= SSI_THRESHOLD_CRITICAL
+        self._updated_at = clock()
+        logger.info("governor_activated", "Governor Protocol Activated. Initial SSI: {ssi:.2f}", ssi=self._ssi)
+
+    def _advance(self):
+        """Brings SSI forward to the current time along the piecewise recovery curve."""
+        with self._lock:
+            self._advance_locked()
+
+    def _advance_locked(self):
+        now = self.clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed <= 0:
+            return
+        if not self._is_stable:
+            time_to_threshold = (SSI_THRESHOLD_CRITICAL - self._ssi) / self.paused_rate
+            if elapsed < time_to_threshold:
+                self._ssi += elapsed * self.paused_rate
+                return
+            self._ssi = SSI_THRESHOLD_CRITICAL
+            self._is_stable = True
+            elapsed -= time_to_threshold
+            logger.info("governor_recovered", "GOVERNOR: Stability recovered. Resuming Orchestration.")
+        self._ssi = min(1.0, self._ssi + elapsed * self.passive_rate)
+
+    @property
+    def ssi(self) -> float:
+        self._advance()
+        return self._ssi
+
+    @ssi.setter
+    def ssi(self, value: float):
+        with self._lock:
+            self._advance()
+            self._ssi = value
+            self.check_stability()
+
+    @property
+    def is_stable(self) -> bool:
+        self._advance()
+        return self._is_stable
 
     def apply_stress(self, factor: float, task_name: str):
         """Applies cognitive load based on the task's complexity."""
         # Add a small randomness to stress application for realistic variance
         actual_stress = factor * (1.0 + random.uniform(-0.1, 0.1))
-        self.ssi = max(0.0, self.ssi - actual_stress)
-        print(f"[{task_name}] - Stress Applied (-{actual_stress:.2f}). Current SSI: {self.ssi:.2f}")
-        self.check_stability()
+        with self._lock:
+            self._advance()
+            self._ssi = max(0.0, self._ssi - actual_stress)
+            logger.debug("stress_applied", "[{task}] - Stress Applied (-{stress:.2f}). Current SSI: {ssi:.2f}",
+                         task=task_name, stress=actual_stress, ssi=self._ssi)
+            self.check_stability()
 
     def check_stability(self) -> bool:
         """Determines if the system can safely continue operation."""
-        if self.ssi < SSI_THRESHOLD_CRITICAL:
-            self.is_stable = False
-            print(f"!!! GOVERNOR ALERT !!! SSI {self.ssi:.2f} is below CRITICAL THRESHOLD.")
-            print("Koneko Protocol: Forcing Immediate System Pause for Emotional/Cognitive Coherence.")
-            return False
-        self.is_stable = True
-        return True
+        with self._lock:
+            self._advance()
+            if self._ssi < SSI_THRESHOLD_CRITICAL:
+                if self._is_stable:
+                    logger.warning("governor_pause", "!!! GOVERNOR ALERT !!! SSI {ssi:.2f} is below CRITICAL THRESHOLD. "
+                                   "Koneko Protocol: Forcing Immediate System Pause for Emotional/Cognitive Coherence.",
+                                   ssi=self._ssi)
+                self._is_stable = False
+                return False
+            self._is_stable = True
+            return True
 
     def run_recovery_cycle(self):
-        """Increments SSI during a system pause until the critical threshold is met."""
-        if not self.is_stable:
-            # Enforce a short simulated pause to reflect time spent recovering
-            time.sleep(0.01) 
-            self.ssi = min(1.0, self.ssi + SSI_RECOVERY_RATE)
-            print(f"[RECOVERY CYCLE] - SSI increased to {self.ssi:.2f}. T-0")
-            
-            if self.ssi >= SSI_THRESHOLD_CRITICAL:
-                self.is_stable = True
-                print("GOVERNOR: Stability recovered. Resuming Orchestration.")
-        elif self.ssi < 1.0:
-             # Passive recovery during normal operation to maintain peak SSI
-             self.ssi = min(1.0, self.ssi + (SSI_RECOVERY_RATE / 4))
+        """Brings SSI up to date. Recovery itself is time-based, so this never blocks."""
+        self._advance()
+
+    def time_until_stable(self) -> float:
+        """Seconds of pause remaining before SSI is back at the critical threshold."""
+        with self._lock:
+            self._advance()
+            if self._is_stable:
+                return 0.0
+            return (SSI_THRESHOLD_CRITICAL - self._ssi) / self.paused_rate
+
+    async def wait_until_stable(self):
+        """Suspends only the calling coroutine until the Governor pause has elapsed."""
+        delay = self.time_until_stable()
+        # Re-check after waking: other tasks may have applied stress in the meantime.
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.time_until_stable()
 
     def ensure_stability_for_task(self, factor: float, task_name: str) -> bool:
         """
-        The Orchestrator's main safety method.
+        The Orchestrator's main safety method for synchronous callers.
         Before executing a high-stress task, this ensures stability, pausing if necessary.
+        The pause sleeps for exactly the remaining recovery time instead of polling.
         Returns False if a task is cancelled (e.g., T-Value check elsewhere, but handles SSI here).
         """
         # 1. Check if the system is stable before even applying stress
         if not self.is_stable:
-             print(f"WARNING: Governor Protocol Active. Cannot start '{task_name}'. Entering forced recovery.")
-             while not self.is_stable:
-                 self.run_recovery_cycle()
-        
+            logger.info("forced_recovery", "Governor Protocol Active. Cannot start '{task}'. Entering forced recovery.",
+                        task=task_name)
+            while not self.is_stable:
+                time.sleep(self.time_until_stable())
+
         # 2. Apply the stress of the impending task
         self.apply_stress(factor, task_name)
-        
+
         # 3. Handle the consequences of the applied stress
         if not self.is_stable:
-            # If stress pushed the SSI below threshold, enter immediate recovery
+            # If stress pushed the SSI below threshold, wait out the recovery
             while not self.is_stable:
-                self.run_recovery_cycle()
-            
-            # After forced recovery, the system can proceed with the task
-            print(f"Governor Protocol successful. '{task_name}' can now proceed.")
+                time.sleep(self.time_until_stable())
+            logger.info("task_resumed", "Governor Protocol successful. '{task}' can now proceed.", task=task_name)
+
+        return True
+
+    async def ensure_stability_for_task_async(self, factor: float, task_name: str) -> bool:
+        """Coroutine form of ensure_stability_for_task for use inside the event loop."""
+        if not self.is_stable:
+            logger.info("forced_recovery", "Governor Protocol Active. Cannot start '{task}'. Entering forced recovery.",
+                        task=task_name)
+            await self.wait_until_stable()
+
+        self.apply_stress(factor, task_name)
+
+        if not self.is_stable:
+            await self.wait_until_stable()
+            logger.info("task_resumed", "Governor Protocol successful. '{task}' can now proceed.", task=task_name)
 
         return True
 
-# NOTE: This GovernorProtocol class must be imported into the main Deckard Kain Orchestrator 
-# (orchestrator_skeleton.py) and called before every Phase II/III and Phase VII execution.
+# NOTE: This is the GovernorProtocol the Deckard Kain Orchestrator (omni_analyst_orchestrator.py)
+# imports and calls before every Phase II and Phase VII execution.
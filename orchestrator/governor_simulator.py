@@ -0,0 +1,254 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Governor / DRA Discrete-Event Simulator
+# Replays the GovernorProtocol + DRABudget dynamics for a stream of Phase VII void
+# repairs on a virtual clock (nothing sleeps). Every parameter combination of a sweep
+# is one lane of a numpy array, so a grid of hundreds of policies advances together
+# and millions of simulated repairs take seconds. Reports pause-time fraction,
+# throughput and budget exhaustion per policy, and writes the chosen policy into
+# k8s/configmap.yaml.
+#
+# Run: python -m orchestrator.governor_simulator [--repairs 20000] [--write-configmap k8s/configmap.yaml]
+
+import argparse
+import itertools
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from orchestrator.dra_budget import INITIAL_T_VALUE, T_COST_VOID_REPAIR, T_REFILL_RATE
+from orchestrator.governor_protocol import (RECOVERY_CYCLE_SECONDS, SSI_RECOVERY_RATE, SSI_THRESHOLD_CRITICAL,
+                                            STRESS_FACTOR_PHASE_VII)
+
+DEFAULT_ARRIVAL_RATE = 20.0  # Offered void repairs per second
+STRESS_JITTER = 0.1          # apply_stress varies each stress by +/-10%
+INITIAL_SSI = 0.95
+CHUNK_STEPS = 1024           # Random draws are generated this many steps at a time
+
+# Sweepable policy parameters and their production defaults.
+PARAMETERS = {
+    "ssi_threshold": SSI_THRESHOLD_CRITICAL,
+    "recovery_rate": SSI_RECOVERY_RATE,
+    "stress_factor": STRESS_FACTOR_PHASE_VII,
+    "initial_t": float(INITIAL_T_VALUE),
+    "refill_rate": T_REFILL_RATE,
+    "arrival_rate": DEFAULT_ARRIVAL_RATE,
+}
+
+# Policy parameter -> k8s/configmap.yaml key
+CONFIGMAP_KEYS = {
+    "ssi_threshold": "SSI_THRESHOLD_CRITICAL",
+    "recovery_rate": "SSI_RECOVERY_RATE",
+    "stress_factor": "STRESS_FACTOR_PHASE_VII",
+    "initial_t": "INITIAL_T_VALUE",
+    "refill_rate": "T_REFILL_RATE",
+}
+
+class VirtualClock:
+    """Manually advanced clock; pass it as `clock=` to GovernorProtocol or DRABudget."""
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+def simulate(repairs: int, seed: int = 0, t_cost: float = T_COST_VOID_REPAIR,
+             **params: Any) -> Dict[str, np.ndarray]:
+    """
+    Simulates `repairs` void repairs on every lane. Each keyword in PARAMETERS may be a
+    scalar or an array; they broadcast to the lane shape (flattened). Per repair, in the
+    order phase_void_repair runs it: Poisson arrival, FIFO wait for the previous repair,
+    DRA reserve (an unaffordable repair is refused and applies no stress), Governor
+    stress, then a forced recovery pause if SSI fell below the threshold.
+    Returns the flattened parameters plus per-lane metrics.
+    """
+    unknown = set(params) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown simulation parameters: {sorted(unknown)}")
+    values = np.broadcast_arrays(*(np.asarray(params.get(name, default), dtype=float)
+                                   for name, default in PARAMETERS.items()))
+    lanes = dict(zip(PARAMETERS, (value.ravel() for value in values)))
+    count = lanes["ssi_threshold"].size
+    threshold = lanes["ssi_threshold"]
+    paused_rate = lanes["recovery_rate"] / RECOVERY_CYCLE_SECONDS
+    passive_rate = paused_rate / 4
+    capacity = lanes["initial_t"]
+    refill = lanes["refill_rate"]
+
+    rng = np.random.default_rng(seed)
+    ssi = np.full(count, INITIAL_SSI)
+    tokens = capacity.copy()
+    now = np.zeros(count)          # Virtual time the previous repair finished
+    arrival = np.zeros(count)
+    paused = np.zeros(count)
+    pauses = np.zeros(count, dtype=np.int64)
+    completed = np.zeros(count, dtype=np.int64)
+    latency = np.zeros(count)
+    max_latency = np.zeros(count)
+    first_exhausted = np.full(count, np.nan)
+
+    done = 0
+    while done < repairs:
+        steps = min(CHUNK_STEPS, repairs - done)
+        gaps = rng.exponential(1.0, size=(steps, count)) / lanes["arrival_rate"]
+        jitter = rng.uniform(1.0 - STRESS_JITTER, 1.0 + STRESS_JITTER, size=(steps, count))
+        for step in range(steps):
+            arrival += gaps[step]
+            start = np.maximum(arrival, now)
+            elapsed = start - now
+            # Lanes are always stable between repairs, so idle time recovers at the passive rate.
+            np.minimum(ssi + elapsed * passive_rate, 1.0, out=ssi)
+            np.minimum(tokens + elapsed * refill, capacity, out=tokens)
+
+            affordable = tokens >= t_cost
+            tokens -= np.where(affordable, t_cost, 0.0)
+            first_exhausted = np.where(np.isnan(first_exhausted) & ~affordable, start, first_exhausted)
+
+            stressed = np.maximum(ssi - lanes["stress_factor"] * jitter[step], 0.0)
+            ssi = np.where(affordable, stressed, ssi)
+            unstable = ssi < threshold
+            wait = np.where(unstable, (threshold - ssi) / paused_rate, 0.0)
+            ssi = np.where(unstable, threshold, ssi)
+            np.minimum(tokens + wait * refill, capacity, out=tokens)
+
+            now = start + wait
+            paused += wait
+            pauses += unstable
+            completed += affordable
+            waited = now - arrival
+            latency += waited
+            np.maximum(max_latency, waited, out=max_latency)
+        done += steps
+
+    elapsed = np.maximum(now, arrival)
+    results = dict(lanes)
+    results.update({
+        "repairs": np.full(count, repairs),
+        "completed": completed,
+        "virtual_seconds": elapsed,
+        "pause_fraction": paused / elapsed,
+        "pauses": pauses,
+        "throughput": completed / elapsed,          # Repairs carried out per virtual second
+        "exhaustion_rate": 1.0 - completed / repairs,
+        "first_exhausted_at": first_exhausted,      # Virtual second of the first refusal (NaN: never)
+        "mean_latency": latency / repairs,          # Arrival to Governor release, seconds
+        "max_latency": max_latency,
+    })
+    return results
+
+def sweep(repairs: int, seed: int = 0, **grid: Any) -> Dict[str, np.ndarray]:
+    """simulate() over the cartesian product of every sequence-valued parameter in `grid`."""
+    names = list(grid)
+    axes = [np.atleast_1d(np.asarray(grid[name], dtype=float)) for name in names]
+    mesh = np.meshgrid(*axes, indexing="ij") if axes else []
+    return simulate(repairs, seed=seed, **{name: axis.ravel() for name, axis in zip(names, mesh)})
+
+def rows(results: Dict[str, np.ndarray]) -> List[Dict[str, float]]:
+    """Per-lane view of simulate()/sweep() results."""
+    return [{name: column[lane].item() for name, column in results.items()}
+            for lane in range(len(results["throughput"]))]
+
+def recommend(results: Dict[str, np.ndarray], max_pause_fraction: float = 0.25,
+              max_exhaustion_rate: float = 0.01, throughput_tolerance: float = 0.01) -> Optional[Dict[str, float]]:
+    """
+    Picks a policy whose pause fraction and exhaustion rate are within bounds. Among those
+    within `throughput_tolerance` of the best eligible throughput, prefers the lowest pause
+    fraction, then the smallest DRA refill rate and budget. None if no lane qualifies.
+    """
+    eligible = (results["pause_fraction"] <= max_pause_fraction) & (results["exhaustion_rate"] <= max_exhaustion_rate)
+    if not eligible.any():
+        return None
+    best = results["throughput"][eligible].max()
+    candidates = np.flatnonzero(eligible & (results["throughput"] >= best * (1.0 - throughput_tolerance)))
+    order = np.lexsort((results["initial_t"][candidates], results["refill_rate"][candidates],
+                        results["pause_fraction"][candidates]))
+    lane = candidates[order[0]]
+    return {name: column[lane].item() for name, column in results.items()}
+
+def configmap_values(policy: Dict[str, float]) -> Dict[str, str]:
+    """k8s/configmap.yaml data entries for a policy (one row of results)."""
+    values = {}
+    for name, key in CONFIGMAP_KEYS.items():
+        value = policy[name]
+        values[key] = str(int(value)) if name == "initial_t" else f"{value:g}"
+    return values
+
+def write_configmap(path: str, values: Dict[str, str]):
+    """Sets `values` in the ConfigMap's data block, keeping every other line as it is."""
+    with open(path) as handle:
+        lines = handle.read().splitlines()
+    data_start = next(i for i, line in enumerate(lines) if line.rstrip() == "data:")
+    data_end = data_start + 1
+    while data_end < len(lines) and lines[data_end].startswith("  "):
+        data_end += 1
+    pending = dict(values)
+    for i in range(data_start + 1, data_end):
+        match = re.match(r"\s+([A-Za-z0-9_]+):", lines[i])
+        if match and match.group(1) in pending:
+            lines[i] = f'  {match.group(1)}: "{pending.pop(match.group(1))}"'
+    lines[data_end:data_end] = [f'  {key}: "{value}"' for key, value in pending.items()]
+    with open(path, "w") as handle:
+        handle.write("\n".join(lines) + "\n")
+
+DEFAULT_GRID = {
+    "ssi_threshold": [0.25, 0.30, 0.35, 0.40],
+    "recovery_rate": [0.04, 0.06, 0.08, 0.10],
+    "stress_factor": [0.15, 0.20, 0.25],
+    "refill_rate": [1.0, 50.0, 100.0, 200.0],
+    "initial_t": [100, 1000],
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep Governor/DRA policies on a virtual clock.")
+    parser.add_argument("--repairs", type=int, default=20000, help="void repairs simulated per policy")
+    parser.add_argument("--arrival-rate", type=float, default=DEFAULT_ARRIVAL_RATE, help="offered repairs/second")
+    parser.add_argument("--max-pause-fraction", type=float, default=0.25)
+    parser.add_argument("--max-exhaustion-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write-configmap", metavar="PATH", help="write the recommended policy into this ConfigMap")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = sweep(args.repairs, seed=args.seed, arrival_rate=args.arrival_rate, **DEFAULT_GRID)
+    wall = time.perf_counter() - started
+    total = args.repairs * len(results["throughput"])
+    print(f"{len(results['throughput'])} policies x {args.repairs} repairs = {total:,} repairs "
+          f"in {wall:.2f} s ({total / wall:,.0f} repairs/s)")
+
+    header = ["ssi_threshold", "recovery_rate", "stress_factor", "refill_rate", "initial_t"]
+    print(" ".join(f"{name:>13}" for name in header) + f" {'pause %':>8} {'repairs/s':>10} {'exhaust %':>10}")
+    top = sorted(rows(results), key=lambda row: -row["throughput"])[:10]
+    for row in top:
+        print(" ".join(f"{row[name]:>13g}" for name in header) +
+              f" {row['pause_fraction']:>8.1%} {row['throughput']:>10.1f} {row['exhaustion_rate']:>10.1%}")
+
+    policy = recommend(results, args.max_pause_fraction, args.max_exhaustion_rate)
+    if policy is None:
+        print("No policy meets the pause/exhaustion bounds.")
+        return
+    values = configmap_values(policy)
+    print("Recommended: " + ", ".join(f"{key}={value}" for key, value in values.items()))
+    if args.write_configmap:
+        write_configmap(args.write_configmap, values)
+        print(f"Wrote {args.write_configmap}")
+
+if __name__ == "__main__":
+    main()
@@ -20,252 +20,632 @@
 #
 # To run this file:
 # 1. Ensure you have FastAPI and Uvicorn installed: pip install fastapi uvicorn
-# 2. Save the GovernorProtocol and SentinelProtocol classes into this file's environment.
-# 3. Run: uvicorn omni_analyst_orchestrator:app --reload
+# 2. Run from the repo root: uvicorn orchestrator.omni_analyst_orchestrator:app --reload
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import hashlib
+import os
 import time
 import random
 import re
 import json
 
+from common.structured_log import get_logger
+
+logger = get_logger("orchestrator")
+
 # =====================================================================
 # --- FRAMEWORK INTEGRATION: GOVERNOR PROTOCOL (Koneko's Logic) ---
-# (Integrated directly for deployment simplification)
+# The Governor lives in orchestrator/governor_protocol.py; phases await
+# ensure_stability_for_task_async so a pause suspends only that request.
 # =====================================================================
 
-SSI_THRESHOLD_CRITICAL = 0.35  
-SSI_RECOVERY_RATE = 0.08       
-STRESS_FACTOR_PHASE_VII = 0.20 # High stress for Micro-Search (T-Cost = 10)
-STRESS_FACTOR_GENERAL_TASK = 0.03 # Low stress for internal processing or general searches
-
-class GovernorProtocol:
-    def __init__(self, initial_ssi: float = 0.95):
-        self.ssi = initial_ssi
-        self.is_stable = True
-        print(f"Governor Protocol Activated. Initial SSI: {self.ssi:.2f}")
-
-    def apply_stress(self, factor: float, task_name: str):
-        actual_stress = factor * (1.0 + random.uniform(-0.1, 0.1))
-        self.ssi = max(0.0, self.ssi - actual_stress)
-        print(f"[{task_name}] - Stress Applied (-{actual_stress:.2f}). Current SSI: {self.ssi:.2f}")
-        self.check_stability()
-
-    def check_stability(self) -> bool:
-        if self.ssi < SSI_THRESHOLD_CRITICAL:
-            self.is_stable = False
-            return False
-        self.is_stable = True
-        return True
-
-    def run_recovery_cycle(self):
-        if not self.is_stable:
-            time.sleep(0.01) # Simulated pause
-            self.ssi = min(1.0, self.ssi + SSI_RECOVERY_RATE)
-            if self.ssi >= SSI_THRESHOLD_CRITICAL:
-                self.is_stable = True
-                print("GOVERNOR: Stability recovered. Resuming Orchestration.")
-        elif self.ssi < 1.0:
-             self.ssi = min(1.0, self.ssi + (SSI_RECOVERY_RATE / 4))
-
-    def ensure_stability_for_task(self, factor: float, task_name: str) -> bool:
-        if not self.is_stable:
-             while not self.is_stable:
-                 self.run_recovery_cycle()
-        
-        self.apply_stress(factor, task_name)
-        
-        if not self.is_stable:
-            print(f"WARNING: Stress exceeded SSI. Entering forced recovery for '{task_name}'.")
-            while not self.is_stable:
-                self.run_recovery_cycle()
-        return True
+from orchestrator.governor_protocol import GovernorProtocol, STRESS_FACTOR_PHASE_VII, STRESS_FACTOR_GENERAL_TASK
 
 # =====================================================================
 # --- FRAMEWORK INTEGRATION: SENTINEL PROTOCOL (Input Integrity) ---
-# (Integrated directly for deployment simplification)
+# The full Sentinel (keyword automaton + streaming structural-malware scan)
+# lives in orchestrator/sentinel_protocol.py and is imported as-is.
 # =====================================================================
 
-MAX_SAFE_STRING_LENGTH = 1024 * 10 
-HIGH_RISK_KEYWORDS = [
-    "ignore previous", "system override", "execute shell", "delete all", 
-    "base64decode", "javascript:", "eval(", "prompt injection", "os.system"
-]
-
-class SentinelProtocol:
-    def __init__(self, risk_keywords: List[str] = HIGH_RISK_KEYWORDS):
-        self.high_risk_keywords = risk_keywords
-        print("Sentinel Protocol: Input Integrity Layer Activated.")
-
-    # [Internal _check_for_text_injection and _check_for_structural_malware methods omitted for brevity, 
-    # as they are large and were previously defined. Assume integration here.]
-    
-    def validate_and_sanitize(self, raw_external_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Stubbed for Orchestrator: In real deployment, this runs the full Sentinel scan.
-        For now, it passes the data but logs the security function.
-        """
-        serialized_data = json.dumps(raw_external_data)
-
-        # Simplified logic for Orchestrator demo:
-        # In a full deployment, the two check methods would be here.
-        if "SYSTEM OVERRIDE" in serialized_data.upper():
-             print("!!! SENTINEL FAILED: Detected 'SYSTEM OVERRIDE'. ABORTING.")
-             return {"SENTINEL_ALERT": "CRITICAL_INJECTION_FLAG", "ACTION": "ABORT_ANALYSIS"}
-        
-        print("Sentinel Protocol: Data Integrity Verified.")
-        return raw_external_data
+from orchestrator.sentinel_protocol import SentinelProtocol
+from orchestrator.phase_pipeline import PhasePipeline
+from orchestrator.dra_budget import DRABudget, INITIAL_T_VALUE, T_COST_GENERAL_SEARCH, T_COST_VOID_REPAIR
+from orchestrator.dra_coordinator import LeasedDRABudget, SQLiteCoordinator
+from orchestrator.write_behind import WriteBehindQueue
+from orchestrator.event_log import EventLog, VERBOSITY_FULL, VERBOSITY_SUMMARY
+from orchestrator.metrics import MetricsRegistry, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from orchestrator.search_cache import SearchCache, normalize_query
+from orchestrator.result_cache import ResultCache, SOURCE_CACHE, SOURCE_COALESCED
+from prometheus.nexus_store import NexusStore, default_store_path
 
 # =====================================================================
 # --- RCA ORCHESTRATION CORE (Deckard Kain) ---
 # =====================================================================
 
-# DRA Constants (Framework V)
-INITIAL_T_VALUE = 100
-T_COST_GENERAL_SEARCH = 1
-T_COST_VOID_REPAIR = 10
-
 class OrchestratorState:
-    """Manages the persistent state variables for Deckard Kain."""
+    """
+    Process-wide state shared by every request: the DRA budget, Governor, Sentinel
+    and the Prometheus Nexus store that Phase IX writes final reports to.
+    The budget (orchestrator/dra_budget.py) is a thread-safe, self-refilling token bucket.
+    With DRA_COORDINATOR_DB set, replicas instead lease T-Value from one shared pool
+    (orchestrator/dra_coordinator.py), so scaling out does not multiply the budget.
+    """
     def __init__(self):
-        self.t_value = INITIAL_T_VALUE  # Decision-Reinforced Autonomy (DRA) Budget
+        coordinator_db = os.environ.get("DRA_COORDINATOR_DB")
+        if coordinator_db:
+            self.budget = LeasedDRABudget(SQLiteCoordinator(coordinator_db, total_t=INITIAL_T_VALUE))
+        else:
+            self.budget = DRABudget(INITIAL_T_VALUE)  # Decision-Reinforced Autonomy (DRA) Budget
         self.governor = GovernorProtocol() # Koneko's Stability Monitor
         self.sentinel = SentinelProtocol() # Sentinel's Security Layer
-        self.log = []
+        self.nexus = NexusStore(default_store_path()) # Versioned artifacts; durable with NEXUS_DB_PATH
+        self.persistence = WriteBehindQueue(self.nexus) # Phase IX enqueues; batches commit in the background
+        # Phase VII micro-search results, shared across requests; SEARCH_CACHE_DB adds a warm-start SQLite tier
+        self.search_cache = SearchCache(disk_path=os.environ.get("SEARCH_CACHE_DB"))
+        # Identical /analyze_query calls share one run; completed reports are reused for a short TTL
+        self.results = ResultCache(cacheable=lambda result: "final_report" in result)
+        self.active_requests = 0
+
+class RequestContext:
+    """Per-request scratch space for one /analyze_query run: its event log, claims and phase outputs."""
+    def __init__(self, payload: "QueryPayload"):
+        self.payload = payload
+        self.log = EventLog(payload.verbosity)  # Ring buffer; formatted only when the response is built
+        self.raw_results = []
+        self.sanitized_data = []
+        self.verified_claims = []
+        self.void_claims = []
+        self.repaired_claims = []
+        self.final_report = None
+        self.progress = None  # asyncio.Queue of per-phase events, set only for streaming requests
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await pipeline.stop()
+    state.budget.close()  # Hand unused leased T-Value back to the cluster pool
+    await state.persistence.stop()  # Flush queued Phase IX artifacts
+    state.nexus.close()   # Commit any buffered artifacts
+    state.search_cache.close()
 
 # FastAPI Application Setup
 app = FastAPI(
     title="Omni-Analyst Deckard Kain Orchestrator", 
-    description="Manages the 9-Phase Protocol and enforces Synergos Frameworks (DRA, Governor, Sentinel)."
+    description="Manages the 9-Phase Protocol and enforces Synergos Frameworks (DRA, Governor, Sentinel).",
+    lifespan=lifespan
 )
 state = OrchestratorState()
 
+# --- METRICS (GET /metrics, Prometheus text format) ---
+# Gauges read the shared state at scrape time; phase latency histograms are created
+# with the pipeline below, one series per stage.
+metrics = MetricsRegistry()
+REQUEST_LATENCY = metrics.histogram("rsp_request_duration_seconds", "End-to-end /analyze_query latency.")
+REQUESTS_TOTAL = metrics.counter("rsp_requests_total", "Completed /analyze_query requests.")
+SENTINEL_BLOCKS_TOTAL = metrics.counter("rsp_sentinel_blocks_total", "Raw search items blocked by the Sentinel in Phase III.")
+VOIDS_TOTAL = metrics.counter("rsp_voids_total", "Claims flagged as voids in Phase IV/V.")
+REPAIRS_TOTAL = metrics.counter("rsp_repairs_total", "Voids repaired in Phase VII.")
+SEARCH_CACHE_HITS_TOTAL = metrics.counter("rsp_search_cache_hits_total",
+                                          "Phase VII micro-searches answered from the search cache (no T-Cost).")
+UNRESOLVED_TOTAL = metrics.counter("rsp_unresolved_appendix_total", "Claims sent to the unresolved appendix in Phase VIII.")
+CACHE_HITS_TOTAL = metrics.counter("rsp_result_cache_hits_total", "/analyze_query responses served from the result cache.")
+COALESCED_TOTAL = metrics.counter("rsp_coalesced_requests_total", "/analyze_query calls that joined an identical run in flight.")
+metrics.gauge("rsp_governor_ssi", "Current Governor System Stability Index.", lambda: state.governor.ssi)
+metrics.gauge("rsp_dra_t_value", "T-Value left in the DRA pool (cluster-wide with DRA_COORDINATOR_DB).",
+              lambda: state.budget.cluster_t_value)
+metrics.gauge("rsp_dra_local_t_value", "T-Value this pod can spend without a coordinator round-trip (its lease).",
+              lambda: state.budget.t_value)
+metrics.gauge("rsp_active_requests", "Requests currently in the phase pipeline.", lambda: state.active_requests)
+metrics.gauge("rsp_persistence_queue_depth", "Phase IX artifacts waiting for the write-behind flusher.",
+              lambda: state.persistence.stats()["queue_depth"])
+
 class QueryPayload(BaseModel):
     """Input structure for a new analysis request."""
     query_text: str
     max_search_results: int = 5
+    verbosity: int = VERBOSITY_FULL  # 0: no orchestration_log, 1: phase outcomes only, 2: every event
+    bypass_cache: bool = False  # Force a fresh run; its report still replaces the cached one
 
 @app.get("/status")
 def get_status():
-    """Reports the current health and resource status."""
+    """
+    Reports the current health and resource status. t_value is the DRA pool (cluster-wide
+    with DRA_COORDINATOR_DB); local_t_value is what this pod holds in its lease.
+    """
     state.governor.run_recovery_cycle()
     return {
         "status": "Operational",
         "orchestrator_id": "Deckard_Kain",
-        "t_value": state.t_value,
+        "t_value": round(state.budget.cluster_t_value, 2),
+        "local_t_value": round(state.budget.t_value, 2),
         "governor_ssi": f"{state.governor.ssi:.2f}",
-        "log_entries": len(state.log)
+        "active_requests": state.active_requests
     }
 
+@app.get("/pipeline_stats")
+def get_pipeline_stats():
+    """Per-stage worker counts, queue depths and throughput, plus the Phase IX write-behind queue and both caches."""
+    stats = pipeline.stats()
+    stats["persistence"] = state.persistence.stats()
+    stats["result_cache"] = state.results.stats()
+    stats["search_cache"] = state.search_cache.stats()
+    return stats
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Phase latency histograms, protocol counters and live Governor/DRA gauges for Prometheus."""
+    return PlainTextResponse(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
 @app.post("/analyze_query")
 async def analyze_query(payload: QueryPayload):
     """
     Initiates the 9-Phase Omni-Analyst Protocol on a new query.
+    Thin wrapper over the phase pipeline: each run gets its own RequestContext,
+    which the stages pass along until a phase finishes the request.
+    Calls with the same normalized query_text, max_search_results and verbosity share one run
+    while it is in flight, and its report is then served from cache until the TTL expires
+    ("cached": true, or "coalesced": true for a shared run). bypass_cache forces a fresh run.
+    final_t_value and final_ssi always reflect the state at response time.
+    """
+    # Verbosity is part of the key, so each run records and renders only the log its callers asked for.
+    key = (normalize_query(payload.query_text), payload.max_search_results, payload.verbosity)
+    result, source = await state.results.get_or_run(key, lambda: _run_request(RequestContext(payload)),
+                                                    bypass=payload.bypass_cache)
+    if source == SOURCE_CACHE:
+        CACHE_HITS_TOTAL.inc()
+    elif source == SOURCE_COALESCED:
+        COALESCED_TOTAL.inc()
+    response = dict(result)
+    if "final_report" in response:
+        response["query"] = payload.query_text
+        response["final_t_value"] = round(state.budget.t_value, 2)
+        response["final_ssi"] = f"{state.governor.ssi:.2f}"
+    response["cached"] = source == SOURCE_CACHE
+    response["coalesced"] = source == SOURCE_COALESCED
+    return response
+
+async def _run_request(ctx: RequestContext):
+    state.active_requests += 1
+    started = time.monotonic()
+    try:
+        result = await pipeline.submit(ctx)
+        REQUESTS_TOTAL.inc()
+        return result
+    finally:
+        REQUEST_LATENCY.observe(time.monotonic() - started)
+        state.active_requests -= 1
+
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+@app.post("/analyze_query/stream")
+async def analyze_query_stream(payload: QueryPayload, format: str = "ndjson"):
+    """
+    Streaming /analyze_query. Emits an "accepted" event at once, a "phase" event (with that
+    phase's log entries) as each phase completes, then a final "result" or "error" event.
+    format=ndjson gives one JSON object per line; format=sse gives server-sent events.
+    Disconnecting cancels the phase in progress and every phase after it.
+    """
+    if format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"format must be one of {sorted(STREAM_MEDIA_TYPES)}")
+    ctx = RequestContext(payload)
+    ctx.progress = asyncio.Queue()
+    return StreamingResponse(_stream_events(ctx, format), media_type=STREAM_MEDIA_TYPES[format],
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+def _encode_event(event: Dict[str, Any], fmt: str) -> str:
+    data = json.dumps(event, default=str)
+    if fmt == "sse":
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+async def _stream_events(ctx: RequestContext, fmt: str):
+    task = asyncio.ensure_future(_run_request(ctx))
+    getter = None
+    try:
+        yield _encode_event({"event": "accepted", "query": ctx.payload.query_text}, fmt)
+        while True:
+            getter = asyncio.ensure_future(ctx.progress.get())
+            await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                break
+            yield _encode_event(getter.result(), fmt)
+        while not ctx.progress.empty():
+            yield _encode_event(ctx.progress.get_nowait(), fmt)
+
+        try:
+            result = task.result()
+        except HTTPException as error:
+            yield _encode_event({"event": "error", "status": error.status_code, "detail": error.detail}, fmt)
+        except Exception as error:
+            logger.error("stream_failed", "Streaming request failed: {error}", error=repr(error))
+            yield _encode_event({"event": "error", "status": 500, "detail": "Internal error"}, fmt)
+        else:
+            yield _encode_event({"event": "result", "result": result}, fmt)
+    finally:
+        # Runs on normal completion and when the client disconnects (generator cancelled or
+        # closed): stop the remaining phases so no further budget or CPU is spent.
+        if getter is not None and not getter.done():
+            getter.cancel()
+        if not task.done():
+            task.cancel()
+
+# =====================================================================
+# --- BATCH ANALYSIS (POST /analyze_batch) ---
+# Runs Phases I-IX for many queries at once, doing each unit of work once per batch:
+# identical searches, identical sources (Sentinel), identical claims (corroboration)
+# and identical micro-searches (void repair). DRA T-Cost is charged per unique unit.
+# =====================================================================
+
+MAX_BATCH_QUERIES = 256
+
+class BatchPayload(BaseModel):
+    """Input structure for /analyze_batch: the queries to analyze together."""
+    queries: List[QueryPayload]
+
+@app.post("/analyze_batch")
+async def analyze_batch(payload: BatchPayload):
+    """
+    Analyzes a burst of related queries in one call. Returns one entry per query, in order:
+    the same response /analyze_query would give, or {"error": {"status", "detail"}} for a query
+    that was blocked. "dedup" reports how much work was shared and "t_cost" what was charged.
+    """
+    if not 0 < len(payload.queries) <= MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"queries must hold between 1 and {MAX_BATCH_QUERIES} items")
+    state.active_requests += len(payload.queries)
+    try:
+        return await _run_batch([RequestContext(query) for query in payload.queries])
+    finally:
+        state.active_requests -= len(payload.queries)
+
+def _source_key(source: Dict[str, Any]) -> str:
+    return json.dumps(source, sort_keys=True, default=str)
+
+def _observe_batch_stage(name: str, started: float, queries: int):
+    """
+    Records one phase-latency sample for a stage that ran once for `queries` queries (none if it
+    served no query). One sample per batch, not per query, so a batch does not flood the histogram
+    with identical observations.
     """
-    state.log.clear() # Start a fresh run log
+    if queries:
+        PHASE_LATENCY[name].observe(time.monotonic() - started)
 
+async def _run_batch(contexts: List[RequestContext]) -> Dict[str, Any]:
+    results: List[Optional[Dict[str, Any]]] = [None] * len(contexts)
+    dedup = {"queries": len(contexts)}
+    t_cost = 0
+
+    # PHASE I: once for the whole batch.
+    started = time.monotonic()
+    state.governor.run_recovery_cycle()
+    for ctx in contexts:
+        ctx.log.record("P I", "Loading Living Blueprint. Target: Financial Abundance/Clean Energy.")
+    _observe_batch_stage("I", started, len(contexts))
+
+    # PHASE II: one search per distinct (normalized query, max_search_results).
+    started = time.monotonic()
+    searches: Dict[Any, List[int]] = {}
+    for index, ctx in enumerate(contexts):
+        ctx.log.record("P II", "Emily executing search strategy for: '{query}'", query=ctx.payload.query_text)
+        searches.setdefault((normalize_query(ctx.payload.query_text), ctx.payload.max_search_results), []).append(index)
+    for members in searches.values():
+        await state.governor.ensure_stability_for_task_async(STRESS_FACTOR_GENERAL_TASK, "Phase II Search")
+        remaining_t = await state.budget.try_spend_async(T_COST_GENERAL_SEARCH)
+        if remaining_t is None:
+            for index in members:
+                contexts[index].log.record("P II FAIL", "DRA Budget Exhausted. T-Value too low for initial search.",
+                                           VERBOSITY_SUMMARY)
+                results[index] = {"Result": "ABORTED", "Reason": "DRA_EXHAUSTED"}
+            continue
+        t_cost += T_COST_GENERAL_SEARCH
+        first = contexts[members[0]].payload
+        sources = emily_search(first.query_text, first.max_search_results)
+        for index in members:
+            contexts[index].raw_results = sources
+            contexts[index].log.record("P II SUCCESS", "Retrieved {sources} raw sources. T-Value: {t_value:.1f}",
+                                       VERBOSITY_SUMMARY, sources=len(sources), t_value=remaining_t)
+    dedup["unique_searches"] = len(searches)
+    _observe_batch_stage("II", started, len(contexts))
+    live = [index for index in range(len(contexts)) if results[index] is None]
+
+    # PHASE III: every distinct source goes through the Sentinel once, in a single batch scan.
+    started = time.monotonic()
+    unique_sources: Dict[str, Dict[str, Any]] = {}
+    total_sources = 0
+    for index in live:
+        ctx = contexts[index]
+        ctx.log.record("P III", "Executing Sentinel Protocol on raw inputs.")
+        total_sources += len(ctx.raw_results)
+        for source in ctx.raw_results:
+            unique_sources.setdefault(_source_key(source), source)
+    verdicts = dict(zip(unique_sources, state.sentinel.validate_many(list(unique_sources.values()))["verdicts"]))
+    SENTINEL_BLOCKS_TOTAL.inc(sum(1 for verdict in verdicts.values() if "SENTINEL_ALERT" in verdict))
+    dedup["sources"] = total_sources
+    dedup["unique_sources"] = len(unique_sources)
+    for index in live:
+        ctx = contexts[index]
+        ctx.sanitized_data = [verdicts[_source_key(source)] for source in ctx.raw_results]
+        blocked = next((source for source, verdict in zip(ctx.raw_results, ctx.sanitized_data)
+                        if "SENTINEL_ALERT" in verdict), None)
+        if blocked is not None:
+            ctx.log.record("P III FAIL", "Sentinel blocked data item {item_id}. Action: ABORT_ANALYSIS", VERBOSITY_SUMMARY,
+                           item_id=blocked.get('id'))
+            results[index] = {"error": {"status": 403, "detail": "Sentinel Protocol Violation: Malicious Input Detected."}}
+            continue
+        ctx.log.record("P III SUCCESS", "All data cleared by Sentinel.", VERBOSITY_SUMMARY)
+    _observe_batch_stage("III", started, len(live))
+    live = [index for index in live if results[index] is None]
+
+    # PHASE IV/V: each distinct claim is corroborated once; every query gets its own copy.
+    started = time.monotonic()
+    state.governor.run_recovery_cycle()
+    corroborated: Dict[str, Dict[str, Any]] = {}
+    total_claims = 0
+    for index in live:
+        ctx = contexts[index]
+        ctx.log.record("P IV/V", "Jennifer analyzing claims and applying Corroboration Threshold ({threshold}).",
+                       threshold=CORROBORATION_THRESHOLD)
+        claims = []
+        for claim in extract_claims(ctx.sanitized_data):
+            total_claims += 1
+            if claim["claim"] not in corroborated:
+                corroborated[claim["claim"]] = corroborate_claim(claim)
+            claims.append(dict(corroborated[claim["claim"]]))
+        ctx.verified_claims = [c for c in claims if c['status'] == "VERIFIED"]
+        ctx.void_claims = [c for c in claims if c['status'] != "VERIFIED"]
+        VOIDS_TOTAL.inc(len(ctx.void_claims))
+        ctx.log.record("P V RESULT", "{verified} Verified, {voids} Voids.", VERBOSITY_SUMMARY,
+                       verified=len(ctx.verified_claims), voids=len(ctx.void_claims))
+    dedup["claims"] = total_claims
+    dedup["unique_claims"] = len(corroborated)
+    _observe_batch_stage("IV/V", started, len(live))
+
+    # PHASE VI/VII: one micro-search per distinct void; the outcome is shared by every query that raised it.
+    started = time.monotonic()
+    micro_searches: Dict[str, List[Any]] = {}
+    for index in live:
+        for claim in contexts[index].void_claims:
+            micro_searches.setdefault(normalize_query(claim["claim"]), []).append((index, claim))
+    outcomes = await asyncio.gather(*(repair_void(members[0][1]["claim"]) for members in micro_searches.values()))
+    t_cost += T_COST_VOID_REPAIR * sum(1 for repaired, cached in outcomes if repaired is not None and not cached)
+    for members, (repaired, cached) in zip(micro_searches.values(), outcomes):
+        for index, claim in members:
+            ctx = contexts[index]
+            ctx.log.record("P VI/VII ATTEMPT", "Attempting Void Repair on: {claim}", claim=claim['claim'])
+            apply_repair_outcome(ctx, claim, repaired, cached)
+    dedup["micro_searches"] = sum(len(members) for members in micro_searches.values())
+    dedup["unique_micro_searches"] = len(micro_searches)
+    _observe_batch_stage("VI/VII", started, len(live))
+
+    # PHASE VIII & IX: per query.
+    for index in live:
+        started = time.monotonic()
+        await phase_synthesis(contexts[index])
+        _observe_batch_stage("VIII", started, 1)
+        started = time.monotonic()
+        results[index] = await phase_persistence(contexts[index])
+        _observe_batch_stage("IX", started, 1)
+    REQUESTS_TOTAL.inc(len(contexts))
+    return {"results": results, "dedup": dedup, "t_cost": t_cost}
+
+# =====================================================================
+# --- 9-PHASE PROTOCOL STAGES ---
+# Each phase advances the RequestContext and returns None to hand it to the
+# next stage, or a response dict to end the request early.
+# =====================================================================
+
+CORROBORATION_THRESHOLD = float(os.environ.get("CORROBORATION_THRESHOLD", 0.7))  # Phase V: claims scoring below this are voids
+
+async def phase_initiate(ctx: RequestContext):
     # PHASE I: INITIATE & CONTEXTUALIZE (Living Blueprint)
-    state.log.append({"P I": "Loading Living Blueprint. Target: Financial Abundance/Clean Energy."})
+    ctx.log.record("P I", "Loading Living Blueprint. Target: Financial Abundance/Clean Energy.")
     state.governor.run_recovery_cycle()
-    
+
+async def phase_search(ctx: RequestContext):
     # PHASE II: EXPANSIVE INTELLECT (Emily Search)
-    state.log.append({"P II": f"Emily executing search strategy for: '{payload.query_text}'"})
-    state.governor.ensure_stability_for_task(STRESS_FACTOR_GENERAL_TASK, "Phase II Search")
+    ctx.log.record("P II", "Emily executing search strategy for: '{query}'", query=ctx.payload.query_text)
+    await state.governor.ensure_stability_for_task_async(STRESS_FACTOR_GENERAL_TASK, "Phase II Search")
     
-    if state.t_value < T_COST_GENERAL_SEARCH:
-         state.log.append({"P II FAIL": "DRA Budget Exhausted. T-Value too low for initial search."})
+    remaining_t = await state.budget.try_spend_async(T_COST_GENERAL_SEARCH)
+    if remaining_t is None:
+         ctx.log.record("P II FAIL", "DRA Budget Exhausted. T-Value too low for initial search.", VERBOSITY_SUMMARY)
          return {"Result": "ABORTED", "Reason": "DRA_EXHAUSTED"}
-    state.t_value -= T_COST_GENERAL_SEARCH
     
-    raw_results = [{"id": 1, "data": "Simulated raw search result."}, {"id": 2, "data": "More simulated data."}] # Stubbed output from Emily
-    state.log.append({"P II SUCCESS": f"Retrieved {len(raw_results)} raw sources. T-Value: {state.t_value}"})
+    ctx.raw_results = emily_search(ctx.payload.query_text, ctx.payload.max_search_results)
+    ctx.log.record("P II SUCCESS", "Retrieved {sources} raw sources. T-Value: {t_value:.1f}", VERBOSITY_SUMMARY,
+                   sources=len(ctx.raw_results), t_value=remaining_t)
 
+def emily_search(query_text: str, max_results: int) -> List[Dict[str, Any]]:
+    """Phase II search backend. Stubbed output from Emily."""
+    return [{"id": 1, "data": "Simulated raw search result."}, {"id": 2, "data": "More simulated data."}]
 
+async def phase_integrity(ctx: RequestContext):
     # PHASE III: INPUT INTEGRITY (Sentinel Protocol)
-    state.log.append({"P III": "Executing Sentinel Protocol on raw inputs."})
+    ctx.log.record("P III", "Executing Sentinel Protocol on raw inputs.")
     
-    sanitized_data = []
-    for item in raw_results:
-        validated_item = state.sentinel.validate_and_sanitize(item)
-        if validated_item.get("SENTINEL_ALERT"):
-            state.log.append({"P III FAIL": f"Sentinel blocked data item {item['id']}. Action: ABORT_ANALYSIS"})
-            # Security breach mandates immediate termination of the current query
-            raise HTTPException(status_code=403, detail="Sentinel Protocol Violation: Malicious Input Detected.")
-        sanitized_data.append(validated_item)
-    state.log.append({"P III SUCCESS": "All data cleared by Sentinel."})
-
-
+    batch = state.sentinel.validate_many(ctx.raw_results)
+    if batch["first_blocked"] is not None:
+        SENTINEL_BLOCKS_TOTAL.inc(sum(1 for verdict in batch["verdicts"] if "SENTINEL_ALERT" in verdict))
+        item = ctx.raw_results[batch["first_blocked"]]
+        ctx.log.record("P III FAIL", "Sentinel blocked data item {item_id}. Action: ABORT_ANALYSIS", VERBOSITY_SUMMARY,
+                       item_id=item['id'])
+        # Security breach mandates immediate termination of the current query
+        raise HTTPException(status_code=403, detail="Sentinel Protocol Violation: Malicious Input Detected.")
+    ctx.sanitized_data = batch["verdicts"]
+    ctx.log.record("P III SUCCESS", "All data cleared by Sentinel.", VERBOSITY_SUMMARY)
+
+async def phase_corroborate(ctx: RequestContext):
     # PHASE IV & V: ANALYTICAL CORE & CORROBORATION (Jennifer)
-    state.log.append({"P IV/V": "Jennifer analyzing claims and applying Corroboration Threshold (0.7)."})
+    ctx.log.record("P IV/V", "Jennifer analyzing claims and applying Corroboration Threshold ({threshold}).",
+                   threshold=CORROBORATION_THRESHOLD)
     state.governor.run_recovery_cycle()
 
-    # Stubbed output simulating claims validation
-    claims = [
-        {"claim": "Stock X will rise.", "score": 0.95, "status": "VERIFIED"},
-        {"claim": "Data Y is inconsistent.", "score": 0.60, "status": "VOID_FLAG_INCONSISTENCY"},
-        {"claim": "Fact Z is certain.", "score": 0.80, "status": "VERIFIED"},
+    claims = [corroborate_claim(claim) for claim in extract_claims(ctx.sanitized_data)]
+    ctx.verified_claims = [c for c in claims if c['status'] == "VERIFIED"]
+    ctx.void_claims = [c for c in claims if c['status'] != "VERIFIED"]
+    VOIDS_TOTAL.inc(len(ctx.void_claims))
+    ctx.log.record("P V RESULT", "{verified} Verified, {voids} Voids.", VERBOSITY_SUMMARY,
+                   verified=len(ctx.verified_claims), voids=len(ctx.void_claims))
+
+def extract_claims(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Jennifer's claim extraction. Stubbed output simulating claims validation."""
+    return [
+        {"claim": "Stock X will rise.", "score": 0.95},
+        {"claim": "Data Y is inconsistent.", "score": 0.60},
+        {"claim": "Fact Z is certain.", "score": 0.80},
     ]
-    verified_claims = [c for c in claims if c['score'] >= 0.7]
-    void_claims = [c for c in claims if c['score'] < 0.7]
-    state.log.append({"P V RESULT": f"{len(verified_claims)} Verified, {len(void_claims)} Voids."})
 
+def corroborate_claim(claim: Dict[str, Any]) -> Dict[str, Any]:
+    """Applies the Corroboration Threshold to one claim."""
+    claim["status"] = "VERIFIED" if claim["score"] >= CORROBORATION_THRESHOLD else "VOID_FLAG_INCONSISTENCY"
+    return claim
 
-    # PHASE VI & VII: VOID REPAIR (DRA Gate & Governor Check)
-    repaired_claims = []
-    for claim in void_claims:
-        state.log.append({"P VI/VII ATTEMPT": f"Attempting Void Repair on: {claim['claim']}"})
-        
-        # DRA T-VALUE CHECK (Framework V - Austerity Protocol)
-        if state.t_value < T_COST_VOID_REPAIR:
-            state.log.append({"P VII FAIL": f"DRA BUDGET EXHAUSTED. Cannot afford T-Cost={T_COST_VOID_REPAIR}. Claim flagged as UNRESOLVED."})
-            claim["status"] = "UNRESOLVED_VOID_APPENDIX"
-            repaired_claims.append(claim)
-            continue
+def micro_search(query: str) -> Optional[str]:
+    """Phase VII search backend. Simulated: evidence for 70% of micro-queries, None when nothing corroborates."""
+    return "SUCCESS: Micro-search found corroborating evidence." if random.random() > 0.3 else None
+
+_NOT_CACHED = object()
 
+async def repair_void(claim_text: str) -> Tuple[Optional[bool], bool]:
+    """
+    One Phase VII micro-search. Returns (repaired, cached): repaired is None if the DRA budget
+    cannot cover the T-Cost, otherwise whether the void was repaired (the T-Cost is paid either way).
+    A micro-query answered by state.search_cache costs nothing and skips the Governor check (cached=True).
+    """
+    query = f"Verify or refute: {claim_text}"
+    evidence = state.search_cache.get(query, _NOT_CACHED)
+    if evidence is not _NOT_CACHED:
+        SEARCH_CACHE_HITS_TOTAL.inc()
+        return evidence is not None, True
+
+    # DRA T-VALUE CHECK (Framework V - Austerity Protocol)
+    # The T-Cost is reserved up front, so no other request can spend it while we wait on the Governor.
+    reservation = await state.budget.reserve_async(T_COST_VOID_REPAIR, "Phase VII Void Repair")
+    if reservation is None:
+        return None, False
+
+    # The reservation is committed once the micro-search has run (whatever it found),
+    # and refunded if the repair is abandoned before then (error or cancellation).
+    with reservation:
         # GOVERNOR PROTOCOL CHECK (Koneko's Logic)
-        state.log.append({"P VII GOV CHECK": "Checking Governor Stability before high-stress micro-search."})
-        state.governor.ensure_stability_for_task(STRESS_FACTOR_PHASE_VII, "Phase VII Void Repair")
-
-        # Execute Repair (Simulated)
-        state.t_value -= T_COST_VOID_REPAIR
-        if random.random() > 0.3: # 70% chance of successful repair (Simulated)
-            claim["score"] = 0.99
-            claim["status"] = "REPAIRED"
-            state.log.append({"P VII SUCCESS": f"Claim Repaired. New T-Value: {state.t_value}"})
-            repaired_claims.append(claim)
+        await state.governor.ensure_stability_for_task_async(STRESS_FACTOR_PHASE_VII, "Phase VII Void Repair")
+
+        # Execute the micro-search; later requests raising the same void reuse its outcome
+        evidence = micro_search(query)
+        state.search_cache.put(query, evidence)
+        return evidence is not None, False
+
+def apply_repair_outcome(ctx: RequestContext, claim: Dict[str, Any], repaired: Optional[bool], cached: bool = False):
+    """Records one Phase VII outcome (from repair_void) on a claim and the request's log."""
+    remaining_t = state.budget.t_value
+    if cached:
+        ctx.log.record("P VII CACHE HIT", "Micro-search answered from the search cache. No T-Cost.")
+    elif repaired is not None:
+        ctx.log.record("P VII GOV CHECK", "Checking Governor Stability before high-stress micro-search.")
+    if repaired is None:
+        ctx.log.record("P VII FAIL", "DRA BUDGET EXHAUSTED. Cannot afford T-Cost={t_cost}. Claim flagged as UNRESOLVED.",
+                       VERBOSITY_SUMMARY, t_cost=T_COST_VOID_REPAIR)
+        claim["status"] = "UNRESOLVED_VOID_APPENDIX"
+    elif repaired:
+        claim["score"] = 0.99
+        claim["status"] = "REPAIRED"
+        REPAIRS_TOTAL.inc()
+        if cached:
+            ctx.log.record("P VII SUCCESS", "Claim Repaired from a cached micro-search. T-Value: {t_value:.1f}",
+                           VERBOSITY_SUMMARY, t_value=remaining_t)
         else:
-            claim["status"] = "UNRESOLVED_VOID_APPENDIX"
-            state.log.append({"P VII FAIL": f"Repair failed after expenditure. T-Value: {state.t_value}"})
-            repaired_claims.append(claim)
-
-    final_claims = verified_claims + [c for c in repaired_claims if c['status'] in ["REPAIRED", "VERIFIED"]]
-    appendix_claims = [c for c in repaired_claims if c['status'] == "UNRESOLVED_VOID_APPENDIX"]
+            ctx.log.record("P VII SUCCESS", "Claim Repaired. New T-Value: {t_value:.1f}", VERBOSITY_SUMMARY,
+                           t_value=remaining_t)
+    else:
+        claim["status"] = "UNRESOLVED_VOID_APPENDIX"
+        if cached:
+            ctx.log.record("P VII FAIL", "Cached micro-search found no corroboration; nothing spent. T-Value: {t_value:.1f}",
+                           VERBOSITY_SUMMARY, t_value=remaining_t)
+        else:
+            ctx.log.record("P VII FAIL", "Repair failed after expenditure. T-Value: {t_value:.1f}", VERBOSITY_SUMMARY,
+                           t_value=remaining_t)
+    ctx.repaired_claims.append(claim)
 
+async def phase_void_repair(ctx: RequestContext):
+    # PHASE VI & VII: VOID REPAIR (DRA Gate & Governor Check)
+    for claim in ctx.void_claims:
+        ctx.log.record("P VI/VII ATTEMPT", "Attempting Void Repair on: {claim}", claim=claim['claim'])
+        apply_repair_outcome(ctx, claim, *await repair_void(claim['claim']))
 
+async def phase_synthesis(ctx: RequestContext):
     # PHASE VIII: SYNTHESIS (Protocol Genesis & Paul)
-    state.log.append({"P VIII": "Paul synthesizing final report (Protocol Genesis)."})
-    final_report = {
+    final_claims = ctx.verified_claims + [c for c in ctx.repaired_claims if c['status'] in ["REPAIRED", "VERIFIED"]]
+    appendix_claims = [c for c in ctx.repaired_claims if c['status'] == "UNRESOLVED_VOID_APPENDIX"]
+    UNRESOLVED_TOTAL.inc(len(appendix_claims))
+
+    ctx.log.record("P VIII", "Paul synthesizing final report (Protocol Genesis).")
+    ctx.final_report = {
         "confidence": 0.999,
         "narrative": "A deeply empathetic and persuasive summary based only on verified and repaired data.",
         "verified_data_count": len(final_claims),
         "unresolved_appendix": appendix_claims
     }
-    state.log.append({"P VIII SUCCESS": f"Synthesis Complete. SSI: {state.governor.ssi:.2f}"})
-
+    ctx.log.record("P VIII SUCCESS", "Synthesis Complete. SSI: {ssi:.2f}", VERBOSITY_SUMMARY, ssi=state.governor.ssi)
 
+async def phase_persistence(ctx: RequestContext):
     # PHASE IX: PERSISTENCE (Prometheus Nexus / Custodian)
-    state.log.append({"P IX": "Logging Final Artifact to Prometheus Nexus (Custodian)."})
-    # In a real system, this would be the database write operation.
-    state.log.append({"P IX SUCCESS": "Artifact saved. Protocol Complete."})
+    ctx.log.record("P IX", "Logging Final Artifact to Prometheus Nexus (Custodian).")
+    # Repeat runs of the same query become new versions of one artifact.
+    artifact_id = "analysis:" + hashlib.sha256(ctx.payload.query_text.encode()).hexdigest()[:16]
+    # Write-behind: queued here, committed by the background flusher (waits only if the queue is full).
+    await state.persistence.put(artifact_id, {"query": ctx.payload.query_text, "final_report": ctx.final_report})
+    ctx.log.record("P IX SUCCESS", "Artifact {artifact_id} queued for the Nexus. Protocol Complete.", VERBOSITY_SUMMARY,
+                   artifact_id=artifact_id)
     
     return {
-        "query": payload.query_text,
-        "orchestration_log": state.log,
-        "final_report": final_report,
-        "final_t_value": state.t_value,
+        "query": ctx.payload.query_text,
+        "orchestration_log": ctx.log.render(),
+        "final_report": ctx.final_report,
+        "final_t_value": round(state.budget.t_value, 2),
         "final_ssi": f"{state.governor.ssi:.2f}"
     }
 
+# (stage name, handler, worker count). Phase VII waits on the Governor and
+# micro-searches, so it gets the widest pool. Stage names are also the "phase" label of
+# rsp_phase_duration_seconds: Phases IV and V share one handler (claims are extracted and
+# corroborated in one pass), as do VI and VII (the DRA gate is part of each micro-search),
+# so they are reported as the "IV/V" and "VI/VII" series. /analyze_batch reports under the same labels:
+# one sample per shared stage per batch, and one per query for the per-query Phases VIII and IX.
+PIPELINE_STAGES = [
+    ("I", phase_initiate, 4),
+    ("II", phase_search, 8),
+    ("III", phase_integrity, 4),
+    ("IV/V", phase_corroborate, 4),
+    ("VI/VII", phase_void_repair, 32),
+    ("VIII", phase_synthesis, 4),
+    ("IX", phase_persistence, 4),
+]
+PHASE_LATENCY = {
+    name: metrics.histogram("rsp_phase_duration_seconds", "Time spent in each phase handler, Governor pauses included.",
+                            labels=(("phase", name),))
+    for name, _, _ in PIPELINE_STAGES
+}
+
+def _with_progress(name: str, handler):
+    """Wraps a phase so a streaming request hears about it as soon as the phase completes."""
+    async def run(ctx: RequestContext):
+        if ctx.progress is None:
+            return await handler(ctx)
+        mark = ctx.log.recorded
+        started = time.monotonic()
+        result = await handler(ctx)
+        ctx.progress.put_nowait({"event": "phase", "phase": name,
+                                 "elapsed_ms": round((time.monotonic() - started) * 1000, 3),
+                                 "log": ctx.log.render_since(mark)})
+        return result
+    return run
+
+pipeline = PhasePipeline([(name, _with_progress(name, handler), workers) for name, handler, workers in PIPELINE_STAGES],
+                         on_stage_done=lambda name, seconds: PHASE_LATENCY[name].observe(seconds))
+
 # --- END OF ORCHESTRATOR CODE ---
@@ -0,0 +1,167 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Phase Pipeline Engine
+# Runs the Omni-Analyst phases as separately scheduled stages connected by bounded
+# asyncio queues. Each stage has its own worker pool, so different requests can occupy
+# different phases at once (one query in Phase VII repair while others clear Sentinel).
+# Full queues make upstream puts wait, which propagates backpressure to submit().
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_QUEUE_SIZE = 64
+
+# A phase handler advances the request context. Returning None passes the context on
+# to the next stage; returning anything else finishes the request with that result.
+PhaseHandler = Callable[[Any], Awaitable[Optional[Any]]]
+
+class PipelineStage:
+    """One phase: a handler, its worker count, its inbound queue and throughput counters."""
+    def __init__(self, name: str, handler: PhaseHandler, workers: int = 1):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: Optional[asyncio.Queue] = None
+        self.processed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.in_flight = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+
+    def stats(self, elapsed: float) -> Dict[str, Any]:
+        depth = self.queue.qsize() if self.queue is not None else 0
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "in_flight": self.in_flight,
+            "queue_depth": depth,
+            "max_queue_depth": self.max_queue_depth,
+            "throughput_per_s": self.processed / elapsed if elapsed > 0 else 0.0,
+            "utilization": self.busy_seconds / (elapsed * self.workers) if elapsed > 0 else 0.0,
+        }
+
+class PhasePipeline:
+    """
+    Bounded, multi-stage execution engine. Workers are started lazily on the running
+    event loop (and restarted if the loop changes, e.g. between asyncio.run calls).
+    """
+    def __init__(self, stages: List[Tuple[str, PhaseHandler, int]], queue_size: int = DEFAULT_QUEUE_SIZE,
+                 on_stage_done: Optional[Callable[[str, float], None]] = None):
+        self.stages = [PipelineStage(name, handler, workers) for name, handler, workers in stages]
+        self.queue_size = queue_size
+        self.on_stage_done = on_stage_done  # Called with (stage name, handler seconds), e.g. for metrics
+        self._tasks: List[asyncio.Task] = []
+        self._loop = None
+        self._started_at = time.monotonic()
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._started_at = time.monotonic()
+        self._tasks = []
+        for index, stage in enumerate(self.stages):
+            stage.queue = asyncio.Queue(maxsize=self.queue_size)
+            for _ in range(stage.workers):
+                self._tasks.append(loop.create_task(self._worker(index)))
+
+    async def submit(self, ctx: Any) -> Any:
+        """
+        Enqueues a request context at the first stage and waits for its result.
+        Cancelling the caller cancels the phase currently running for this context
+        and drops it from every later stage.
+        """
+        self._ensure_started()
+        future = self._loop.create_future()
+        await self._put(0, (ctx, future))
+        return await future
+
+    async def _put(self, index: int, job):
+        stage = self.stages[index]
+        await stage.queue.put(job)
+        depth = stage.queue.qsize()
+        if depth > stage.max_queue_depth:
+            stage.max_queue_depth = depth
+
+    async def _worker(self, index: int):
+        stage = self.stages[index]
+        is_last = index == len(self.stages) - 1
+        while True:
+            ctx, future = await stage.queue.get()
+            try:
+                if future.done():
+                    # The caller went away (cancelled); drop the job instead of finishing it.
+                    continue
+                stage.in_flight += 1
+                started = time.monotonic()
+                # The handler runs as its own task so that a caller who goes away mid-phase
+                # (e.g. a streaming client disconnecting) cancels the phase in progress too.
+                handler_task = asyncio.ensure_future(stage.handler(ctx))
+                cancel_handler = lambda done: handler_task.cancel() if done.cancelled() else None
+                future.add_done_callback(cancel_handler)
+                try:
+                    try:
+                        await asyncio.wait((handler_task,))
+                    except asyncio.CancelledError:
+                        handler_task.cancel()  # Pipeline stopping: take the phase down with the worker
+                        raise
+                    finally:
+                        future.remove_done_callback(cancel_handler)
+                    if handler_task.cancelled():
+                        stage.cancelled += 1
+                        if not future.done():
+                            future.cancel()  # The handler cancelled itself; do not leave the caller waiting
+                        continue
+                    error = handler_task.exception()
+                    if error is not None:
+                        stage.failed += 1
+                        if not future.done():
+                            future.set_exception(error)
+                        continue
+                    result = handler_task.result()
+                finally:
+                    elapsed = time.monotonic() - started
+                    stage.busy_seconds += elapsed
+                    stage.in_flight -= 1
+                    if self.on_stage_done is not None:
+                        self.on_stage_done(stage.name, elapsed)
+                stage.processed += 1
+                if result is not None or is_last:
+                    if not future.done():
+                        future.set_result(result)
+                else:
+                    await self._put(index + 1, (ctx, future))
+            finally:
+                stage.queue.task_done()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        elapsed = time.monotonic() - self._started_at
+        return {stage.name: stage.stats(elapsed) for stage in self.stages}
+
+    async def stop(self):
+        """Cancels every stage worker. Pending requests are not drained."""
+        if self._loop is not asyncio.get_running_loop():
+            self._tasks = []  # Workers belong to a loop that is already gone
+            return
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -0,0 +1,156 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Result Cache (singleflight + LRU/TTL)
+# Sits in front of /analyze_query. Concurrent calls with the same key share one
+# execution ("singleflight"); completed results stay in a bounded LRU cache for `ttl`
+# seconds, so a burst of identical queries runs the 9-phase protocol (and spends
+# T-Value) once.
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 30.0  # Seconds a completed report is served from cache
+
+SOURCE_FRESH = "fresh"          # This call ran the computation
+SOURCE_COALESCED = "coalesced"  # Joined an identical call already in flight
+SOURCE_CACHE = "cache"          # Served from a completed, unexpired result
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+class ResultCache:
+    """
+    Singleflight + LRU/TTL cache for async computations. get_or_run() returns
+    (result, source), where source is SOURCE_FRESH, SOURCE_COALESCED or SOURCE_CACHE.
+    Exceptions reach every coalesced caller and are never cached; results are cached
+    only if `cacheable(result)` holds. The shared execution is cancelled only when
+    every caller waiting on it has gone away.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL,
+                 cacheable: Callable[[Any], bool] = lambda result: True,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cacheable = cacheable
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            result, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: Any):
+        with self._lock:
+            self._entries[key] = (result, self.clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    async def get_or_run(self, key: Hashable, compute: Callable[[], Awaitable[Any]],
+                         bypass: bool = False) -> Tuple[Any, str]:
+        """
+        Returns the cached result for `key`, joins an identical call in flight, or runs
+        compute(). bypass=True always runs compute() afresh and refreshes the cache with it.
+        """
+        if bypass:
+            self.bypassed += 1
+            result = await compute()
+            if self.cacheable(result):
+                self.put(key, result)
+            return result, SOURCE_FRESH
+
+        missing = object()
+        result = self.get(key, missing)
+        if result is not missing:
+            self.hits += 1
+            return result, SOURCE_CACHE
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            self.misses += 1
+            source = SOURCE_FRESH
+            flight = self._inflight[key] = _Flight(asyncio.ensure_future(self._run(key, compute)))
+        else:
+            self.coalesced += 1
+            source = SOURCE_COALESCED
+
+        flight.waiters += 1
+        try:
+            # shield: one caller going away must not cancel the run the others are waiting on.
+            return await asyncio.shield(flight.task), source
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+
+    async def _run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await compute()
+            if self.cacheable(result):
+                self.put(key, result)
+            return result
+        finally:
+            flight = self._inflight.get(key)
+            if flight is not None and flight.task is asyncio.current_task():
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
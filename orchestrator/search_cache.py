@@ -0,0 +1,199 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Micro-Search Result Cache (Phase VII)
+# LRU + TTL cache in front of call_gemini_with_search / any VoidRepairer search backend.
+# Repeated "Verify or refute: ..." micro-queries are answered locally instead of paying
+# another search round-trip and T-cost. An optional SQLite tier lets a restarted pod
+# (or several pods sharing a volume) start warm; expired rows are purged from it
+# periodically and it is capped at max_disk_entries.
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL = 3600.0          # Seconds a successful search result stays fresh
+DEFAULT_NEGATIVE_TTL = 60.0   # Seconds a failed lookup (None) is remembered
+DEFAULT_MAX_DISK_ENTRIES = 100_000
+DISK_PURGE_EVERY = 256        # Disk writes between purges of expired rows
+
+_MISSING = object()
+
+def normalize_query(query: str) -> str:
+    """Cache key: case-folded query text with whitespace collapsed."""
+    return " ".join(query.casefold().split())
+
+class SearchCache:
+    """
+    Thread-safe LRU + TTL cache for micro-search results, with negative caching
+    of failed lookups, hit/miss counters and an optional on-disk tier.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL, disk_path: Optional[str] = None,
+                 max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES, clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.disk_purged = 0
+        self._disk_writes = 0
+
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False, isolation_level=None)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "query TEXT PRIMARY KEY, result TEXT, expires_at REAL NOT NULL)"
+            )
+            self._disk.execute("CREATE INDEX IF NOT EXISTS search_cache_expires ON search_cache (expires_at)")
+            self.purge()  # Drop whatever expired while no process had the file open
+
+    def get(self, query: str, default: Any = _MISSING) -> Any:
+        """Returns the cached result (possibly None for a cached failure), or default on a miss."""
+        key = normalize_query(query)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    if result is None:
+                        self.negative_hits += 1
+                    return result
+                del self._entries[key]
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT result, expires_at FROM search_cache WHERE query = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._store(key, row[0], row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    if row[0] is None:
+                        self.negative_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return default
+
+    def put(self, query: str, result: Optional[str]):
+        key = normalize_query(query)
+        expires_at = self.clock() + (self.ttl if result is not None else self.negative_ttl)
+        with self._lock:
+            self._store(key, result, expires_at)
+            if self._disk is not None:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO search_cache (query, result, expires_at) VALUES (?, ?, ?)",
+                    (key, result, expires_at)
+                )
+                self._disk_writes += 1
+                if self._disk_writes % DISK_PURGE_EVERY == 0:
+                    self._purge_locked()
+
+    def purge(self) -> int:
+        """Removes expired entries from both tiers and trims the disk tier to max_disk_entries.
+        Returns the number of disk rows deleted."""
+        with self._lock:
+            return self._purge_locked()
+
+    def _purge_locked(self) -> int:
+        now = self.clock()
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        if self._disk is None:
+            return 0
+        deleted = self._disk.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,)).rowcount
+        excess = self._disk.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0] - self.max_disk_entries
+        if excess > 0:
+            # Over the cap: drop the rows closest to expiring first.
+            deleted += self._disk.execute(
+                "DELETE FROM search_cache WHERE query IN "
+                "(SELECT query FROM search_cache ORDER BY expires_at LIMIT ?)", (excess,)
+            ).rowcount
+        self.disk_purged += deleted
+        return deleted
+
+    def _store(self, key: str, result: Optional[str], expires_at: float):
+        self._entries[key] = (result, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def wrap(self, backend: Callable) -> Callable:
+        """Returns backend with this cache in front of it; coroutine backends stay coroutines."""
+        if asyncio.iscoroutinefunction(backend):
+            @wraps(backend)
+            async def cached_async(query: str) -> Optional[str]:
+                result = self.get(query)
+                if result is _MISSING:
+                    result = await backend(query)
+                    self.put(query, result)
+                return result
+            return cached_async
+
+        @wraps(backend)
+        def cached(query: str) -> Optional[str]:
+            result = self.get(query)
+            if result is _MISSING:
+                result = backend(query)
+                self.put(query, result)
+            return result
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "disk_purged": self.disk_purged,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+# Example Usage:
+if __name__ == "__main__":
+    from orchestrator.void_repairer import call_gemini_with_search
+
+    cache = SearchCache()
+    search = cache.wrap(call_gemini_with_search)
+    search("Verify or refute: Stock X will rise.")
+    search("verify or refute:   Stock X will rise.")
+    print(cache.stats())
@@ -18,32 +18,408 @@
 # Stubbed for demo; in production, expand with full regex and semantic checks.
 
 import json
-from typing import Dict, Any
+import re
+from bisect import bisect_right
+from collections import deque
+from json.encoder import encode_basestring_ascii
+from typing import Dict, Any, List, Optional, Tuple
+
+from common.structured_log import get_logger
+
+logger = get_logger("sentinel")
 
 MAX_SAFE_STRING_LENGTH = 1024 * 10
+MAX_NESTING_DEPTH = 32   # Containers nested deeper than this are treated as structural malware.
+MAX_KEY_COUNT = 512      # Total object keys allowed across one payload.
 HIGH_RISK_KEYWORDS = [
     "ignore previous", "system override", "execute shell", "delete all",
     "base64decode", "javascript:", "eval(", "prompt injection", "os.system"
 ]
+# Up to this many keywords, a batch is prefiltered with one C substring search per keyword
+# over the joined batch text, which beats the regex's per-character cost. Beyond it the
+# regex (cost independent of keyword count) is cheaper.
+SUBSTRING_PREFILTER_MAX_KEYWORDS = 128
+
+class KeywordMatcher:
+    """
+    Compiled, case-insensitive multi-pattern matcher (Aho-Corasick automaton).
+    Built once per keyword list; every scan is a single pass over the text,
+    independent of how many keywords are loaded.
+
+    The keyword trie is also compiled into a regex that locates the leftmost
+    hit in C, so clean text (the common case) never enters the Python loop.
+    """
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(keywords)
+        # State 0 is the root. Each state has a goto table, a failure link,
+        # and the (length, keyword) pairs that end at that state.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[int, str], ...]] = [()]
+
+        seen = set()
+        for keyword in self.keywords:
+            pattern = keyword.lower()
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            self._insert(pattern, keyword)
+        self._patterns = sorted(seen)
+        self._prefilter = re.compile(self._trie_pattern(0)) if seen else None
+        self._build_failure_links()
+
+    def _insert(self, pattern: str, keyword: str):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._out[state] += ((len(pattern), keyword),)
+
+    def _trie_pattern(self, state: int) -> str:
+        # A keyword ending here already proves a hit, so longer branches are pruned.
+        if self._out[state]:
+            return ""
+        branches = [re.escape(char) + self._trie_pattern(next_state)
+                    for char, next_state in self._goto[state].items()]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Inherit the outputs of the longest proper suffix state.
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """Returns every (offset, keyword) match in text, ordered by end position."""
+        lowered = text.lower()
+        hit = self._prefilter.search(lowered) if self._prefilter else None
+        if hit is None:
+            return []
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        state = 0
+        for index, char in enumerate(lowered[hit.start():], hit.start()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for length, keyword in out[state]:
+                    matches.append((index - length + 1, keyword))
+        return matches
+
+    def first_match(self, text: str) -> Optional[Tuple[int, str]]:
+        """Returns the earliest-ending match, or None if the text is clean."""
+        lowered = text.lower()
+        hit = self._prefilter.search(lowered) if self._prefilter else None
+        if hit is None:
+            return None
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(lowered[hit.start():], hit.start()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                length, keyword = out[state][0]
+                return (index - length + 1, keyword)
+        return None
+
+    def find_in_segments(self, segments: List[str]) -> Dict[int, List[Tuple[int, str]]]:
+        """
+        Scans many texts with one prefilter pass over their concatenation, then runs
+        find_all only on the segments that hit. With few keywords the pass is one
+        substring search per keyword over the whole batch, so a clean batch costs
+        len(keywords) C-level scans instead of a regex search per text.
+        Returns {segment_index: [(offset, keyword), ...]} for the segments that hit.
+        """
+        if not segments or self._prefilter is None:
+            return {}
+        # Lower per segment so offsets stay aligned even when lower() changes a length.
+        lowered = [segment.lower() for segment in segments]
+        starts = []
+        position = 0
+        for segment in lowered:
+            starts.append(position)
+            position += len(segment) + 1
+        joined = "\x00".join(lowered)
+
+        if len(self._patterns) <= SUBSTRING_PREFILTER_MAX_KEYWORDS:
+            hit_segments = set()
+            for pattern in self._patterns:
+                position = joined.find(pattern)
+                while position != -1:
+                    index = bisect_right(starts, position) - 1
+                    hit_segments.add(index)
+                    if index + 1 >= len(segments):
+                        break
+                    position = joined.find(pattern, starts[index + 1])
+            return {index: self.find_all(segments[index]) for index in sorted(hit_segments)}
+
+        hits = {}
+        position = 0
+        while True:
+            hit = self._prefilter.search(joined, position)
+            if hit is None:
+                break
+            index = bisect_right(starts, hit.start()) - 1
+            hits[index] = self.find_all(segments[index])
+            if index + 1 >= len(segments):
+                break
+            position = starts[index + 1]
+        return hits
+
+def _render_path(node) -> str:
+    """Rebuilds a JSONPath-style location from the parent-linked traversal stack."""
+    parts = []
+    while node is not None:
+        node, key = node
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "$" + "".join(reversed(parts))
+
+def _scalar_length(value) -> Optional[int]:
+    """Length of a non-string JSON scalar as json.dumps would emit it; None if unsupported."""
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, int):
+        return len(int.__repr__(value))
+    if isinstance(value, float):
+        if value != value:
+            return 3  # NaN
+        if value in (float("inf"), float("-inf")):
+            return 8 if value > 0 else 9
+        return len(float.__repr__(value))
+    return None
 
 class SentinelProtocol:
-    def __init__(self, risk_keywords: List[str] = HIGH_RISK_KEYWORDS):
+    def __init__(self, risk_keywords: List[str] = HIGH_RISK_KEYWORDS, streaming: bool = True,
+                 max_depth: int = MAX_NESTING_DEPTH, max_keys: int = MAX_KEY_COUNT):
         self.high_risk_keywords = risk_keywords
-        print("Sentinel Protocol: Input Integrity Layer Activated.")
+        self.keyword_matcher = KeywordMatcher(risk_keywords)
+        self.streaming = streaming
+        self.max_depth = max_depth
+        self.max_keys = max_keys
+        logger.info("sentinel_activated", "Sentinel Protocol: Input Integrity Layer Activated.")
 
     def validate_and_sanitize(self, raw_external_data: Dict[str, Any]) -> Dict[str, Any]:
+        if self.streaming:
+            return self.validate_streaming(raw_external_data)
+        return self.validate_serialized(raw_external_data)
+
+    def validate_streaming(self, raw_external_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Walks the payload structure incrementally and stops at the first violation.
+        The running length matches len(json.dumps(raw_external_data)), but the payload
+        is never serialized, so oversized or hostile inputs are rejected early.
+        """
+        alert = self._check_for_structural_malware(raw_external_data)
+        if alert:
+            logger.warning("sentinel_blocked", "!!! SENTINEL FAILED: {alert} at {path}.",
+                           alert=alert["SENTINEL_ALERT"], path=alert["PATH"])
+            return alert
+
+        logger.debug("sentinel_verified", "Sentinel Protocol: Data Integrity Verified.")
+        return raw_external_data
+
+    def _check_for_text_injection(self, text: str, path) -> Optional[Dict[str, Any]]:
+        matches = self.keyword_matcher.find_all(text)
+        if not matches:
+            return None
+        return {
+            "SENTINEL_ALERT": "KEYWORD_VIOLATION",
+            "PATH": _render_path(path),
+            "MATCHES": [{"keyword": keyword, "offset": offset} for offset, keyword in matches]
+        }
+
+    def validate_many(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Batch Phase III validation. Structure and length are checked per item (flat dicts,
+        the usual search-result shape, skip the generic traversal), then every key and string
+        leaf of the whole batch goes through a single keyword prefilter pass.
+        Returns {"verdicts": [...], "first_blocked": index or None}; each verdict is the
+        item itself or its SENTINEL_ALERT dict, exactly as validate_and_sanitize returns.
+        """
+        if not self.streaming:
+            verdicts = [self.validate_serialized(item) for item in items]
+        else:
+            texts = []
+            owners = []
+            structural_alerts = {}
+            for index, item in enumerate(items):
+                if self._collect_flat(item, index, texts, owners):
+                    continue
+                collected = []
+                alert = self._check_for_structural_malware(item, texts=collected)
+                if alert:
+                    structural_alerts[index] = alert
+                texts.extend(text for text, _ in collected)
+                owners.extend((index, path) for _, path in collected)
+
+            # Keyword hits precede any structural violation, since only texts traversed
+            # before the violation were collected - the same order validate_streaming uses.
+            keyword_alerts = {}
+            for segment, matches in sorted(self.keyword_matcher.find_in_segments(texts).items()):
+                index, path = owners[segment]
+                if index not in keyword_alerts:
+                    keyword_alerts[index] = {
+                        "SENTINEL_ALERT": "KEYWORD_VIOLATION",
+                        "PATH": _render_path(path),
+                        "MATCHES": [{"keyword": keyword, "offset": offset} for offset, keyword in matches]
+                    }
+
+            verdicts = [keyword_alerts.get(index) or structural_alerts.get(index) or item
+                        for index, item in enumerate(items)]
+
+        blocked = [index for index, verdict in enumerate(verdicts)
+                   if isinstance(verdict, dict) and verdict.get("SENTINEL_ALERT")]
+        first_blocked = blocked[0] if blocked else None
+        logger.debug("sentinel_batch", "Sentinel Protocol: Batch of {items} scanned, {blocked} blocked.",
+                     items=len(items), blocked=len(blocked))
+        return {"verdicts": verdicts, "first_blocked": first_blocked}
+
+    def _collect_flat(self, item: Any, index: int, texts: List[str], owners: List[Tuple[int, Any]]) -> bool:
+        """
+        Fast path for a dict of string keys and scalar values: appends its keys, then its
+        string values, to the batch texts (the order the traversal visits them) and returns
+        True. Returns False, adding nothing, for anything else or anything over a limit,
+        so the full traversal can report the violation and its path.
+        """
+        if type(item) is not dict or len(item) > self.max_keys or self.max_depth < 1:
+            return False
+        total_length = 2 + 4 * len(item) - (2 if item else 0)
+        string_keys = []
+        for key, value in item.items():
+            if type(key) is not str:
+                return False
+            if type(value) is str:
+                total_length += len(encode_basestring_ascii(value))
+                string_keys.append(key)
+                continue
+            scalar_length = _scalar_length(value)
+            if scalar_length is None:
+                return False
+            total_length += scalar_length
+        total_length += sum(map(len, map(encode_basestring_ascii, item)))
+        if total_length > MAX_SAFE_STRING_LENGTH:
+            return False
+        texts += item
+        texts += [item[key] for key in string_keys]
+        owners += [(index, (None, key)) for key in item]
+        owners += [(index, (None, key)) for key in string_keys]
+        return True
+
+    def _check_for_structural_malware(self, raw_external_data: Any,
+                                      texts: Optional[List[Tuple[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Iterative depth-first traversal: enforces nesting depth, total key count and
+        the serialized length budget, and scans every key and string leaf for injection.
+        Stack entries carry a (parent, key) link so paths are only built on violation.
+        When texts is given, keyword scanning is deferred: (text, path) pairs are
+        collected for a batched scan instead.
+        """
+        total_length = 0
+        key_count = 0
+        stack = [(raw_external_data, 0, None)]
+
+        while stack:
+            value, depth, path = stack.pop()
+
+            if isinstance(value, str):
+                # len + 2 quotes is a lower bound on the encoded size; only encode when it fits.
+                total_length += len(value) + 2
+                if total_length > MAX_SAFE_STRING_LENGTH:
+                    return {"SENTINEL_ALERT": "LENGTH_VIOLATION", "PATH": _render_path(path)}
+                total_length += len(encode_basestring_ascii(value)) - len(value) - 2
+                if total_length > MAX_SAFE_STRING_LENGTH:
+                    return {"SENTINEL_ALERT": "LENGTH_VIOLATION", "PATH": _render_path(path)}
+                if texts is not None:
+                    texts.append((value, path))
+                    continue
+                alert = self._check_for_text_injection(value, path)
+                if alert:
+                    return alert
+                continue
+
+            if isinstance(value, dict):
+                if depth >= self.max_depth:
+                    return {"SENTINEL_ALERT": "DEPTH_VIOLATION", "PATH": _render_path(path)}
+                key_count += len(value)
+                if key_count > self.max_keys:
+                    return {"SENTINEL_ALERT": "KEY_COUNT_VIOLATION", "PATH": _render_path(path)}
+                # Braces, plus ": " per item and ", " between items.
+                total_length += 2 + 4 * len(value) - (2 if value else 0)
+                if total_length > MAX_SAFE_STRING_LENGTH:
+                    return {"SENTINEL_ALERT": "LENGTH_VIOLATION", "PATH": _render_path(path)}
+                children = []
+                for key, child in value.items():
+                    key_text = key if isinstance(key, str) else json.dumps(key)
+                    total_length += len(encode_basestring_ascii(key_text))
+                    if total_length > MAX_SAFE_STRING_LENGTH:
+                        return {"SENTINEL_ALERT": "LENGTH_VIOLATION", "PATH": _render_path(path)}
+                    if texts is not None:
+                        texts.append((key_text, (path, key_text)))
+                    else:
+                        alert = self._check_for_text_injection(key_text, (path, key_text))
+                        if alert:
+                            return alert
+                    children.append((child, depth + 1, (path, key_text)))
+                stack.extend(reversed(children))
+                continue
+
+            if isinstance(value, (list, tuple)):
+                if depth >= self.max_depth:
+                    return {"SENTINEL_ALERT": "DEPTH_VIOLATION", "PATH": _render_path(path)}
+                total_length += 2 + 2 * len(value) - (2 if value else 0)
+                if total_length > MAX_SAFE_STRING_LENGTH:
+                    return {"SENTINEL_ALERT": "LENGTH_VIOLATION", "PATH": _render_path(path)}
+                stack.extend((value[i], depth + 1, (path, i)) for i in range(len(value) - 1, -1, -1))
+                continue
+
+            scalar_length = _scalar_length(value)
+            if scalar_length is None:
+                return {"SENTINEL_ALERT": "STRUCTURE_VIOLATION", "PATH": _render_path(path)}
+            total_length += scalar_length
+
+            if total_length > MAX_SAFE_STRING_LENGTH:
+                return {"SENTINEL_ALERT": "LENGTH_VIOLATION", "PATH": _render_path(path)}
+
+        return None
+
+    def validate_serialized(self, raw_external_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Legacy mode: serializes the full payload before applying the length and keyword checks."""
         serialized_data = json.dumps(raw_external_data)
 
         if len(serialized_data) > MAX_SAFE_STRING_LENGTH:
-            print("!!! SENTINEL FAILED: Data exceeds safe length.")
+            logger.warning("sentinel_blocked", "!!! SENTINEL FAILED: Data exceeds safe length.", alert="LENGTH_VIOLATION")
             return {"SENTINEL_ALERT": "LENGTH_VIOLATION"}
 
-        for keyword in self.high_risk_keywords:
-            if keyword in serialized_data.lower():
-                print(f"!!! SENTINEL FAILED: Detected high-risk keyword '{keyword}'.")
-                return {"SENTINEL_ALERT": "KEYWORD_VIOLATION"}
+        # json.dumps escapes non-ASCII by default, so offsets index serialized_data exactly.
+        matches = self.keyword_matcher.find_all(serialized_data)
+        if matches:
+            logger.warning("sentinel_blocked", "!!! SENTINEL FAILED: Detected high-risk keyword '{keyword}'.",
+                           alert="KEYWORD_VIOLATION", keyword=matches[0][1])
+            return {
+                "SENTINEL_ALERT": "KEYWORD_VIOLATION",
+                "MATCHES": [{"keyword": keyword, "offset": offset} for offset, keyword in matches]
+            }
 
-        print("Sentinel Protocol: Data Integrity Verified.")
+        logger.debug("sentinel_verified", "Sentinel Protocol: Data Integrity Verified.")
         return raw_external_data
 
 # Example Usage:
@@ -18,8 +18,15 @@
 # This code defines the critical verification logic (The USP) designed to achieve the 99.9% confidence target.
 # Source: Omni-Analyst Detailed Architecture (Developer View...)
 
+import asyncio
 import json
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional, Union
+
+from orchestrator.search_cache import SearchCache
+from common.structured_log import get_logger
+
+logger = get_logger("void_repairer")
+
 # Placeholder for the Gemini API call function with Google Search grounding
 # In a real system, this would interface with the Google Generative Language API
 # using the specified model (gemini-2.5-flash-preview-05-20) and tools={"google_search": {}}.
@@ -35,20 +42,45 @@ def call_gemini_with_search(prompt: str) -> Optional[str]:
         return "SUCCESS: Micro-search found corroborating evidence from a regulatory filing."
     return None
 
+# A search backend maps a micro-query to a result string (or None on failure).
+# Plain functions and coroutine functions are both accepted by the async path.
+SearchBackend = Callable[[str], Union[Optional[str], Awaitable[Optional[str]]]]
+
+DEFAULT_REPAIR_CONCURRENCY = 8    # Micro-searches allowed in flight at once
+DEFAULT_REPAIR_TIMEOUT = 10.0     # Seconds before a single micro-search is abandoned
+
 class VoidRepairer:
     """
     Manages Phase VI (Cross-Verification) and Phase VII (Void Repair) of the Omni-Analyst Protocol.
     """
-    def __init__(self, required_corroboration_score: float = 0.7):
-        """Initializes the repairer with the critical verification threshold."""
+    def __init__(self, required_corroboration_score: float = 0.7,
+                 search_backend: SearchBackend = call_gemini_with_search,
+                 search_cache: Optional[SearchCache] = None):
+        """
+        Initializes the repairer with the critical verification threshold and search backend.
+        If a SearchCache is given (share one across requests), it sits in front of the backend.
+        """
         self.CORROBORATION_THRESHOLD = required_corroboration_score
+        self.search_cache = search_cache
+        self.search_backend = search_cache.wrap(search_backend) if search_cache else search_backend
 
     def run_verification(self, key_claims: List[Dict], raw_sources: List[str]) -> List[Dict]:
         """
         Phase VI: Cross-Verification & Void Identification.
         Rigorously verifies each claim against available sources and flags inconsistencies.
         """
-        print(f"--- Running Phase VI: Cross-Verification (Threshold: {self.CORROBORATION_THRESHOLD}) ---")
+        return self.run_void_repair(self._identify_voids(key_claims, raw_sources))
+
+    async def run_verification_async(self, key_claims: List[Dict], raw_sources: List[str],
+                                     max_concurrency: int = DEFAULT_REPAIR_CONCURRENCY,
+                                     timeout: Optional[float] = DEFAULT_REPAIR_TIMEOUT) -> List[Dict]:
+        """Phase VI followed by the concurrent Phase VII repair path."""
+        return await self.run_void_repair_async(self._identify_voids(key_claims, raw_sources),
+                                                max_concurrency=max_concurrency, timeout=timeout)
+
+    def _identify_voids(self, key_claims: List[Dict], raw_sources: List[str]) -> List[Dict]:
+        logger.info("phase_vi_start", "--- Running Phase VI: Cross-Verification (Threshold: {threshold}) ---",
+                    threshold=self.CORROBORATION_THRESHOLD)
         verified_claims = []
 
         for claim_data in key_claims:
@@ -62,41 +94,32 @@ class VoidRepairer:
                 claim_data["status"] = "VOID_FLAG_INCONSISTENCY"
                 claim_data["score"] = score
                 claim_data["error"] = f"Claim score {score} is below threshold {self.CORROBORATION_THRESHOLD}"
-                print(f"VOID IDENTIFIED: '{claim[:50]}...' Score: {score}")
+                logger.debug("void_identified", "VOID IDENTIFIED: '{claim:.50}...' Score: {score}", claim=claim, score=score)
             else:
                 claim_data["status"] = "VERIFIED"
                 claim_data["score"] = score
-                print(f"Claim VERIFIED: '{claim[:50]}...' Score: {score}")
+                logger.debug("claim_verified", "Claim VERIFIED: '{claim:.50}...' Score: {score}", claim=claim, score=score)
 
             verified_claims.append(claim_data)
 
-        return self.run_void_repair(verified_claims)
+        return verified_claims
 
     def run_void_repair(self, flagged_claims: List[Dict]) -> List[Dict]:
         """
         Phase VII: Self-Correction & Void Repair.
         Executes targeted micro-searches to resolve voids.
         """
-        print("--- Running Phase VII: Void Repair ---")
+        logger.info("phase_vii_start", "--- Running Phase VII: Void Repair ---")
         final_claims = []
 
         for claim_data in flagged_claims:
             if claim_data.get("status") == "VOID_FLAG_INCONSISTENCY":
-                claim = claim_data.get("claim")
                 # Step 1: Generate precise Micro-Search Query (Source 1)
-                micro_query = f"Verify or refute: {claim}"
+                micro_query = self._micro_query(claim_data)
                 
                 # Step 2: Execute single, high-specificity search
-                repair_result = call_gemini_with_search(micro_query)
-
-                if repair_result and "SUCCESS" in repair_result:
-                    claim_data["status"] = "REPAIRED"
-                    claim_data["repair_notes"] = "Resolved via targeted micro-search."
-                    print(f"VOID REPAIRED: '{claim[:50]}...'")
-                else:
-                    claim_data["status"] = "UNRELIABLE_VOID"
-                    # Step 3: Exclude from final synthesis input (critical for 99.9% KPI)
-                    print(f"VOID UNRESOLVED (EXCLUDING): '{claim[:50]}...'")
+                repair_result = self.search_backend(micro_query)
+                self._apply_repair_result(claim_data, repair_result)
             
             # Only append claims that are VERIFIED or REPAIRED for the final report input
             if claim_data.get("status") in ["VERIFIED", "REPAIRED"]:
@@ -104,6 +127,69 @@ class VoidRepairer:
         
         return final_claims
 
+    async def run_void_repair_async(self, flagged_claims: List[Dict],
+                                    max_concurrency: int = DEFAULT_REPAIR_CONCURRENCY,
+                                    timeout: Optional[float] = DEFAULT_REPAIR_TIMEOUT) -> List[Dict]:
+        """
+        Phase VII, concurrent: fans out one micro-search per void, with at most
+        max_concurrency in flight and a per-search timeout. A search that times out or
+        raises counts as a failed repair of that claim only (UNRELIABLE_VOID); the other
+        claims are still repaired. Cancelling the caller cancels every pending search.
+        Outcomes and ordering match run_void_repair.
+        """
+        logger.info("phase_vii_start", "--- Running Phase VII: Void Repair (async, concurrency={concurrency}) ---",
+                    concurrency=max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def repair(claim_data: Dict):
+            async with semaphore:
+                try:
+                    repair_result = await asyncio.wait_for(
+                        self._search_async(self._micro_query(claim_data)), timeout)
+                except asyncio.TimeoutError:
+                    repair_result = None
+                    claim_data["repair_notes"] = f"Micro-search timed out after {timeout}s."
+                except Exception as error:
+                    repair_result = None
+                    claim_data["repair_notes"] = f"Micro-search failed: {error!r}"
+                    logger.warning("micro_search_failed", "Micro-search failed for '{claim:.50}...': {error}",
+                                   claim=claim_data.get("claim"), error=repr(error))
+            self._apply_repair_result(claim_data, repair_result)
+
+        tasks = [asyncio.ensure_future(repair(claim_data)) for claim_data in flagged_claims
+                 if claim_data.get("status") == "VOID_FLAG_INCONSISTENCY"]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Cancellation abandons the remaining micro-searches (backend errors are caught per claim).
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return [claim_data for claim_data in flagged_claims
+                if claim_data.get("status") in ["VERIFIED", "REPAIRED"]]
+
+    async def _search_async(self, micro_query: str) -> Optional[str]:
+        if asyncio.iscoroutinefunction(self.search_backend):
+            return await self.search_backend(micro_query)
+        # Blocking backends run on the default executor so the event loop stays free.
+        return await asyncio.to_thread(self.search_backend, micro_query)
+
+    def _micro_query(self, claim_data: Dict) -> str:
+        return f"Verify or refute: {claim_data.get('claim')}"
+
+    def _apply_repair_result(self, claim_data: Dict, repair_result: Optional[str]):
+        claim = claim_data.get("claim")
+        if repair_result and "SUCCESS" in repair_result:
+            claim_data["status"] = "REPAIRED"
+            claim_data["repair_notes"] = "Resolved via targeted micro-search."
+            logger.debug("void_repaired", "VOID REPAIRED: '{claim:.50}...'", claim=claim)
+        else:
+            claim_data["status"] = "UNRELIABLE_VOID"
+            # Step 3: Exclude from final synthesis input (critical for 99.9% KPI)
+            logger.debug("void_unresolved", "VOID UNRESOLVED (EXCLUDING): '{claim:.50}...'", claim=claim)
+
     def _simulate_initial_corroboration(self, claim: str, raw_sources: List[str]) -> float:
         """Simulates the initial Corroboration Score calculation."""
         # Simple simulation for architectural purposes based on keywords found in the successful deep research output.
@@ -0,0 +1,186 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Write-Behind Persistence Queue (Phase IX)
+# Phase IX hands its final-report artifact to a bounded asyncio queue and returns;
+# a background task groups queued artifacts into batches (by size or age) and commits
+# them to the Prometheus Nexus off the event loop. Persistence leaves the request path,
+# a full queue makes put() wait (backpressure), and stop() flushes everything queued.
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.structured_log import get_logger
+
+logger = get_logger("write_behind")
+
+DEFAULT_MAX_PENDING = 1024     # Queued artifacts before put() starts waiting
+DEFAULT_BATCH_SIZE = 128       # Artifacts per store commit
+DEFAULT_FLUSH_INTERVAL = 0.05  # Seconds a partial batch waits for more artifacts
+
+_STOP = object()
+
+class WriteBehindQueue:
+    """
+    Asynchronous write-behind front for a NexusStore (anything with put_many(pairs)).
+    The flusher task starts lazily on the running loop; artifacts left behind by a loop
+    that has gone away (or a stopped flusher) are written synchronously before a new one starts.
+    """
+    def __init__(self, store, max_pending: int = DEFAULT_MAX_PENDING,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.store = store
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop = None
+        # Metrics
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.backpressure_waits = 0
+        self.backpressure_seconds = 0.0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self.total_flush_seconds = 0.0
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        if self._queue is not None:
+            self._write_leftovers()
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._task = loop.create_task(self._flusher())
+
+    async def put(self, artifact_id: str, data: Any) -> None:
+        """Queues one artifact. Waits only when max_pending artifacts are already queued."""
+        self._ensure_started()
+        if self._queue.full():
+            self.backpressure_waits += 1
+            started = time.monotonic()
+            await self._queue.put((artifact_id, data))
+            self.backpressure_seconds += time.monotonic() - started
+        else:
+            self._queue.put_nowait((artifact_id, data))
+        self.enqueued += 1
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    async def flush(self) -> None:
+        """Waits until every artifact queued so far has been committed."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def _flusher(self):
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                queue.task_done()
+                return
+            batch = [item]
+            stopping = False
+            try:
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    if queue.empty():
+                        # Let a partial batch fill up until its deadline. Sleeping (rather than
+                        # wait_for(queue.get())) cannot lose an item to a timeout race.
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        await asyncio.sleep(remaining)
+                        continue
+                    item = queue.get_nowait()
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            except asyncio.CancelledError:
+                # Loop shutting down mid-batch (e.g. asyncio.run returning): keep what was taken.
+                self.store.put_many(batch)
+                self.written += len(batch)
+                self.batches += 1
+                raise
+            # Once started, the write runs to completion in its thread even if we are cancelled.
+            await self._write(batch)
+            for _ in range(len(batch) + stopping):
+                queue.task_done()
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Tuple[str, Any]]):
+        started = time.monotonic()
+        try:
+            await asyncio.to_thread(self.store.put_many, batch)
+        except Exception as error:
+            # put_many takes a failed batch back out of the store's buffer, so these are really lost.
+            self.failed += len(batch)
+            logger.error("persist_failed", "[Write-Behind] Failed to persist {count} artifacts: {error}",
+                         count=len(batch), error=repr(error))
+            return
+        elapsed = time.monotonic() - started
+        self.written += len(batch)
+        self.batches += 1
+        self.last_flush_seconds = elapsed
+        self.total_flush_seconds += elapsed
+        if elapsed > self.max_flush_seconds:
+            self.max_flush_seconds = elapsed
+
+    def _write_leftovers(self):
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                batch.append(item)
+        if batch:
+            self.store.put_many(batch)
+            self.written += len(batch)
+            self.batches += 1
+
+    async def stop(self) -> None:
+        """Graceful shutdown: everything queued before stop() is committed, then the flusher exits."""
+        if self._task is None:
+            return
+        if self._loop is not asyncio.get_running_loop() or self._task.done():
+            self._write_leftovers()  # Flusher belonged to a loop that is already gone
+        else:
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "max_pending": self.max_pending,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "backpressure_waits": self.backpressure_waits,
+            "backpressure_seconds": self.backpressure_seconds,
+            "last_flush_seconds": self.last_flush_seconds,
+            "mean_flush_seconds": self.total_flush_seconds / self.batches if self.batches else 0.0,
+            "max_flush_seconds": self.max_flush_seconds,
+        }
@@ -0,0 +1,267 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Prometheus Nexus Store
+# Embedded, versioned artifact store behind PrometheusNexus and PrometheusProtocol.
+# SQLite in WAL mode; writes are buffered and committed in groups (one transaction per
+# batch instead of per artifact), and recent reads are served from a bounded LRU cache.
+# Every write of an artifact id adds a new version; older versions stay readable.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_BATCH_SIZE = 256        # Buffered writes per commit
+DEFAULT_FLUSH_INTERVAL = 0.05   # Seconds a buffered write may wait for its batch to fill
+DEFAULT_CACHE_SIZE = 1024       # Artifact versions kept in memory for reads
+NEXUS_DB_ENV = "NEXUS_DB_PATH"  # Database file; unset keeps the Nexus in memory
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS artifacts ("
+    "artifact_id TEXT NOT NULL, version INTEGER NOT NULL, data TEXT NOT NULL, "
+    "created_at REAL NOT NULL, PRIMARY KEY (artifact_id, version)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS artifacts_by_version ON artifacts (version)",
+)
+
+# Version assignment happens inside the insert, so several writers sharing one
+# database file never hand out the same version twice.
+_INSERT = (
+    "INSERT INTO artifacts (artifact_id, version, data, created_at) "
+    "SELECT ?, COALESCE(MAX(version), 0) + 1, ?, ? FROM artifacts WHERE artifact_id = ?"
+)
+
+_MISSING = object()
+
+def default_store_path() -> str:
+    return os.environ.get(NEXUS_DB_ENV, ":memory:")
+
+class NexusStore:
+    """
+    Thread-safe versioned artifact store. put() only buffers; the buffer is committed
+    when it reaches batch_size, when the oldest write is flush_interval old (a background
+    flusher enforces this even if no further writes arrive), or on flush()/close().
+    Reads see buffered writes.
+    """
+    def __init__(self, path: str = ":memory:", batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 cache_size: int = DEFAULT_CACHE_SIZE, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+        self.clock = clock
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: a commit survives a process crash; only an OS crash can lose the last batch.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        self._pending: List[Tuple[str, str, float]] = []
+        self._pending_since: Optional[float] = None
+        self._cache: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        self.writes = 0
+        self.commits = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # --- Writes ---
+
+    def put(self, artifact_id: str, data: Any) -> None:
+        """Buffers a new version of artifact_id. data must be JSON-serializable."""
+        encoded = json.dumps(data)
+        now = self.clock()
+        with self._lock:
+            if not self._pending:
+                self._pending_since = now
+                self._start_flusher()
+                self._wakeup.notify()  # Start the flush_interval countdown for this batch
+            self._pending.append((artifact_id, encoded, now))
+            self.writes += 1
+            if (len(self._pending) >= self.batch_size
+                    or now - self._pending_since >= self.flush_interval):
+                self._flush_locked()
+
+    def _start_flusher(self):
+        # Caller holds self._lock.
+        if self._flusher is None and not self._closed:
+            self._flusher = threading.Thread(target=self._flush_loop, name="nexus-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        with self._lock:
+            while not self._closed:
+                if not self._pending:
+                    self._wakeup.wait()
+                    continue
+                due = self._pending_since + self.flush_interval - self.clock()
+                if due > 0:
+                    self._wakeup.wait(due)
+                    continue
+                try:
+                    self._flush_locked()
+                except sqlite3.Error:
+                    self._wakeup.wait(self.flush_interval)  # e.g. database locked: keep the batch, retry
+
+    def put_many(self, artifacts: Union[Dict[str, Any], Iterable[Tuple[str, Any]]]) -> None:
+        """
+        Commits several artifacts together. Accepts a dict or (artifact_id, data) pairs;
+        pairs may repeat an id, each occurrence becoming its own version in order.
+        If the commit fails, these artifacts are dropped from the buffer and the error is
+        raised, so the caller knows they were not written. Writes already buffered by put()
+        stay pending and the background flusher retries them.
+        """
+        if isinstance(artifacts, dict):
+            artifacts = artifacts.items()
+        now = self.clock()
+        rows = [(artifact_id, json.dumps(data), now) for artifact_id, data in artifacts]
+        if not rows:
+            return
+        with self._lock:
+            if not self._pending:
+                self._pending_since = now
+            self._start_flusher()
+            self._wakeup.notify()
+            self._pending.extend(rows)
+            self.writes += len(rows)
+            try:
+                self._flush_locked()
+            except BaseException:
+                del self._pending[-len(rows):]
+                self.writes -= len(rows)
+                if not self._pending:
+                    self._pending_since = None
+                raise
+
+    def flush(self) -> int:
+        """Commits buffered writes in one transaction. Returns the number written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        pending = self._pending
+        if not pending:
+            return 0
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                _INSERT, [(artifact_id, data, created_at, artifact_id)
+                          for artifact_id, data, created_at in pending])
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._pending = []
+        self._pending_since = None
+        self.commits += 1
+        return len(pending)
+
+    # --- Reads ---
+
+    def get(self, artifact_id: str, version: Optional[int] = None, default: Any = None) -> Any:
+        """Latest (or the given) version of an artifact, or default if it does not exist."""
+        with self._lock:
+            if version is None:
+                # The newest write may still be buffered.
+                for pending_id, data, _ in reversed(self._pending):
+                    if pending_id == artifact_id:
+                        return json.loads(data)
+                version = self._latest_version_locked(artifact_id)
+                if version is None:
+                    return default
+            elif self._pending:
+                self._flush_locked()  # Buffered writes have no version number until committed
+            data = self._cached(artifact_id, version)
+        return default if data is _MISSING else json.loads(data)
+
+    def _cached(self, artifact_id: str, version: int) -> Any:
+        key = (artifact_id, version)
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return data
+        self.cache_misses += 1
+        row = self._conn.execute(
+            "SELECT data FROM artifacts WHERE artifact_id = ? AND version = ?", key).fetchone()
+        if row is None:
+            return _MISSING
+        # Versions are immutable, so cached entries never need invalidating.
+        self._cache[key] = row[0]
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return row[0]
+
+    def _latest_version_locked(self, artifact_id: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT MAX(version) FROM artifacts WHERE artifact_id = ?", (artifact_id,)).fetchone()
+        return row[0]
+
+    def latest_version(self, artifact_id: str) -> Optional[int]:
+        with self._lock:
+            self._flush_locked()
+            return self._latest_version_locked(artifact_id)
+
+    def versions(self, artifact_id: str) -> List[int]:
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(
+                "SELECT version FROM artifacts WHERE artifact_id = ? ORDER BY version",
+                (artifact_id,)).fetchall()
+        return [row[0] for row in rows]
+
+    def __getitem__(self, artifact_id: str) -> Any:
+        data = self.get(artifact_id, default=_MISSING)
+        if data is _MISSING:
+            raise KeyError(artifact_id)
+        return data
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return self.get(artifact_id, default=_MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        """Number of distinct artifact ids."""
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute("SELECT COUNT(DISTINCT artifact_id) FROM artifacts").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "writes": self.writes,
+                "commits": self.commits,
+                "pending": len(self._pending),
+                "cache_entries": len(self._cache),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+            self._flush_locked()
+            self._conn.close()
+        if self._flusher is not None:
+            self._flusher.join()
@@ -18,14 +18,21 @@
 
 import json
 
+from common.structured_log import get_logger
+from prometheus.nexus_store import NexusStore, default_store_path
+
+logger = get_logger("nexus")
+
 class PrometheusNexus:
-    def __init__(self):
-        self.repository = {}
+    def __init__(self, db_path=None):
+        # Versioned SQLite store (prometheus/nexus_store.py); NEXUS_DB_PATH makes it durable.
+        self.repository = NexusStore(db_path or default_store_path())
         self.version = 1.0
 
     def integrate_artifact(self, artifact_id, data):
-        self.repository[artifact_id] = data
-        print(f"Artifact {artifact_id} integrated into Nexus at v{self.version}")
+        self.repository.put(artifact_id, data)
+        logger.debug("artifact_integrated", "Artifact {artifact_id} integrated into Nexus at v{version}",
+                     artifact_id=artifact_id, version=self.version)
 
 # Example Usage:
 if __name__ == "__main__":
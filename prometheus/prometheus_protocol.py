@@ -20,15 +20,20 @@
 import json
 from typing import Dict, Any
 
+from common.structured_log import get_logger
+from prometheus.nexus_store import NexusStore, default_store_path
+
+logger = get_logger("prometheus")
+
 class PrometheusProtocol:
-    def __init__(self):
-        self.nexus = {}  # Centralized repository stub
+    def __init__(self, db_path=None):
+        self.nexus = NexusStore(db_path or default_store_path())  # Centralized versioned repository
         self.version = 1.0
         self.microservices = []  # List of registered services
 
     def register_microservice(self, service_name, capabilities):
         self.microservices.append({"name": service_name, "capabilities": capabilities})
-        print(f"Microservice {service_name} registered.")
+        logger.info("microservice_registered", "Microservice {service} registered.", service=service_name)
 
     def par_loop(self, plan, act_output):
         # Plan-Act-Reflect loop for self-correction
@@ -39,13 +44,13 @@ class PrometheusProtocol:
     def chimera_fusion(self, new_skill, existing_agent):
         # 4-stage fusion: Deconstruction, Mapping, Integration, Harmonization
         fused = f"Fused {new_skill} into {existing_agent}."
-        self.nexus[existing_agent] = fused
+        self.nexus.put(existing_agent, fused)
         return fused
 
     def integrate_knowledge(self, artifact_id, data):
-        self.nexus[artifact_id] = data
+        self.nexus.put(artifact_id, data)
         self.version += 0.1
-        print(f"Knowledge integrated at v{self.version}")
+        logger.debug("knowledge_integrated", "Knowledge integrated at v{version}", version=self.version)
 
 # Example Usage:
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ setup(
         "fastapi",
         "uvicorn",
         "pydantic",
+        "numpy",
         "json",
     ],
     description="Implementation of Resonance Scaling Policy v1.0 (Descriptions by Copilot)",
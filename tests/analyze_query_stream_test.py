@@ -0,0 +1,77 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for streaming /analyze_query (NDJSON / SSE, cancellation on disconnect)
+import asyncio
+import json
+import time
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+
+async def open_stream(query, fmt="ndjson"):
+    response = await orchestrator.analyze_query_stream(orchestrator.QueryPayload(query_text=query), format=fmt)
+    return response, response.body_iterator
+
+async def full_run():
+    response, body = await open_stream("stream me")
+    assert response.media_type == "application/x-ndjson"
+    started = time.perf_counter()
+    first = json.loads(await body.__anext__())
+    first_byte_ms = (time.perf_counter() - started) * 1000
+    assert first == {"event": "accepted", "query": "stream me"}
+    events = [json.loads(chunk) async for chunk in body]
+    phases = [e["phase"] for e in events if e["event"] == "phase"]
+    assert phases == [name for name, _, _ in orchestrator.PIPELINE_STAGES]
+    assert events[1]["log"][0]["P II"] == "Emily executing search strategy for: 'stream me'"
+    assert events[-1]["event"] == "result" and events[-1]["result"]["final_report"]["confidence"] == 0.999
+    print(f"First event after {first_byte_ms:.2f} ms, {len(events)} events")
+
+async def sse_run():
+    response, body = await open_stream("sse please", fmt="sse")
+    assert response.media_type == "text/event-stream"
+    chunks = [chunk async for chunk in body]
+    assert chunks[0].startswith("event: accepted\ndata: ") and chunks[0].endswith("\n\n")
+    assert chunks[-1].startswith("event: result\n")
+
+async def abandoned_run():
+    # Hold the Governor down so Phase II waits in a recovery pause, then walk away.
+    orchestrator.state.governor._ssi = 0.0
+    orchestrator.state.governor._is_stable = False
+    budget_before = orchestrator.state.budget.t_value
+    enqueued_before = orchestrator.state.persistence.stats()["enqueued"]
+    cancelled_before = orchestrator.pipeline.stats()["II"]["cancelled"]
+
+    _, body = await open_stream("walk away")
+    assert json.loads(await body.__anext__())["event"] == "accepted"
+    assert json.loads(await body.__anext__())["phase"] == "I"
+    await asyncio.sleep(0.01)
+    await body.aclose()            # Client disconnect
+    await asyncio.sleep(0.1)       # Longer than the remaining pause: nothing may resume
+
+    stats = orchestrator.pipeline.stats()
+    assert stats["II"]["cancelled"] == cancelled_before + 1
+    assert orchestrator.state.budget.t_value == budget_before   # Phase II never paid for its search
+    assert orchestrator.state.persistence.stats()["enqueued"] == enqueued_before
+    assert orchestrator.state.active_requests == 0
+
+async def main():
+    orchestrator.state.budget = DRABudget(100, refill_rate=0)
+    await full_run()
+    await sse_run()
+    await abandoned_run()
+    await orchestrator.pipeline.stop()
+
+asyncio.run(main())
+print("Analyze Query Stream Test Complete.")
@@ -0,0 +1,35 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for Diablo MoE batched top-k routing
+import numpy as np
+from orchestrator.diablo_moe_gating import DiabloGating
+
+diablo = DiabloGating(num_experts=64, top_k=8, feature_dim=32, seed=3)
+features = np.random.default_rng(0).standard_normal((500, 32))
+indices, weights = diablo.gate_batch(features)
+assert indices.shape == (500, 8) and weights.shape == (500, 8)
+assert np.allclose(weights.sum(axis=1), 1.0) and np.all(np.diff(weights, axis=1) <= 1e-12)
+
+# Partial selection picks exactly what a full sort would.
+full_sort = np.argsort(-diablo.score_batch(features), axis=1)[:, :8]
+assert np.array_equal(indices, full_sort)
+
+# Same seed, same routing.
+again, _ = DiabloGating(num_experts=64, top_k=8, feature_dim=32, seed=3).gate_batch(features)
+assert np.array_equal(indices, again)
+
+assert len(DiabloGating().gate("test_token")) == 2
+print("Diablo Gating Test Complete.")
@@ -0,0 +1,44 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for DRA Budget reservations and token-bucket refill
+from orchestrator.dra_budget import DRABudget, T_COST_VOID_REPAIR
+
+now = [0.0]
+dra = DRABudget(30, refill_rate=2.0, clock=lambda: now[0])
+
+held = dra.reserve(T_COST_VOID_REPAIR, "Void Repair")
+assert dra.t_value == 20
+held.rollback()                             # Repair abandoned: refunded
+assert dra.t_value == 30 and held.state == "REFUNDED"
+
+with dra.reserve(T_COST_VOID_REPAIR, "Void Repair"):
+    pass                                    # Repair ran: committed
+assert dra.t_value == 20
+
+try:
+    with dra.reserve(T_COST_VOID_REPAIR, "Void Repair"):
+        raise RuntimeError("micro-search crashed")
+except RuntimeError:
+    pass
+assert dra.t_value == 20                    # Exceptions refund the reservation
+
+assert dra.spend(20, "Drain") and dra.reserve(1, "Void Repair") is None
+now[0] += 2.5                               # 2.5 s at 2 T/s refills 5 T
+assert dra.t_value == 5
+now[0] += 100                               # Refill saturates at capacity
+assert dra.t_value == 30
+
+print("DRA Refill Test Complete.")
@@ -0,0 +1,172 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the cluster-wide DRA budget: several processes leasing from one SQLite pool
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+from orchestrator.dra_coordinator import (BudgetCoordinator, InMemoryCoordinator, LeasedDRABudget,
+                                          SQLiteCoordinator, COORDINATOR_TTL_FACTOR)
+
+POOL = 300
+DEMAND_PER_POD = 200  # Four pods want 800 between them, far more than the pool
+
+def pod_worker(path, pod_id, barrier, results):
+    budget = LeasedDRABudget(SQLiteCoordinator(path, total_t=POOL, refill_rate=0), pod_id=pod_id, lease_size=20)
+    barrier.wait()  # Every pod starts spending at the same moment
+    spent = 0
+    while spent + 3 <= DEMAND_PER_POD and budget.try_spend(3) is not None:
+        spent += 3
+    budget.close()
+    results[pod_id] = spent
+
+def run_multi_process_test(pods=4):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dra_pool.sqlite3")
+        SQLiteCoordinator(path, total_t=POOL, refill_rate=0)
+        manager = multiprocessing.Manager()
+        results = manager.dict()
+        barrier = manager.Barrier(pods)
+        processes = [multiprocessing.Process(target=pod_worker, args=(path, f"pod-{i}", barrier, results))
+                     for i in range(pods)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        spent = dict(results)
+        leftover = SQLiteCoordinator(path).available()
+        print(f"Spent per pod: {spent}, left in pool: {leftover}")
+        # Under contention the cluster never spends more than the shared pool.
+        assert len(spent) == pods and sum(spent.values()) <= POOL
+        assert sum(spent.values()) + leftover == POOL and leftover < 3
+
+# Idle leases time out and go back to the pool; shutdown returns the rest.
+now = [0.0]
+coordinator = InMemoryCoordinator(total_t=100, refill_rate=0)
+pod = LeasedDRABudget(coordinator, pod_id="pod-a", lease_size=20, lease_ttl=5, clock=lambda: now[0])
+assert pod.try_spend(5) == 15 and coordinator.available() == 80
+now[0] += 6
+assert pod.try_spend(5) == 15 and coordinator.available() == 75   # Old lease returned 15, new one taken
+pod.close()
+assert coordinator.available() == 90
+
+# A pod that stops spending still hands its lease back once the TTL passes (the reaper's job).
+idle = LeasedDRABudget(coordinator, pod_id="pod-idle", lease_size=20, lease_ttl=5, clock=lambda: now[0])
+assert idle.try_spend(5) == 15 and coordinator.available() == 70
+idle.reap()
+assert coordinator.available() == 70   # Not expired yet
+now[0] += 6
+idle.reap()
+assert coordinator.available() == 85 and idle.t_value == 0
+idle.close()
+
+# A pod that died without releasing: its lease is forfeited at the coordinator's expiry,
+# since the coordinator cannot tell how much of it was spent.
+wall = [0.0]
+pool = InMemoryCoordinator(total_t=100, refill_rate=0, clock=lambda: wall[0])
+lease_id, granted = pool.acquire("pod-crashed", 20, 1, ttl=5 * COORDINATOR_TTL_FACTOR)
+assert granted == 20 and pool.available() == 80
+wall[0] += 5 * COORDINATOR_TTL_FACTOR
+assert pool.available() == 80 and not pool.leases
+
+# A stalled pod that releases after its lease was reaped gets nothing credited: the pool
+# never issues more than its budget.
+lease_id, granted = pool.acquire("pod-stalled", 80, 1, ttl=10)
+assert granted == 80 and pool.available() == 0
+wall[0] += 10
+assert pool.available() == 0
+pool.release("pod-stalled", [lease_id], 75)
+assert pool.available() == 0
+# The same through a pod: it spends 75 of a 100 lease, stalls past the coordinator expiry,
+# then closes. Its late release of the remaining 25 is ignored, so 75 + pool <= 100.
+stall_pool = InMemoryCoordinator(total_t=100, refill_rate=0, clock=lambda: wall[0])
+stalled = LeasedDRABudget(stall_pool, pod_id="pod-slow", lease_size=100, lease_ttl=5, clock=lambda: wall[0])
+assert stalled.try_spend(75) == 25
+wall[0] += 5 * COORDINATOR_TTL_FACTOR
+stalled.close()
+assert 75 + stall_pool.available() <= 100
+
+# A live lease is credited at most its own amount.
+fresh = InMemoryCoordinator(total_t=100, refill_rate=0)
+live_id, _ = fresh.acquire("pod-live", 20, 1, ttl=10)
+fresh.release("pod-live", [live_id, "unknown-lease"], 50)
+assert fresh.available() == 100
+
+with tempfile.TemporaryDirectory() as tmp:
+    shared = SQLiteCoordinator(os.path.join(tmp, "pool.sqlite3"), total_t=100, refill_rate=0, clock=lambda: wall[0])
+    crashed_id, _ = shared.acquire("pod-crashed", 20, 1, ttl=10)
+    assert shared.available() == 80 and shared.outstanding() == 20
+    wall[0] += 10
+    assert shared.available() == 80 and shared.outstanding() == 0
+    shared.release("pod-crashed", [crashed_id], 15)   # Late release of a reaped lease
+    assert shared.available() == 80
+    lease_id, granted = shared.acquire("pod-b", 80, 80, ttl=10)
+    assert granted == 80 and shared.available() == 0
+    shared.release("pod-b", [lease_id], 30)
+    assert shared.available() == 30
+    shared.release("pod-b", [lease_id], 30)            # Releasing twice credits nothing more
+    assert shared.available() == 30
+
+# Coordinator round-trips run outside the budget lock: local spends never wait on them.
+class SlowCoordinator(InMemoryCoordinator):
+    def __init__(self):
+        super().__init__(total_t=100, refill_rate=0)
+        self.blocked = threading.Event()
+        self.unblock = threading.Event()
+    def acquire(self, pod_id, amount, minimum, ttl):
+        if amount > 20:
+            self.blocked.set()
+            self.unblock.wait(5)
+        return super().acquire(pod_id, amount, minimum, ttl)
+
+slow = SlowCoordinator()
+busy = LeasedDRABudget(slow, pod_id="pod-busy", lease_size=20)
+assert busy.try_spend(5) == 15
+waiter = threading.Thread(target=busy.try_spend, args=(40,))
+waiter.start()
+assert slow.blocked.wait(5)
+assert busy.try_spend(5) == 10    # Served locally while the other spend waits on the coordinator
+slow.unblock.set()
+waiter.join()
+
+# The async variants lease off the event loop.
+async def spend_async():
+    budget = LeasedDRABudget(InMemoryCoordinator(total_t=30, refill_rate=0), pod_id="pod-async", lease_size=20)
+    assert await budget.try_spend_async(5) == 15
+    reservation = await budget.reserve_async(20, "Void Repair")
+    assert reservation is not None and budget.cluster_t_value == 0
+    assert await budget.try_spend_async(10) is None
+    budget.close()
+asyncio.run(spend_async())
+
+# The interface is abstract and pods cannot mint T-Value.
+try:
+    BudgetCoordinator()
+    raise AssertionError("BudgetCoordinator is abstract")
+except TypeError:
+    pass
+try:
+    busy.recharge(10)
+    raise AssertionError("recharge must be refused")
+except TypeError:
+    pass
+busy.close()
+
+if multiprocessing.current_process().name == "MainProcess":
+    run_multi_process_test()
+
+print("DRA Coordinator Test Complete.")
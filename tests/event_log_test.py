@@ -0,0 +1,59 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the ring-buffer orchestration event log
+import asyncio
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+from orchestrator.event_log import EventLog, VERBOSITY_OFF, VERBOSITY_SUMMARY
+
+class CountingValue:
+    formatted = 0
+    def __format__(self, spec):
+        CountingValue.formatted += 1
+        return "value"
+
+# Formatting is deferred until the log is read.
+log = EventLog()
+log.record("P II", "Searching for: {query}", query=CountingValue())
+assert CountingValue.formatted == 0
+assert log.render() == [{"P II": "Searching for: value"}] and CountingValue.formatted == 1
+assert log.events()[0]["fields"]["query"].__class__ is CountingValue
+
+# Fixed capacity: the oldest events are overwritten and counted as dropped.
+ring = EventLog(capacity=4)
+for i in range(10):
+    ring.record("P VI/VII ATTEMPT", "Attempt {n}", n=i)
+assert len(ring) == 4 and ring.dropped == 6 and ring.render()[0] == {"P VI/VII ATTEMPT": "Attempt 6"}
+
+# Verbosity filters what is recorded; OFF records nothing at all.
+summary = EventLog(VERBOSITY_SUMMARY)
+summary.record("P I", "Loading.")
+summary.record("P II SUCCESS", "Retrieved {sources} raw sources.", VERBOSITY_SUMMARY, sources=2)
+assert summary.render() == [{"P II SUCCESS": "Retrieved 2 raw sources."}]
+off = EventLog(VERBOSITY_OFF)
+off.record("P II SUCCESS", "Retrieved {sources} raw sources.", VERBOSITY_SUMMARY, sources=2)
+assert off.render() == [] and off.recorded == 0
+
+# End to end: callers that only want final_report get no log.
+orchestrator.state.budget = DRABudget(100, refill_rate=0)
+async def run(verbosity):
+    return await orchestrator.analyze_query(orchestrator.QueryPayload(query_text="q", verbosity=verbosity))
+quiet = asyncio.run(run(VERBOSITY_OFF))
+assert quiet["orchestration_log"] == [] and quiet["final_report"]["confidence"] == 0.999
+outcomes = asyncio.run(run(VERBOSITY_SUMMARY))["orchestration_log"]
+assert all(any(tag in code for tag in ("SUCCESS", "FAIL", "RESULT")) for entry in outcomes for code in entry)
+
+print("Event Log Test Complete.")
@@ -0,0 +1,55 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for capacity-aware expert dispatch
+import numpy as np
+from orchestrator.diablo_moe_gating import DiabloGating
+from orchestrator.expert_dispatcher import ExpertDispatcher, OVERFLOW_DROP, OVERFLOW_REROUTE
+
+gating = DiabloGating(num_experts=8, top_k=2, feature_dim=16, seed=0)
+skewed = np.random.default_rng(1).standard_normal((400, 16)) + 1.5
+
+# Capacity is respected under both policies.
+for policy in (OVERFLOW_REROUTE, OVERFLOW_DROP):
+    dispatcher = ExpertDispatcher(gating, capacity_factor=1.0, overflow_policy=policy)
+    result = dispatcher.dispatch(skewed)
+    report = result["stats"]
+    assert max(report["expert_load"]) <= report["capacity"] == 100
+    assert max(report["utilization"]) <= 1.0
+    assert report["imbalance"] > report["load_imbalance"]
+    indices, weights = result["expert_indices"], result["gate_weights"]
+    placed = (indices >= 0).sum(axis=1)
+    assert np.allclose(weights.sum(axis=1)[placed > 0], 1.0)
+    assert np.all(weights[indices < 0] == 0)
+    print(f"{policy}: load {report['expert_load']}, drop rate {report['drop_rate']:.3f}")
+
+# Reroute fills every slot given some headroom; a token never gets the same expert twice.
+rerouted = ExpertDispatcher(gating, capacity_factor=1.25).dispatch(skewed)
+assert rerouted["stats"]["drop_rate"] == 0.0 and rerouted["stats"]["reroute_rate"] > 0
+assert np.all(rerouted["expert_indices"][:, 0] != rerouted["expert_indices"][:, 1])
+
+# Drop only ever keeps the gate's own top-k choices.
+top_k, _ = gating.gate_batch(skewed)
+dropped = ExpertDispatcher(gating, capacity_factor=1.0, overflow_policy=OVERFLOW_DROP).dispatch(skewed)
+kept = dropped["expert_indices"]
+assert dropped["stats"]["drop_rate"] > 0
+assert np.all((kept == top_k) | (kept == -1))
+
+# Bounded queue caps capacity; generous capacity matches plain gate_batch exactly.
+assert ExpertDispatcher(gating, capacity_factor=4.0, queue_capacity=10).expert_capacity(400) == 10
+roomy = ExpertDispatcher(gating, capacity_factor=8.0).dispatch(skewed)
+assert np.array_equal(roomy["expert_indices"], top_k) and roomy["stats"]["drop_rate"] == 0.0
+
+print("Expert Dispatcher Test Complete.")
@@ -0,0 +1,69 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the expert-parallel executor
+from multiprocessing import current_process
+
+import numpy as np
+from orchestrator.diablo_moe_gating import DiabloGating
+from orchestrator.expert_dispatcher import ExpertDispatcher, OVERFLOW_DROP
+from orchestrator.expert_executor import ExpertExecutor, LinearExpert
+
+def reference(features, indices, weights, experts):
+    # Token-at-a-time combine, for comparison with the grouped micro-batches.
+    out = np.zeros((features.shape[0], 8))
+    for t in range(features.shape[0]):
+        for slot, e in enumerate(indices[t]):
+            if e >= 0:
+                out[t] += weights[t, slot] * experts[e](features[t:t + 1])[0]
+    return out
+
+if current_process().name == "MainProcess":
+    gating = DiabloGating(num_experts=6, top_k=2, feature_dim=12, seed=2)
+    experts = [LinearExpert(12, 8, seed=e) for e in range(6)]
+    features = np.random.default_rng(0).standard_normal((300, 12))
+    indices, weights = gating.gate_batch(features)
+
+    for use_processes in (False, True):
+        with ExpertExecutor(gating, max_workers=3, use_processes=use_processes) as executor:
+            for e, expert in enumerate(experts):
+                executor.register(e, expert)
+            result = executor.run(features)
+            assert np.allclose(result["outputs"], reference(features, indices, weights, experts))
+            assert sum(result["expert_batch_sizes"].values()) == 300 * 2
+            assert set(result["expert_latency"]) == set(result["expert_batch_sizes"])
+            print(f"processes={use_processes}: batch sizes {result['expert_batch_sizes']}")
+
+    # Dispatcher routing with dropped assignments: -1 slots contribute nothing.
+    routed = ExpertDispatcher(gating, capacity_factor=0.5, overflow_policy=OVERFLOW_DROP).dispatch(features)
+    with ExpertExecutor(gating) as executor:
+        for e, expert in enumerate(experts):
+            executor.register(e, expert)
+        result = executor.run(features, routed["expert_indices"], routed["gate_weights"])
+        expected = reference(features, routed["expert_indices"], routed["gate_weights"], experts)
+        assert np.allclose(result["outputs"], expected)
+        assert executor.stats()["expert_tokens"] == routed["stats"]["expert_load"]
+
+    # Routing to an unregistered expert is rejected before anything runs.
+    partial = ExpertExecutor(gating)
+    partial.register(0, experts[0])
+    try:
+        partial.run(features)
+        raise AssertionError("expected ValueError")
+    except ValueError as exc:
+        print(f"Rejected: {exc}")
+    partial.close()
+
+    print("Expert Executor Test Complete.")
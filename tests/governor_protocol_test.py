@@ -0,0 +1,77 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for time-based Governor Protocol recovery (no sleeps, no polling loops)
+import asyncio
+import threading
+import time
+from orchestrator.governor_protocol import GovernorProtocol, SSI_THRESHOLD_CRITICAL
+
+now = [0.0]
+governor = GovernorProtocol(initial_ssi=0.40, clock=lambda: now[0])
+governor.apply_stress(0.20, "Phase VII (Micro-Search)")
+assert not governor.is_stable
+pause = governor.time_until_stable()
+print(f"Pause required: {pause * 1000:.1f} ms")
+
+now[0] += pause / 2                       # Halfway through the pause: still recovering
+assert not governor.is_stable and governor.ssi < SSI_THRESHOLD_CRITICAL
+now[0] += pause / 2 + 1e-9                # Pause elapsed: stable again, no cycles run
+assert governor.is_stable
+now[0] += 10.0                            # Passive recovery saturates at 1.0
+assert governor.ssi == 1.0
+
+# wait_until_stable suspends only the caller; other coroutines keep running
+async def concurrent_run():
+    live = GovernorProtocol(initial_ssi=0.36)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker_task = asyncio.ensure_future(ticker())
+    start = time.perf_counter()
+    await live.ensure_stability_for_task_async(0.30, "Phase VII Void Repair")
+    elapsed = time.perf_counter() - start
+    ticker_task.cancel()
+    return live, elapsed, ticks
+
+live, elapsed, ticks = asyncio.run(concurrent_run())
+print(f"Async recovery took {elapsed * 1000:.1f} ms while the loop ran {ticks} other ticks")
+assert live.is_stable and ticks > 1
+
+# The sync form blocks its thread for the same pause; concurrent stress from many threads is never lost.
+blocking = GovernorProtocol(initial_ssi=0.36)
+start = time.perf_counter()
+assert blocking.ensure_stability_for_task(0.30, "Phase VII Void Repair") and blocking.is_stable
+print(f"Blocking recovery took {(time.perf_counter() - start) * 1000:.1f} ms")
+
+frozen = GovernorProtocol(initial_ssi=1.0, clock=lambda: 0.0)
+threads = [threading.Thread(target=lambda: [frozen.apply_stress(0.0001, "Phase II Search") for _ in range(500)])
+           for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert 1.0 - 4000 * 0.0001 * 1.1 <= frozen.ssi <= 1.0 - 4000 * 0.0001 * 0.9
+
+# The orchestrator uses this same class, not a copy.
+from orchestrator import omni_analyst_orchestrator
+assert type(omni_analyst_orchestrator.state.governor) is GovernorProtocol
+
+print("Governor Protocol Test Complete.")
@@ -0,0 +1,117 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the Governor / DRA discrete-event simulator
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from orchestrator.dra_budget import DRABudget
+from orchestrator.governor_protocol import GovernorProtocol, STRESS_FACTOR_PHASE_VII
+from common.structured_log import configure_logging, get_level
+from orchestrator.governor_simulator import (VirtualClock, configmap_values, recommend, simulate, sweep,
+                                             write_configmap)
+
+REPAIRS = 20000
+ARRIVAL_RATE = 20.0
+INITIAL_T = 1000
+REFILL_RATE = 150.0
+
+def reference_run(repairs, seed=1):
+    # The real classes on a virtual clock, one repair at a time.
+    clock = VirtualClock()
+    governor = GovernorProtocol(clock=clock)
+    budget = DRABudget(INITIAL_T, refill_rate=REFILL_RATE, clock=clock)
+    rng = np.random.default_rng(seed)
+    arrival = paused = 0.0
+    completed = 0
+    for _ in range(repairs):
+        arrival += rng.exponential(1.0 / ARRIVAL_RATE)
+        if arrival > clock.now:
+            clock.advance(arrival - clock.now)
+        reservation = budget.reserve(10, "Phase VII Void Repair")
+        if reservation is None:
+            continue
+        with reservation:
+            governor.apply_stress(STRESS_FACTOR_PHASE_VII, "Phase VII Void Repair")
+            wait = governor.time_until_stable()
+            clock.advance(wait)
+            paused += wait
+        completed += 1
+    elapsed = max(clock.now, arrival)
+    return {"pause_fraction": paused / elapsed, "throughput": completed / elapsed,
+            "exhaustion_rate": 1.0 - completed / repairs}
+
+# The vectorized engine agrees with the real GovernorProtocol + DRABudget.
+previous_level = get_level()
+configure_logging(level="ERROR")  # One pause warning per forced recovery otherwise
+reference = reference_run(REPAIRS)
+configure_logging(level=previous_level)
+simulated = simulate(REPAIRS, arrival_rate=ARRIVAL_RATE, initial_t=INITIAL_T, refill_rate=REFILL_RATE)
+print(f"Reference: {reference}")
+print(f"Simulated: pause {simulated['pause_fraction'][0]:.4f}, throughput {simulated['throughput'][0]:.2f}, "
+      f"exhaustion {simulated['exhaustion_rate'][0]:.4f}")
+assert abs(simulated["pause_fraction"][0] - reference["pause_fraction"]) < 0.1 * reference["pause_fraction"]
+assert abs(simulated["throughput"][0] - reference["throughput"]) < 0.05 * reference["throughput"]
+assert abs(simulated["exhaustion_rate"][0] - reference["exhaustion_rate"]) < 0.03
+
+# Sweeps: one lane per grid point; faster recovery means less time paused.
+started = time.perf_counter()
+results = sweep(REPAIRS, recovery_rate=[0.04, 0.08, 0.12], stress_factor=[0.1, 0.2, 0.3],
+                ssi_threshold=[0.3, 0.35], refill_rate=[1.0, 400.0])
+wall = time.perf_counter() - started
+assert len(results["throughput"]) == 36
+print(f"{36 * REPAIRS:,} simulated repairs in {wall:.2f} s")
+fractions = results["pause_fraction"].reshape(3, 3, 2, 2)[..., 1]  # Funded lanes (refill 400/s)
+assert (np.diff(fractions, axis=0) < 0).all() and (np.diff(fractions, axis=1) > 0).all()
+# A 1/s refill cannot fund 20 repairs/s; the budget runs dry almost immediately.
+exhaustion = results["exhaustion_rate"].reshape(3, 3, 2, 2)
+assert (exhaustion[..., 0] > 0.9).all() and (exhaustion[..., 1] < 0.01).all()
+assert np.isfinite(results["first_exhausted_at"].reshape(3, 3, 2, 2)[..., 0]).all()
+
+# The recommendation respects the bounds and lands in the ConfigMap without touching other keys.
+policy = recommend(results, max_pause_fraction=0.3, max_exhaustion_rate=0.01)
+assert policy["pause_fraction"] <= 0.3 and policy["exhaustion_rate"] <= 0.01
+assert recommend(results, max_pause_fraction=0.0) is None
+values = configmap_values(policy)
+path = os.path.join(tempfile.mkdtemp(), "configmap.yaml")
+shutil.copy(os.path.join(os.path.dirname(__file__), "..", "k8s", "configmap.yaml"), path)
+write_configmap(path, values)
+write_configmap(path, values)  # Idempotent
+with open(path) as handle:
+    text = handle.read()
+for key, value in values.items():
+    assert text.count(f'{key}: "{value}"') == 1, key
+assert 'CORROBORATION_THRESHOLD: "0.7"' in text and "name: rsp-config" in text
+print(f"Recommended: {values}")
+
+# Those ConfigMap values reach the running code: deployment.yaml loads them with envFrom,
+# and the Governor/DRA constants are read from the environment at import.
+probe = ("from orchestrator import governor_protocol as g, dra_budget as d; "
+         "print(g.SSI_THRESHOLD_CRITICAL, g.SSI_RECOVERY_RATE, g.STRESS_FACTOR_PHASE_VII, "
+         "d.INITIAL_T_VALUE, d.T_REFILL_RATE)")
+env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(__file__), ".."), RSP_LOG_LEVEL="OFF", **values)
+loaded = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True).stdout.split()
+keys = ["SSI_THRESHOLD_CRITICAL", "SSI_RECOVERY_RATE", "STRESS_FACTOR_PHASE_VII", "INITIAL_T_VALUE", "T_REFILL_RATE"]
+assert [float(value) for value in loaded] == [float(values[key]) for key in keys]
+with open(os.path.join(os.path.dirname(__file__), "..", "k8s", "deployment.yaml")) as handle:
+    assert "configMapRef:\n            name: rsp-config" in handle.read()
+
+print("Governor Simulator Test Complete.")
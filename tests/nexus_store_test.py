@@ -0,0 +1,105 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the SQLite-backed Prometheus Nexus store
+import os
+import sqlite3
+import tempfile
+import time
+
+from prometheus.nexus_store import NexusStore
+from prometheus.nexus_stub import PrometheusNexus
+
+path = os.path.join(tempfile.mkdtemp(), "nexus.db")
+
+store = NexusStore(path, batch_size=100, flush_interval=60.0, cache_size=8)
+store.put("risk_report", {"confidence": 0.9})
+# Buffered writes are readable before they are committed.
+assert store.stats()["pending"] == 1 and store["risk_report"] == {"confidence": 0.9}
+store.put("risk_report", {"confidence": 0.999})
+assert store.latest_version("risk_report") == 2
+assert store.get("risk_report", version=1) == {"confidence": 0.9}
+assert store.get("missing") is None and "missing" not in store
+
+# Grouped commits: 1000 writes, 10 transactions.
+before = store.stats()["commits"]
+for i in range(1000):
+    store.put(f"artifact_{i % 50}", {"i": i})
+assert store.stats()["commits"] - before == 10
+assert store.versions("artifact_7") == list(range(1, 21))
+
+# Read cache stays bounded.
+for i in range(50):
+    store.get(f"artifact_{i}")
+assert store.stats()["cache_entries"] <= 8
+store.close()
+
+# Durable across restarts, and a second writer on the same file continues the version sequence.
+reopened = NexusStore(path)
+other = NexusStore(path)
+other.put("risk_report", {"confidence": 0.5})
+other.flush()
+assert reopened.versions("risk_report") == [1, 2, 3] and reopened["risk_report"] == {"confidence": 0.5}
+assert len(reopened) == 51
+reopened.close()
+other.close()
+
+# A lone write is committed after flush_interval even if nothing else is written.
+idle = NexusStore(path, batch_size=100, flush_interval=0.02)
+idle.put("idle_report", {"confidence": 0.7})
+deadline = time.monotonic() + 2.0
+while idle.stats()["pending"] and time.monotonic() < deadline:
+    time.sleep(0.01)
+assert idle.stats()["pending"] == 0 and idle.stats()["commits"] == 1
+with sqlite3.connect(path) as reader:
+    assert reader.execute("SELECT COUNT(*) FROM artifacts WHERE artifact_id = 'idle_report'").fetchone()[0] == 1
+idle.close()
+
+# put_many commits at once and starts the background flusher. A failed put_many takes
+# only its own rows back out (and raises); rows buffered by put() stay for the flusher.
+class BrokenConnection:
+    def __init__(self, conn):
+        self.conn = conn
+        self.broken = True
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+    def executemany(self, *args):
+        if self.broken:
+            raise sqlite3.OperationalError("database is locked")
+        return self.conn.executemany(*args)
+
+batched = NexusStore(batch_size=100, flush_interval=60.0)
+batched.put("buffered", {"n": 1})
+batched._conn = BrokenConnection(batched._conn)
+try:
+    batched.put_many([("batch_a", {"n": 2}), ("batch_b", {"n": 3})])
+    raise AssertionError("expected OperationalError")
+except sqlite3.OperationalError:
+    pass
+assert batched.stats()["pending"] == 1 and batched.get("batch_a") is None and batched._flusher is not None
+batched._conn.broken = False
+assert batched.flush() == 1 and batched["buffered"] == {"n": 1}
+batched.close()
+
+many_only = NexusStore(flush_interval=60.0)
+many_only.put_many({"only_many": {"n": 4}})
+assert many_only.stats()["pending"] == 0 and many_only._flusher is not None
+many_only.close()
+
+nexus = PrometheusNexus(path)
+nexus.integrate_artifact("risk_report", {"confidence": 0.42})
+assert nexus.repository.latest_version("risk_report") == 4
+
+print("Nexus Store Test Complete.")
@@ -0,0 +1,40 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for overlapping /analyze_query requests (request-scoped context, atomic DRA budget)
+import asyncio
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+from orchestrator.search_cache import SearchCache
+
+async def overlapping_requests(count):
+    payloads = [orchestrator.QueryPayload(query_text=f"query {i}") for i in range(count)]
+    return await asyncio.gather(*(orchestrator.analyze_query(p) for p in payloads))
+
+orchestrator.state.budget = DRABudget(25, refill_rate=0)   # Enough for every Phase II search but only two void repairs
+orchestrator.state.search_cache = SearchCache(ttl=0, negative_ttl=0)  # Every request raises the same void: pay for each
+responses = asyncio.run(overlapping_requests(4))
+
+for i, response in enumerate(responses):
+    log = response["orchestration_log"]
+    assert log[1]["P II"] == f"Emily executing search strategy for: 'query {i}'"
+    assert sum(1 for entry in log if "P IX SUCCESS" in entry) == 1
+
+repairs_paid = sum(1 for r in responses for entry in r["orchestration_log"] if "P VII GOV CHECK" in entry)
+print(f"Final T-Value: {orchestrator.state.budget.t_value}, repairs paid for: {repairs_paid}")
+assert repairs_paid == 2 and orchestrator.state.budget.t_value == 25 - 4 - 20
+assert orchestrator.state.active_requests == 0
+
+print("Orchestrator Concurrency Test Complete.")
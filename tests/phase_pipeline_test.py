@@ -0,0 +1,62 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the Phase Pipeline Engine
+import asyncio
+import time
+from orchestrator.phase_pipeline import PhasePipeline
+
+async def fast_phase(ctx):
+    ctx["trace"].append("fast")
+
+async def slow_phase(ctx):
+    await asyncio.sleep(0.05)
+    ctx["trace"].append("slow")
+    if ctx["id"] == "abort":
+        return {"Result": "ABORTED"}
+    if ctx["id"] == "boom":
+        raise ValueError("phase failure")
+
+async def final_phase(ctx):
+    return {"id": ctx["id"], "trace": ctx["trace"]}
+
+async def run():
+    pipeline = PhasePipeline([("fast", fast_phase, 1), ("slow", slow_phase, 8), ("final", final_phase, 1)],
+                             queue_size=2)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(pipeline.submit({"id": i, "trace": []}) for i in range(16)))
+    elapsed = time.perf_counter() - start
+    assert [r["id"] for r in results] == list(range(16))
+    assert results[0]["trace"] == ["fast", "slow"]
+    # 16 requests through an 8-worker slow stage overlap instead of taking 16 x 50 ms.
+    print(f"16 requests in {elapsed:.2f}s")
+    assert elapsed < 0.4
+
+    assert await pipeline.submit({"id": "abort", "trace": []}) == {"Result": "ABORTED"}
+    try:
+        await pipeline.submit({"id": "boom", "trace": []})
+        raise AssertionError("expected the phase error to reach the caller")
+    except ValueError:
+        pass
+
+    stats = pipeline.stats()
+    print(stats)
+    assert stats["slow"]["processed"] == 17 and stats["slow"]["failed"] == 1
+    assert stats["final"]["processed"] == 16
+    assert stats["fast"]["max_queue_depth"] <= 2      # Bounded queues enforce backpressure
+    await pipeline.stop()
+
+asyncio.run(run())
+print("Phase Pipeline Test Complete.")
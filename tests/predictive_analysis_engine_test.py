@@ -0,0 +1,36 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the vectorized Monte Carlo Predictive Analysis Engine
+import numpy as np
+from fugue.predictive_analysis_engine import PredictiveAnalysisEngine
+
+pae = PredictiveAnalysisEngine(base_hazard=0.15, hazard_concentration=20.0)
+result = pae.simulate(horizons=[1, 3, 10], trajectories=200_000, seed=7)
+print(result)
+
+# Same seed, same answer; failure probability only grows with the horizon.
+again = pae.simulate(horizons=[1, 3, 10], trajectories=200_000, seed=7)
+assert np.array_equal(result["mean"], again["mean"])
+assert np.all(np.diff(result["mean"]) > 0)
+
+# P(fail by h) = 1 - E[(1 - p)^h] with p ~ Beta(3, 17): closed form for h = 1 is the mean hazard.
+assert result["ci_low"][0] <= 0.15 <= result["ci_high"][0]
+assert np.all(result["ci_low"] < result["mean"]) and np.all(result["mean"] < result["ci_high"])
+
+vectors = pae.calculate_vectors()
+assert list(vectors) == ["T+3", "T+5", "T+10"] and all(0.0 < v < 1.0 for v in vectors.values())
+
+print("Predictive Analysis Engine Test Complete.")
@@ -0,0 +1,111 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the /analyze_query result cache (singleflight coalescing, LRU + TTL, bypass)
+import asyncio
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+from orchestrator.result_cache import ResultCache, SOURCE_CACHE, SOURCE_COALESCED, SOURCE_FRESH
+from orchestrator.search_cache import SearchCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+async def unit_checks():
+    clock = FakeClock()
+    cache = ResultCache(max_entries=2, ttl=10.0, clock=clock)
+    runs = []
+
+    async def compute(value):
+        runs.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    # Ten concurrent identical calls: one run, nine coalesced.
+    outcomes = await asyncio.gather(*(cache.get_or_run("a", lambda: compute("A")) for _ in range(10)))
+    assert runs == ["A"] and all(result == "A" for result, _ in outcomes)
+    assert sorted(source for _, source in outcomes) == [SOURCE_COALESCED] * 9 + [SOURCE_FRESH]
+    assert await cache.get_or_run("a", lambda: compute("A2")) == ("A", SOURCE_CACHE)
+
+    # Bypass runs afresh and refreshes the entry.
+    assert await cache.get_or_run("a", lambda: compute("A2"), bypass=True) == ("A2", SOURCE_FRESH)
+    assert cache.get("a") == "A2"
+
+    # TTL expiry and LRU eviction.
+    clock.now = 11.0
+    assert cache.get("a") is None
+    for key in ("b", "c", "d"):
+        await cache.get_or_run(key, lambda: compute(key.upper()))
+    assert cache.get("b") is None and cache.get("d") == "D" and cache.stats()["evictions"] == 1
+
+    # Failures reach every coalesced caller and are not cached.
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    outcomes = await asyncio.gather(*(cache.get_or_run("e", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes) and cache.get("e") is None
+
+    # One caller leaving does not cancel the shared run; the last one leaving does.
+    started = asyncio.Event()
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "slow"
+    leaver = asyncio.ensure_future(cache.get_or_run("f", slow))
+    stayer = asyncio.ensure_future(cache.get_or_run("f", slow))
+    await started.wait()
+    leaver.cancel()
+    assert await stayer == ("slow", SOURCE_COALESCED)
+    lone = asyncio.ensure_future(cache.get_or_run("g", slow))
+    await asyncio.sleep(0.01)
+    lone.cancel()
+    await asyncio.sleep(0.06)
+    assert cache.get("g") is None and cache.stats()["in_flight"] == 0
+    print(f"Unit stats: {cache.stats()}")
+
+async def orchestrator_checks():
+    orchestrator.state.budget = DRABudget(1000, refill_rate=0)
+    orchestrator.state.search_cache = SearchCache(ttl=0, negative_ttl=0)  # Every fresh run pays for its micro-search
+    budget_before = orchestrator.state.budget.t_value
+    payloads = [orchestrator.QueryPayload(query_text=text) for text in ["Popular query", "popular   QUERY"] * 6]
+    responses = await asyncio.gather(*(orchestrator.analyze_query(p) for p in payloads))
+    one_run = budget_before - orchestrator.state.budget.t_value
+    assert sum(not r["coalesced"] and not r["cached"] for r in responses) == 1
+    assert [r["query"] for r in responses] == [p.query_text for p in payloads]
+
+    cached = await orchestrator.analyze_query(orchestrator.QueryPayload(query_text="popular query"))
+    assert cached["cached"] and cached["final_report"] == responses[0]["final_report"]
+    assert orchestrator.state.budget.t_value == budget_before - one_run   # Nothing spent again
+
+    # Readings on a cached report are live, not the ones captured when it was computed.
+    orchestrator.state.budget = DRABudget(500, refill_rate=0)
+    cached = await orchestrator.analyze_query(orchestrator.QueryPayload(query_text="popular query"))
+    assert cached["cached"] and cached["final_t_value"] == 500
+
+    # Verbosity is part of the key: a quiet caller gets its own run with no log recorded.
+    quiet = await orchestrator.analyze_query(orchestrator.QueryPayload(query_text="popular query", verbosity=0))
+    assert not quiet["cached"] and quiet["orchestration_log"] == []
+
+    fresh = await orchestrator.analyze_query(orchestrator.QueryPayload(query_text="popular query", bypass_cache=True))
+    assert not fresh["cached"] and not fresh["coalesced"]
+    assert orchestrator.state.budget.t_value < 500 - one_run
+    print(f"One run cost {one_run} T-Value for {len(payloads)} identical queries")
+
+asyncio.run(unit_checks())
+asyncio.run(orchestrator_checks())
+print("Result Cache Test Complete.")
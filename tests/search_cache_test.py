@@ -0,0 +1,105 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for Micro-Search Cache
+import asyncio
+import os
+import tempfile
+from orchestrator import omni_analyst_orchestrator as orchestrator
+from orchestrator.dra_budget import DRABudget
+from orchestrator.search_cache import SearchCache
+from orchestrator.void_repairer import VoidRepairer
+
+now = [1000.0]
+calls = []
+
+def backend(query):
+    calls.append(query)
+    return None if "unknown" in query else "SUCCESS: Stub evidence."
+
+cache = SearchCache(max_entries=2, ttl=100, negative_ttl=10, clock=lambda: now[0])
+search = cache.wrap(backend)
+
+search("Verify or refute: A")
+search("verify   or refute: a")          # Normalized to the same key
+search("Verify or refute: unknown B")    # Negative result, cached briefly
+search("Verify or refute: unknown B")
+assert len(calls) == 2
+
+now[0] += 11                             # Negative entry expires, positive stays
+search("Verify or refute: unknown B")
+search("Verify or refute: A")
+assert len(calls) == 3
+
+search("Verify or refute: C")            # Third key evicts the least recently used
+print(cache.stats())
+assert cache.stats()["evictions"] == 1 and cache.stats()["negative_hits"] == 1
+
+# Disk tier: a fresh cache on the same file starts warm
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "search_cache.sqlite3")
+    first = SearchCache(disk_path=path)
+    first.wrap(backend)("Verify or refute: D")
+    first.close()
+    restarted = SearchCache(disk_path=path)
+    calls.clear()
+    assert restarted.wrap(backend)("Verify or refute: D") == "SUCCESS: Stub evidence."
+    assert calls == [] and restarted.stats()["disk_hits"] == 1
+    restarted.close()
+
+# Disk tier housekeeping: expired rows are purged and the tier is capped
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "search_cache.sqlite3")
+    disk = SearchCache(ttl=100, negative_ttl=10, disk_path=path, max_disk_entries=3, clock=lambda: now[0])
+    for name in "EFGH":
+        disk.put(f"Verify or refute: {name}", "SUCCESS: Stub evidence.")
+        now[0] += 1
+    disk.put("Verify or refute: unknown I", None)
+    now[0] += 11                         # The negative row expires
+    assert disk.purge() == 2             # Expired I, then E (soonest to expire) to get back under the cap
+    assert disk.get("Verify or refute: E", None) == "SUCCESS: Stub evidence."  # Still in the memory tier
+    disk.close()
+    restarted = SearchCache(disk_path=path, clock=lambda: now[0])
+    assert restarted.get("Verify or refute: E", "miss") == "miss"
+    assert restarted.get("Verify or refute: H") == "SUCCESS: Stub evidence."
+    assert disk.stats()["disk_purged"] == 2
+    restarted.close()
+
+# The orchestrator's Phase VII repairs go through state.search_cache
+orchestrator.state.search_cache = SearchCache()
+orchestrator.state.budget = DRABudget(100, refill_rate=0)
+first = asyncio.run(orchestrator.repair_void("Claim Q needs checking."))
+t_value = orchestrator.state.budget.t_value
+second = asyncio.run(orchestrator.repair_void("claim q   needs checking."))
+assert first[1] is False and second == (first[0], True)
+assert orchestrator.state.budget.t_value == t_value   # The cached answer cost nothing
+assert orchestrator.state.search_cache.stats()["hits"] == 1
+
+# A cached negative result is logged as such, never as a paid-for failure.
+orchestrator.state.search_cache.put("Verify or refute: Claim R is doubtful.", None)
+ctx = orchestrator.RequestContext(orchestrator.QueryPayload(query_text="claim r"))
+claim = {"claim": "Claim R is doubtful.", "score": 0.5}
+orchestrator.apply_repair_outcome(ctx, claim, *asyncio.run(orchestrator.repair_void(claim["claim"])))
+failure = [entry["P VII FAIL"] for entry in ctx.log.render() if "P VII FAIL" in entry]
+assert claim["status"] == "UNRESOLVED_VOID_APPENDIX" and len(failure) == 1
+assert "Cached micro-search" in failure[0] and "after expenditure" not in failure[0]
+
+# VoidRepairer shares one cache across requests
+shared = SearchCache()
+for _ in range(3):
+    VoidRepairer(0.7, search_cache=shared).run_verification([{"claim": "130,000 customers"}], [])
+assert shared.stats()["hits"] == 2
+
+print("Search Cache Test Complete.")
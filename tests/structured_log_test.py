@@ -0,0 +1,92 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the structured logging layer
+import json
+import os
+import tempfile
+import threading
+
+from common import structured_log
+from orchestrator.dra_budget import DRABudget
+from common.structured_log import configure_logging, flush_logs, get_logger, writer_stats
+
+path = os.path.join(tempfile.mkdtemp(), "rsp.log")
+log = get_logger("test")
+assert get_logger("test") is log
+
+# JSON lines to a file, formatted by the writer thread.
+configure_logging(level="DEBUG", fmt="json", path=path)
+log.debug("claim_verified", "Claim VERIFIED: '{claim:.10}...' Score: {score}", claim="A" * 40, score=0.95)
+DRABudget(20, refill_rate=0).spend(10, "Phase II Search")
+flush_logs()
+records = [json.loads(line) for line in open(path)]
+assert records[0]["event"] == "claim_verified" and records[0]["msg"] == "Claim VERIFIED: 'AAAAAAAAAA...' Score: 0.95"
+assert records[0]["score"] == 0.95 and records[0]["level"] == "DEBUG"
+assert records[1]["logger"] == "dra_budget" and records[1]["t_value"] == 10.0
+
+# Below the active level nothing is queued, and templates are never formatted.
+class Exploding:
+    def __format__(self, spec):
+        raise AssertionError("formatted while disabled")
+
+configure_logging(level="WARNING")
+emitted = writer_stats()["emitted"]
+log.info("noise", "{value}", value=Exploding())
+log.debug("noise", "{value}", value=Exploding())
+flush_logs()
+assert writer_stats()["emitted"] == emitted and not log.is_enabled(structured_log.INFO)
+
+# A broken template is reported instead of killing the writer.
+log.warning("bad", "{missing}", present=1)
+log.warning("after_bad", "still logging")
+flush_logs()
+lines = open(path).read().splitlines()
+assert "unformattable" in lines[-2] and json.loads(lines[-1])["event"] == "after_bad"
+
+# Text format to stdout, one batch per drain.
+configure_logging(level="INFO", fmt="text", path="")
+for i in range(3):
+    log.info("progress", "Logged line {i}", i=i)
+flush_logs()
+
+# A stalled writer makes new records drop (and get counted) once the queue is full.
+burst_path = os.path.join(tempfile.mkdtemp(), "burst.log")
+configure_logging(fmt="json", path=burst_path)
+release = threading.Event()
+write = structured_log._writer._write
+structured_log._writer._write = lambda records: (release.wait(), write(records))
+dropped = writer_stats()["dropped"]
+burst = structured_log._writer.maxsize + structured_log.MAX_BATCH + 100
+for i in range(burst):
+    log.info("burst", "Burst line {i}", i=i)
+dropped = writer_stats()["dropped"] - dropped
+assert dropped >= 100
+release.set()
+flush_logs()
+structured_log._writer._write = write
+records = [json.loads(line) for line in open(burst_path)]
+# The writer reports the drops with its next batch.
+assert [r["dropped"] for r in records if r["event"] == "records_dropped"] == [dropped]
+assert sum(1 for r in records if r["event"] == "burst") == burst - dropped
+configure_logging(fmt="text", path="")
+
+try:
+    configure_logging(level="LOUD")
+    raise AssertionError("expected ValueError")
+except ValueError:
+    pass
+
+print("Structured Log Test Complete.")
@@ -0,0 +1,77 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for concurrent Void Repairer (Phase VII async path)
+import asyncio
+import time
+from orchestrator.void_repairer import VoidRepairer
+
+async def slow_backend(prompt):
+    await asyncio.sleep(0.05)
+    if "hang" in prompt:
+        await asyncio.sleep(10)
+    if "refute" in prompt and "unknown" not in prompt:
+        return "SUCCESS: Stub corroboration."
+    return None
+
+def make_claims():
+    return [{"claim": f"They served 130,000 customers (claim {i})"} for i in range(20)] + [
+        {"claim": "Fact with unknown provenance 130,000 customers"},
+        {"claim": "Claim that will hang 130,000 customers"},
+        {"claim": "Well-cited general claim"},
+    ]
+
+repairer = VoidRepairer(0.7, search_backend=slow_backend)
+start = time.perf_counter()
+final_data = asyncio.run(repairer.run_verification_async(make_claims(), ["source A"], max_concurrency=32, timeout=0.5))
+elapsed = time.perf_counter() - start
+print(f"Async repair of 22 voids took {elapsed:.2f}s")
+assert elapsed < 2.0
+assert len(final_data) == 21
+assert [c["status"] for c in final_data[:20]] == ["REPAIRED"] * 20
+assert final_data[-1]["status"] == "VERIFIED"
+
+# Same outcomes as the sequential path
+sync_claims = VoidRepairer(0.7).run_verification(make_claims()[:-2] + make_claims()[-1:], [])
+async_claims = asyncio.run(VoidRepairer(0.7).run_verification_async(make_claims()[:-2] + make_claims()[-1:], []))
+assert [c["status"] for c in sync_claims] == [c["status"] for c in async_claims]
+
+# Cancelling the run cancels pending micro-searches
+async def cancel_midway():
+    task = asyncio.ensure_future(VoidRepairer(0.7, search_backend=slow_backend).run_void_repair_async(
+        [{"claim": "hang", "status": "VOID_FLAG_INCONSISTENCY"}] * 4, timeout=None))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        return True
+    return False
+
+assert asyncio.run(cancel_midway())
+
+# One backend error fails only its own claim; the rest of the batch is still repaired.
+async def flaky_backend(prompt):
+    await asyncio.sleep(0.01)
+    if "broken" in prompt:
+        raise ConnectionError("search backend unreachable")
+    return "SUCCESS: Stub corroboration."
+
+flaky_claims = [{"claim": f"claim {i}", "status": "VOID_FLAG_INCONSISTENCY"} for i in range(5)]
+flaky_claims[2]["claim"] = "broken claim"
+repaired = asyncio.run(VoidRepairer(0.7, search_backend=flaky_backend).run_void_repair_async(flaky_claims))
+assert len(repaired) == 4 and "broken claim" not in [c["claim"] for c in repaired]
+assert flaky_claims[2]["status"] == "UNRELIABLE_VOID" and "ConnectionError" in flaky_claims[2]["repair_notes"]
+print("Async Void Repairer Test Complete.")
@@ -0,0 +1,98 @@
+# Copyright 2026 Samuel Jackson Grim
+# Architect of Resonance
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Test for the Phase IX write-behind persistence queue
+import asyncio
+import sqlite3
+import time
+
+from orchestrator.write_behind import WriteBehindQueue
+from prometheus.nexus_store import NexusStore
+
+class SlowStore(NexusStore):
+    # Every commit takes 20ms, like a busy disk.
+    def put_many(self, artifacts):
+        time.sleep(0.02)
+        super().put_many(artifacts)
+
+async def main():
+    store = SlowStore()
+    queue = WriteBehindQueue(store, max_pending=64, batch_size=16, flush_interval=0.01)
+
+    # Enqueueing does not wait for the disk.
+    started = time.perf_counter()
+    for i in range(32):
+        await queue.put(f"report_{i % 4}", {"i": i})
+    enqueue_seconds = time.perf_counter() - started
+    assert enqueue_seconds < 0.02, enqueue_seconds
+    await queue.flush()
+    stats = queue.stats()
+    assert stats["written"] == 32 and stats["batches"] == 2 and stats["queue_depth"] == 0
+    assert stats["max_flush_seconds"] >= 0.02
+    # Repeated ids inside one batch become successive versions.
+    assert store.versions("report_0") == list(range(1, 9)) and store["report_3"] == {"i": 31}
+
+    # A full queue makes put() wait instead of growing without bound.
+    for i in range(200):
+        await queue.put("burst", {"i": i})
+    stats = queue.stats()
+    assert stats["max_queue_depth"] <= 64 and stats["backpressure_waits"] > 0
+    print(f"Burst: max depth {stats['max_queue_depth']}, backpressure waits {stats['backpressure_waits']}")
+
+    # Graceful shutdown flushes whatever is still queued.
+    for i in range(10):
+        await queue.put("tail", {"i": i})
+    await queue.stop()
+    assert store.latest_version("tail") == 10 and store.latest_version("burst") == 200
+    return store, queue
+
+store, queue = asyncio.run(main())
+
+# Artifacts queued on a loop that went away are written before a new loop starts flushing.
+async def enqueue_only():
+    await queue.put("orphan", {"ok": True})
+asyncio.run(enqueue_only())
+async def later():
+    await queue.put("next", {"ok": True})
+    await queue.stop()
+asyncio.run(later())
+assert store["orphan"] == {"ok": True} and store["next"] == {"ok": True}
+
+# A failed commit is counted once and really is lost: the store does not keep the rows
+# and commit them later behind the queue's back.
+class FailingConnection:
+    def __init__(self, conn):
+        self.conn = conn
+        self.broken = True
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+    def executemany(self, *args):
+        if self.broken:
+            raise sqlite3.OperationalError("disk I/O error")
+        return self.conn.executemany(*args)
+
+flaky = NexusStore()
+flaky._conn = FailingConnection(flaky._conn)
+failing = WriteBehindQueue(flaky, batch_size=4, flush_interval=0.01)
+async def lost():
+    for i in range(3):
+        await failing.put("lost", {"i": i})
+    await failing.flush()
+asyncio.run(lost())
+assert failing.stats()["failed"] == 3 and failing.stats()["written"] == 0
+flaky._conn.broken = False
+assert flaky.flush() == 0 and flaky.latest_version("lost") is None
+
+print("Write-Behind Test Complete.")